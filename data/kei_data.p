@@ -1,2870 +0,0 @@
-(lp0
-(lp1
-cdatetime
-date
-p2
-(S'\x07\xd7\x07\x10'
-p3
-tp4
-Rp5
-aS'394'
-p6
-aI130
-aa(lp7
-g2
-(S'\x07\xd7\x07\x17'
-p8
-tp9
-Rp10
-aS'373'
-p11
-aI246
-aa(lp12
-g2
-(S'\x07\xd7\x07\x17'
-p13
-tp14
-Rp15
-aS'373'
-p16
-aI138
-aa(lp17
-g2
-(S'\x07\xd7\x07\x17'
-p18
-tp19
-Rp20
-aS'373'
-p21
-aI120
-aa(lp22
-g2
-(S'\x07\xd7\x07\x1d'
-p23
-tp24
-Rp25
-aS'276'
-p26
-aI159
-aa(lp27
-g2
-(S'\x07\xd7\x07\x1d'
-p28
-tp29
-Rp30
-aS'276'
-p31
-aI113
-aa(lp32
-g2
-(S'\x07\xd7\t\n'
-p33
-tp34
-Rp35
-aS'257'
-p36
-aI199
-aa(lp37
-g2
-(S'\x07\xd7\n\x01'
-p38
-tp39
-Rp40
-aS'253'
-p41
-aI305
-aa(lp42
-g2
-(S'\x07\xd8\x02\x0b'
-p43
-tp44
-Rp45
-aS'244'
-p46
-aI318
-aa(lp47
-g2
-(S'\x07\xd8\x02\x0b'
-p48
-tp49
-Rp50
-aS'244'
-p51
-aI133
-aa(lp52
-g2
-(S'\x07\xd8\x02\x0b'
-p53
-tp54
-Rp55
-aS'244'
-p56
-aI133
-aa(lp57
-g2
-(S'\x07\xd8\x02\x0b'
-p58
-tp59
-Rp60
-aS'244'
-p61
-aI117
-aa(lp62
-g2
-(S'\x07\xd8\x02\x0b'
-p63
-tp64
-Rp65
-aS'244'
-p66
-aI116
-aa(lp67
-g2
-(S'\x07\xd8\x02\x12'
-p68
-tp69
-Rp70
-aS'131'
-p71
-aI100
-aa(lp72
-g2
-(S'\x07\xd8\x02\x12'
-p73
-tp74
-Rp75
-aS'131'
-p76
-aI94
-aa(lp77
-g2
-(S'\x07\xd8\x03\r'
-p78
-tp79
-Rp80
-aS'126'
-p81
-aI97
-aa(lp82
-g2
-(S'\x07\xd8\x03\x1b'
-p83
-tp84
-Rp85
-aS'120'
-p86
-aI110
-aa(lp87
-g2
-(S'\x07\xd8\x04\x0e'
-p88
-tp89
-Rp90
-aS'116'
-p91
-aI126
-aa(lp92
-g2
-(S'\x07\xd8\x06\t'
-p93
-tp94
-Rp95
-aS'113'
-p96
-aI130
-aa(lp97
-g2
-(S'\x07\xd8\x06\t'
-p98
-tp99
-Rp100
-aS'113'
-p101
-aI122
-aa(lp102
-g2
-(S'\x07\xd8\x06\t'
-p103
-tp104
-Rp105
-aS'113'
-p106
-aI114
-aa(lp107
-g2
-(S'\x07\xd8\x06\x10'
-p108
-tp109
-Rp110
-aS'105'
-p111
-aI98
-aa(lp112
-g2
-(S'\x07\xd8\x06\x17'
-p113
-tp114
-Rp115
-aS'103'
-p116
-aI106
-aa(lp117
-g2
-(S'\x07\xd8\x08\x0b'
-p118
-tp119
-Rp120
-aS'124'
-p121
-aI112
-aa(lp122
-g2
-(S'\x07\xd8\x08\x19'
-p123
-tp124
-Rp125
-aS'126'
-p126
-aI121
-aa(lp127
-g2
-(S'\x07\xd8\x08\x19'
-p128
-tp129
-Rp130
-aS'126'
-p131
-aI109
-aa(lp132
-g2
-(S'\x07\xd8\x08\x19'
-p133
-tp134
-Rp135
-aS'126'
-p136
-aI95
-aa(lp137
-g2
-(S'\x07\xd8\x08\x19'
-p138
-tp139
-Rp140
-aS'126'
-p141
-aI89
-aa(lp142
-g2
-(S'\x07\xd8\t\x1d'
-p143
-tp144
-Rp145
-aS'84'
-p146
-aI95
-aa(lp147
-g2
-(S'\x07\xd8\t\x1d'
-p148
-tp149
-Rp150
-aS'84'
-p151
-aI90
-aa(lp152
-g2
-(S'\x07\xd8\t\x1d'
-p153
-tp154
-Rp155
-aS'84'
-p156
-aI85
-aa(lp157
-g2
-(S'\x07\xd8\n\x06'
-p158
-tp159
-Rp160
-aS'77'
-p161
-aI97
-aa(lp162
-g2
-(S'\x07\xd8\n\x06'
-p163
-tp164
-Rp165
-aS'77'
-p166
-aI95
-aa(lp167
-g2
-(S'\x07\xd8\n\x06'
-p168
-tp169
-Rp170
-aS'77'
-p171
-aI92
-aa(lp172
-g2
-(S'\x07\xd9\x01\x04'
-p173
-tp174
-Rp175
-aS'61'
-p176
-aI103
-aa(lp177
-g2
-(S'\x07\xd9\x01\x04'
-p178
-tp179
-Rp180
-aS'61'
-p181
-aI89
-aa(lp182
-g2
-(S'\x07\xd9\x01\x04'
-p183
-tp184
-Rp185
-aS'61'
-p186
-aI82
-aa(lp187
-g2
-(S'\x07\xd9\x01\x0c'
-p188
-tp189
-Rp190
-aS'59'
-p191
-aI84
-aa(lp192
-g2
-(S'\x07\xd9\x01\x13'
-p193
-tp194
-Rp195
-aS'59'
-p196
-aI86
-aa(lp197
-g2
-(S'\x07\xd9\x02\t'
-p198
-tp199
-Rp200
-aS'56'
-p201
-aI94
-aa(lp202
-g2
-(S'\x07\xd9\x02\t'
-p203
-tp204
-Rp205
-aS'56'
-p206
-aI89
-aa(lp207
-g2
-(S'\x07\xd9\x02\x10'
-p208
-tp209
-Rp210
-aS'90'
-p211
-aI93
-aa(lp212
-g2
-(S'\x07\xd9\x03\x0c'
-p213
-tp214
-Rp215
-aS'94'
-p216
-aI101
-aa(lp217
-g2
-(S'\x07\xda\x02\x16'
-p218
-tp219
-Rp220
-aS'898'
-p221
-aI117
-aa(lp222
-g2
-(S'\x07\xda\x05\x18'
-p223
-tp224
-Rp225
-aS'246'
-p226
-aI121
-aa(lp227
-g2
-(S'\x07\xda\x05\x18'
-p228
-tp229
-Rp230
-aS'246'
-p231
-aI115
-aa(lp232
-g2
-(S'\x07\xda\x06\x07'
-p233
-tp234
-Rp235
-aS'201'
-p236
-aI112
-aa(lp237
-g2
-(S'\x07\xda\x06\r'
-p238
-tp239
-Rp240
-aS'204'
-p241
-aI118
-aa(lp242
-g2
-(S'\x07\xda\x06\x15'
-p243
-tp244
-Rp245
-aS'189'
-p246
-aI127
-aa(lp247
-g2
-(S'\x07\xda\x08\x01'
-p248
-tp249
-Rp250
-aS'196'
-p251
-aI124
-aa(lp252
-g2
-(S'\x07\xda\x08\x1e'
-p253
-tp254
-Rp255
-aS'147'
-p256
-aI150
-aa(lp257
-g2
-(S'\x07\xda\x08\x1e'
-p258
-tp259
-Rp260
-aS'147'
-p261
-aI125
-aa(lp262
-g2
-(S'\x07\xda\x08\x1e'
-p263
-tp264
-Rp265
-aS'147'
-p266
-aI117
-aa(lp267
-g2
-(S'\x07\xda\t\x1b'
-p268
-tp269
-Rp270
-aS'123'
-p271
-aI142
-aa(lp272
-g2
-(S'\x07\xda\n\x04'
-p273
-tp274
-Rp275
-aS'121'
-p276
-aI317
-aa(lp277
-g2
-(S'\x07\xdb\x01\x03'
-p278
-tp279
-Rp280
-aS'98'
-p281
-aI457
-aa(lp282
-g2
-(S'\x07\xdb\x01\x03'
-p283
-tp284
-Rp285
-aS'98'
-p286
-aI335
-aa(lp287
-g2
-(S'\x07\xdb\x01\x03'
-p288
-tp289
-Rp290
-aS'98'
-p291
-aI211
-aa(lp292
-g2
-(S'\x07\xdb\x01\x11'
-p293
-tp294
-Rp295
-aS'82'
-p296
-aI262
-aa(lp297
-g2
-(S'\x07\xdb\x01\x11'
-p298
-tp299
-Rp300
-aS'82'
-p301
-aI199
-aa(lp302
-g2
-(S'\x07\xdb\x01\x11'
-p303
-tp304
-Rp305
-aS'82'
-p306
-aI161
-aa(lp307
-g2
-(S'\x07\xdb\x02\x07'
-p308
-tp309
-Rp310
-aS'72'
-p311
-aI177
-aa(lp312
-g2
-(S'\x07\xdb\x02\x07'
-p313
-tp314
-Rp315
-aS'72'
-p316
-aI141
-aa(lp317
-g2
-(S'\x07\xdb\x02\x15'
-p318
-tp319
-Rp320
-aS'66'
-p321
-aI162
-aa(lp322
-g2
-(S'\x07\xdb\x02\x15'
-p323
-tp324
-Rp325
-aS'66'
-p326
-aI143
-aa(lp327
-g2
-(S'\x07\xdb\x02\x15'
-p328
-tp329
-Rp330
-aS'66'
-p331
-aI125
-aa(lp332
-g2
-(S'\x07\xdb\x02\x15'
-p333
-tp334
-Rp335
-aS'66'
-p336
-aI122
-aa(lp337
-g2
-(S'\x07\xdb\x03\n'
-p338
-tp339
-Rp340
-aS'63'
-p341
-aI128
-aa(lp342
-g2
-(S'\x07\xdb\x03\x17'
-p343
-tp344
-Rp345
-aS'62'
-p346
-aI129
-aa(lp347
-g2
-(S'\x07\xdb\x03\x17'
-p348
-tp349
-Rp350
-aS'62'
-p351
-aI120
-aa(lp352
-g2
-(S'\x07\xdb\x04\x04'
-p353
-tp354
-Rp355
-aS'61'
-p356
-aI114
-aa(lp357
-g2
-(S'\x07\xdb\x04\x04'
-p358
-tp359
-Rp360
-aS'61'
-p361
-aI106
-aa(lp362
-g2
-(S'\x07\xdb\x04\x04'
-p363
-tp364
-Rp365
-aS'61'
-p366
-aI102
-aa(lp367
-g2
-(S'\x07\xdb\x04\x04'
-p368
-tp369
-Rp370
-aS'61'
-p371
-aI90
-aa(lp372
-g2
-(S'\x07\xdb\x04\x04'
-p373
-tp374
-Rp375
-aS'61'
-p376
-aI86
-aa(lp377
-g2
-(S'\x07\xdb\x04\x12'
-p378
-tp379
-Rp380
-aS'48'
-p381
-aI87
-aa(lp382
-g2
-(S'\x07\xdb\x04\x12'
-p383
-tp384
-Rp385
-aS'48'
-p386
-aI75
-aa(lp387
-g2
-(S'\x07\xdb\x04\x12'
-p388
-tp389
-Rp390
-aS'48'
-p391
-aI69
-aa(lp392
-g2
-(S'\x07\xdb\x04\x19'
-p393
-tp394
-Rp395
-aS'47'
-p396
-aI72
-aa(lp397
-g2
-(S'\x07\xdb\x05\x01'
-p398
-tp399
-Rp400
-aS'46'
-p401
-aI72
-aa(lp402
-g2
-(S'\x07\xdb\x05\x16'
-p403
-tp404
-Rp405
-aS'59'
-p406
-aI76
-aa(lp407
-g2
-(S'\x07\xdb\x05\x16'
-p408
-tp409
-Rp410
-aS'59'
-p411
-aI76
-aa(lp412
-g2
-(S'\x07\xdb\x06\x06'
-p413
-tp414
-Rp415
-aS'60'
-p416
-aI76
-aa(lp417
-g2
-(S'\x07\xdb\x06\x0c'
-p418
-tp419
-Rp420
-aS'59'
-p421
-aI79
-aa(lp422
-g2
-(S'\x07\xdb\x06\x0c'
-p423
-tp424
-Rp425
-aS'59'
-p426
-aI76
-aa(lp427
-g2
-(S'\x07\xdb\x06\x0c'
-p428
-tp429
-Rp430
-aS'59'
-p431
-aI74
-aa(lp432
-g2
-(S'\x07\xdb\x06\x0c'
-p433
-tp434
-Rp435
-aS'59'
-p436
-aI69
-aa(lp437
-g2
-(S'\x07\xdb\x06\x14'
-p438
-tp439
-Rp440
-aS'52'
-p441
-aI72
-aa(lp442
-g2
-(S'\x07\xdb\x08\x0e'
-p443
-tp444
-Rp445
-aS'52'
-p446
-aI73
-aa(lp447
-g2
-(S'\x07\xdb\x08\x15'
-p448
-tp449
-Rp450
-aS'48'
-p451
-aI74
-aa(lp452
-g2
-(S'\x07\xdb\x08\x15'
-p453
-tp454
-Rp455
-aS'48'
-p456
-aI77
-aa(lp457
-g2
-(S'\x07\xdb\x08\x15'
-p458
-tp459
-Rp460
-aS'48'
-p461
-aI74
-aa(lp462
-g2
-(S'\x07\xdb\x08\x1d'
-p463
-tp464
-Rp465
-aS'46'
-p466
-aI80
-aa(lp467
-g2
-(S'\x07\xdb\t\x1a'
-p468
-tp469
-Rp470
-aS'54'
-p471
-aI88
-aa(lp472
-g2
-(S'\x07\xdb\t\x1a'
-p473
-tp474
-Rp475
-aS'54'
-p476
-aI86
-aa(lp477
-g2
-(S'\x07\xdb\t\x1a'
-p478
-tp479
-Rp480
-aS'54'
-p481
-aI85
-aa(lp482
-g2
-(S'\x07\xdb\t\x1a'
-p483
-tp484
-Rp485
-aS'54'
-p486
-aI81
-aa(lp487
-g2
-(S'\x07\xdb\n\x03'
-p488
-tp489
-Rp490
-aS'47'
-p491
-aI83
-aa(lp492
-g2
-(S'\x07\xdb\n\t'
-p493
-tp494
-Rp495
-aS'47'
-p496
-aI80
-aa(lp497
-g2
-(S'\x07\xdb\n\t'
-p498
-tp499
-Rp500
-aS'47'
-p501
-aI80
-aa(lp502
-g2
-(S'\x07\xdb\n\t'
-p503
-tp504
-Rp505
-aS'47'
-p506
-aI79
-aa(lp507
-g2
-(S'\x07\xdb\n\t'
-p508
-tp509
-Rp510
-aS'47'
-p511
-aI79
-aa(lp512
-g2
-(S'\x07\xdb\n\t'
-p513
-tp514
-Rp515
-aS'47'
-p516
-aI73
-aa(lp517
-g2
-(S'\x07\xdb\n\x1f'
-p518
-tp519
-Rp520
-aS'32'
-p521
-aI77
-aa(lp522
-g2
-(S'\x07\xdb\n\x1f'
-p523
-tp524
-Rp525
-aS'32'
-p526
-aI69
-aa(lp527
-g2
-(S'\x07\xdb\n\x1f'
-p528
-tp529
-Rp530
-aS'32'
-p531
-aI68
-aa(lp532
-g2
-(S'\x07\xdb\n\x1f'
-p533
-tp534
-Rp535
-aS'32'
-p536
-aI67
-aa(lp537
-g2
-(S'\x07\xdb\n\x1f'
-p538
-tp539
-Rp540
-aS'32'
-p541
-aI64
-aa(lp542
-g2
-(S'\x07\xdb\x0b\x07'
-p543
-tp544
-Rp545
-aS'24'
-p546
-aI66
-aa(lp547
-g2
-(S'\x07\xdc\x01\x01'
-p548
-tp549
-Rp550
-aS'25'
-p551
-aI69
-aa(lp552
-g2
-(S'\x07\xdc\x01\x01'
-p553
-tp554
-Rp555
-aS'25'
-p556
-aI66
-aa(lp557
-g2
-(S'\x07\xdc\x01\x10'
-p558
-tp559
-Rp560
-aS'26'
-p561
-aI71
-aa(lp562
-g2
-(S'\x07\xdc\x01\x10'
-p563
-tp564
-Rp565
-aS'26'
-p566
-aI65
-aa(lp567
-g2
-(S'\x07\xdc\x01\x10'
-p568
-tp569
-Rp570
-aS'26'
-p571
-aI65
-aa(lp572
-g2
-(S'\x07\xdc\x01\x10'
-p573
-tp574
-Rp575
-aS'26'
-p576
-aI64
-aa(lp577
-g2
-(S'\x07\xdc\x01\x10'
-p578
-tp579
-Rp580
-aS'26'
-p581
-aI63
-aa(lp582
-g2
-(S'\x07\xdc\x02\x14'
-p583
-tp584
-Rp585
-aS'17'
-p586
-aI62
-aa(lp587
-g2
-(S'\x07\xdc\x02\x14'
-p588
-tp589
-Rp590
-aS'17'
-p591
-aI61
-aa(lp592
-g2
-(S'\x07\xdc\x02\x14'
-p593
-tp594
-Rp595
-aS'17'
-p596
-aI61
-aa(lp597
-g2
-(S'\x07\xdc\x02\x1b'
-p598
-tp599
-Rp600
-aS'17'
-p601
-aI61
-aa(lp602
-g2
-(S'\x07\xdc\x02\x1b'
-p603
-tp604
-Rp605
-aS'17'
-p606
-aI57
-aa(lp607
-g2
-(S'\x07\xdc\x03\x08'
-p608
-tp609
-Rp610
-aS'17'
-p611
-aI56
-aa(lp612
-g2
-(S'\x07\xdc\x03\x15'
-p613
-tp614
-Rp615
-aS'16'
-p616
-aI57
-aa(lp617
-g2
-(S'\x07\xdc\x03\x15'
-p618
-tp619
-Rp620
-aS'16'
-p621
-aI54
-aa(lp622
-g2
-(S'\x07\xdc\x03\x15'
-p623
-tp624
-Rp625
-aS'16'
-p626
-aI53
-aa(lp627
-g2
-(S'\x07\xdc\x04\x0f'
-p628
-tp629
-Rp630
-aS'17'
-p631
-aI51
-aa(lp632
-g2
-(S'\x07\xdc\x04\x0f'
-p633
-tp634
-Rp635
-aS'17'
-p636
-aI50
-aa(lp637
-g2
-(S'\x07\xdc\x04\x0f'
-p638
-tp639
-Rp640
-aS'17'
-p641
-aI49
-aa(lp642
-g2
-(S'\x07\xdc\x04\x17'
-p643
-tp644
-Rp645
-aS'17'
-p646
-aI47
-aa(lp647
-g2
-(S'\x07\xdc\x04\x17'
-p648
-tp649
-Rp650
-aS'17'
-p651
-aI47
-aa(lp652
-g2
-(S'\x07\xdc\x04\x17'
-p653
-tp654
-Rp655
-aS'17'
-p656
-aI45
-aa(lp657
-g2
-(S'\x07\xdc\x06\x19'
-p658
-tp659
-Rp660
-aS'20'
-p661
-aI48
-aa(lp662
-g2
-(S'\x07\xdc\x06\x19'
-p663
-tp664
-Rp665
-aS'20'
-p666
-aI48
-aa(lp667
-g2
-(S'\x07\xdc\x06\x19'
-p668
-tp669
-Rp670
-aS'20'
-p671
-aI46
-aa(lp672
-g2
-(S'\x07\xdc\x07\t'
-p673
-tp674
-Rp675
-aS'18'
-p676
-aI46
-aa(lp677
-g2
-(S'\x07\xdc\x07\t'
-p678
-tp679
-Rp680
-aS'18'
-p681
-aI46
-aa(lp682
-g2
-(S'\x07\xdc\x07\t'
-p683
-tp684
-Rp685
-aS'18'
-p686
-aI45
-aa(lp687
-g2
-(S'\x07\xdc\x07\x10'
-p688
-tp689
-Rp690
-aS'19'
-p691
-aI47
-aa(lp692
-g2
-(S'\x07\xdc\x07\x10'
-p693
-tp694
-Rp695
-aS'19'
-p696
-aI47
-aa(lp697
-g2
-(S'\x07\xdc\x07\x19'
-p698
-tp699
-Rp700
-aS'18'
-p701
-aI50
-aa(lp702
-g2
-(S'\x07\xdc\x07\x19'
-p703
-tp704
-Rp705
-aS'18'
-p706
-aI50
-aa(lp707
-g2
-(S'\x07\xdc\x07\x19'
-p708
-tp709
-Rp710
-aS'18'
-p711
-aI48
-aa(lp712
-g2
-(S'\x07\xdc\x07\x19'
-p713
-tp714
-Rp715
-aS'18'
-p716
-aI47
-aa(lp717
-g2
-(S'\x07\xdc\x08\x06'
-p718
-tp719
-Rp720
-aS'17'
-p721
-aI48
-aa(lp722
-g2
-(S'\x07\xdc\x08\x0c'
-p723
-tp724
-Rp725
-aS'18'
-p726
-aI48
-aa(lp727
-g2
-(S'\x07\xdc\x08\x0c'
-p728
-tp729
-Rp730
-aS'18'
-p731
-aI43
-aa(lp732
-g2
-(S'\x07\xdc\x08\x0c'
-p733
-tp734
-Rp735
-aS'18'
-p736
-aI45
-aa(lp737
-g2
-(S'\x07\xdc\x08\x1b'
-p738
-tp739
-Rp740
-aS'18'
-p741
-aI47
-aa(lp742
-g2
-(S'\x07\xdc\x08\x1b'
-p743
-tp744
-Rp745
-aS'18'
-p746
-aI45
-aa(lp747
-g2
-(S'\x07\xdc\x08\x1b'
-p748
-tp749
-Rp750
-aS'18'
-p751
-aI39
-aa(lp752
-g2
-(S'\x07\xdc\t\x18'
-p753
-tp754
-Rp755
-aS'17'
-p756
-aI39
-aa(lp757
-g2
-(S'\x07\xdc\t\x18'
-p758
-tp759
-Rp760
-aS'17'
-p761
-aI38
-aa(lp762
-g2
-(S'\x07\xdc\t\x18'
-p763
-tp764
-Rp765
-aS'17'
-p766
-aI38
-aa(lp767
-g2
-(S'\x07\xdc\n\x01'
-p768
-tp769
-Rp770
-aS'17'
-p771
-aI38
-aa(lp772
-g2
-(S'\x07\xdc\n\x01'
-p773
-tp774
-Rp775
-aS'17'
-p776
-aI38
-aa(lp777
-g2
-(S'\x07\xdc\n\x01'
-p778
-tp779
-Rp780
-aS'17'
-p781
-aI36
-aa(lp782
-g2
-(S'\x07\xdc\n\x01'
-p783
-tp784
-Rp785
-aS'17'
-p786
-aI35
-aa(lp787
-g2
-(S'\x07\xdc\n\x01'
-p788
-tp789
-Rp790
-aS'17'
-p791
-aI32
-aa(lp792
-g2
-(S'\x07\xdc\n\x07'
-p793
-tp794
-Rp795
-aS'15'
-p796
-aI31
-aa(lp797
-g2
-(S'\x07\xdc\n\x07'
-p798
-tp799
-Rp800
-aS'15'
-p801
-aI31
-aa(lp802
-g2
-(S'\x07\xdc\n\x1d'
-p803
-tp804
-Rp805
-aS'16'
-p806
-aI32
-aa(lp807
-g2
-(S'\x07\xdc\x0c\x1e'
-p808
-tp809
-Rp810
-aS'19'
-p811
-aI31
-aa(lp812
-g2
-(S'\x07\xdc\x0c\x1e'
-p813
-tp814
-Rp815
-aS'19'
-p816
-aI31
-aa(lp817
-g2
-(S'\x07\xdc\x0c\x1e'
-p818
-tp819
-Rp820
-aS'19'
-p821
-aI30
-aa(lp822
-g2
-(S'\x07\xdc\x0c\x1e'
-p823
-tp824
-Rp825
-aS'19'
-p826
-aI25
-aa(lp827
-g2
-(S'\x07\xdd\x01\x0e'
-p828
-tp829
-Rp830
-aS'18'
-p831
-aI29
-aa(lp832
-g2
-(S'\x07\xdd\x01\x0e'
-p833
-tp834
-Rp835
-aS'18'
-p836
-aI29
-aa(lp837
-g2
-(S'\x07\xdd\x01\x0e'
-p838
-tp839
-Rp840
-aS'18'
-p841
-aI28
-aa(lp842
-g2
-(S'\x07\xdd\x01\x0e'
-p843
-tp844
-Rp845
-aS'18'
-p846
-aI27
-aa(lp847
-g2
-(S'\x07\xdd\x02\x12'
-p848
-tp849
-Rp850
-aS'22'
-p851
-aI28
-aa(lp852
-g2
-(S'\x07\xdd\x02\x12'
-p853
-tp854
-Rp855
-aS'22'
-p856
-aI28
-aa(lp857
-g2
-(S'\x07\xdd\x02\x12'
-p858
-tp859
-Rp860
-aS'22'
-p861
-aI27
-aa(lp862
-g2
-(S'\x07\xdd\x02\x12'
-p863
-tp864
-Rp865
-aS'22'
-p866
-aI25
-aa(lp867
-g2
-(S'\x07\xdd\x02\x12'
-p868
-tp869
-Rp870
-aS'22'
-p871
-aI24
-aa(lp872
-g2
-(S'\x07\xdd\x02\x19'
-p873
-tp874
-Rp875
-aS'16'
-p876
-aI22
-aa(lp877
-g2
-(S'\x07\xdd\x03\x07'
-p878
-tp879
-Rp880
-aS'16'
-p881
-aI23
-aa(lp882
-g2
-(S'\x07\xdd\x03\x07'
-p883
-tp884
-Rp885
-aS'16'
-p886
-aI22
-aa(lp887
-g2
-(S'\x07\xdd\x03\x14'
-p888
-tp889
-Rp890
-aS'15'
-p891
-aI24
-aa(lp892
-g2
-(S'\x07\xdd\x03\x14'
-p893
-tp894
-Rp895
-aS'15'
-p896
-aI24
-aa(lp897
-g2
-(S'\x07\xdd\x03\x14'
-p898
-tp899
-Rp900
-aS'15'
-p901
-aI24
-aa(lp902
-g2
-(S'\x07\xdd\x04\x16'
-p903
-tp904
-Rp905
-aS'15'
-p906
-aI24
-aa(lp907
-g2
-(S'\x07\xdd\x04\x16'
-p908
-tp909
-Rp910
-aS'15'
-p911
-aI22
-aa(lp912
-g2
-(S'\x07\xdd\x05\x05'
-p913
-tp914
-Rp915
-aS'16'
-p916
-aI23
-aa(lp917
-g2
-(S'\x07\xdd\x05\x05'
-p918
-tp919
-Rp920
-aS'16'
-p921
-aI23
-aa(lp922
-g2
-(S'\x07\xdd\x05\x05'
-p923
-tp924
-Rp925
-aS'16'
-p926
-aI23
-aa(lp927
-g2
-(S'\x07\xdd\x05\x05'
-p928
-tp929
-Rp930
-aS'16'
-p931
-aI23
-aa(lp932
-g2
-(S'\x07\xdd\x05\x0c'
-p933
-tp934
-Rp935
-aS'15'
-p936
-aI23
-aa(lp937
-g2
-(S'\x07\xdd\x05\x0c'
-p938
-tp939
-Rp940
-aS'15'
-p941
-aI22
-aa(lp942
-g2
-(S'\x07\xdd\x05\x1b'
-p943
-tp944
-Rp945
-aS'15'
-p946
-aI24
-aa(lp947
-g2
-(S'\x07\xdd\x05\x1b'
-p948
-tp949
-Rp950
-aS'15'
-p951
-aI22
-aa(lp952
-g2
-(S'\x07\xdd\x05\x1b'
-p953
-tp954
-Rp955
-aS'15'
-p956
-aI22
-aa(lp957
-g2
-(S'\x07\xdd\x05\x1b'
-p958
-tp959
-Rp960
-aS'15'
-p961
-aI22
-aa(lp962
-g2
-(S'\x07\xdd\x06\n'
-p963
-tp964
-Rp965
-aS'13'
-p966
-aI23
-aa(lp967
-g2
-(S'\x07\xdd\x06\x18'
-p968
-tp969
-Rp970
-aS'11'
-p971
-aI23
-aa(lp972
-g2
-(S'\x07\xdd\x06\x18'
-p973
-tp974
-Rp975
-aS'11'
-p976
-aI24
-aa(lp977
-g2
-(S'\x07\xdd\x06\x18'
-p978
-tp979
-Rp980
-aS'11'
-p981
-aI23
-aa(lp982
-g2
-(S'\x07\xdd\x07\x1d'
-p983
-tp984
-Rp985
-aS'11'
-p986
-aI24
-aa(lp987
-g2
-(S'\x07\xdd\x07\x1d'
-p988
-tp989
-Rp990
-aS'11'
-p991
-aI23
-aa(lp992
-g2
-(S'\x07\xdd\x08\x05'
-p993
-tp994
-Rp995
-aS'11'
-p996
-aI25
-aa(lp997
-g2
-(S'\x07\xdd\x08\x05'
-p998
-tp999
-Rp1000
-aS'11'
-p1001
-aI24
-aa(lp1002
-g2
-(S'\x07\xdd\x08\x05'
-p1003
-tp1004
-Rp1005
-aS'11'
-p1006
-aI24
-aa(lp1007
-g2
-(S'\x07\xdd\x08\x0b'
-p1008
-tp1009
-Rp1010
-aS'12'
-p1011
-aI23
-aa(lp1012
-g2
-(S'\x07\xdd\x08\x1a'
-p1013
-tp1014
-Rp1015
-aS'12'
-p1016
-aI26
-aa(lp1017
-g2
-(S'\x07\xdd\t\x1e'
-p1018
-tp1019
-Rp1020
-aS'13'
-p1021
-aI28
-aa(lp1022
-g2
-(S'\x07\xdd\t\x1e'
-p1023
-tp1024
-Rp1025
-aS'13'
-p1026
-aI28
-aa(lp1027
-g2
-(S'\x07\xdd\t\x1e'
-p1028
-tp1029
-Rp1030
-aS'13'
-p1031
-aI28
-aa(lp1032
-g2
-(S'\x07\xdd\n\x07'
-p1033
-tp1034
-Rp1035
-aS'18'
-p1036
-aI28
-aa(lp1037
-g2
-(S'\x07\xdd\n\x07'
-p1038
-tp1039
-Rp1040
-aS'18'
-p1041
-aI27
-aa(lp1042
-g2
-(S'\x07\xdd\n\x07'
-p1043
-tp1044
-Rp1045
-aS'18'
-p1046
-aI27
-aa(lp1047
-g2
-(S'\x07\xdd\n\x15'
-p1048
-tp1049
-Rp1050
-aS'18'
-p1051
-aI29
-aa(lp1052
-g2
-(S'\x07\xdd\n\x15'
-p1053
-tp1054
-Rp1055
-aS'18'
-p1056
-aI31
-aa(lp1057
-g2
-(S'\x07\xdd\n\x1c'
-p1058
-tp1059
-Rp1060
-aS'19'
-p1061
-aI31
-aa(lp1062
-g2
-(S'\x07\xdd\n\x1c'
-p1063
-tp1064
-Rp1065
-aS'19'
-p1066
-aI31
-aa(lp1067
-g2
-(S'\x07\xdd\n\x1c'
-p1068
-tp1069
-Rp1070
-aS'19'
-p1071
-aI31
-aa(lp1072
-g2
-(S'\x07\xdd\x0c\x1d'
-p1073
-tp1074
-Rp1075
-aS'17'
-p1076
-aI31
-aa(lp1077
-g2
-(S'\x07\xdd\x0c\x1d'
-p1078
-tp1079
-Rp1080
-aS'17'
-p1081
-aI31
-aa(lp1082
-g2
-(S'\x07\xdd\x0c\x1d'
-p1083
-tp1084
-Rp1085
-aS'17'
-p1086
-aI29
-aa(lp1087
-g2
-(S'\x07\xde\x01\r'
-p1088
-tp1089
-Rp1090
-aS'17'
-p1091
-aI30
-aa(lp1092
-g2
-(S'\x07\xde\x01\r'
-p1093
-tp1094
-Rp1095
-aS'17'
-p1096
-aI29
-aa(lp1097
-g2
-(S'\x07\xde\x01\r'
-p1098
-tp1099
-Rp1100
-aS'17'
-p1101
-aI28
-aa(lp1102
-g2
-(S'\x07\xde\x01\r'
-p1103
-tp1104
-Rp1105
-aS'17'
-p1106
-aI26
-aa(lp1107
-g2
-(S'\x07\xde\x02\n'
-p1108
-tp1109
-Rp1110
-aS'16'
-p1111
-aI25
-aa(lp1112
-g2
-(S'\x07\xde\x02\n'
-p1113
-tp1114
-Rp1115
-aS'16'
-p1116
-aI25
-aa(lp1117
-g2
-(S'\x07\xde\x02\n'
-p1118
-tp1119
-Rp1120
-aS'16'
-p1121
-aI25
-aa(lp1122
-g2
-(S'\x07\xde\x02\n'
-p1123
-tp1124
-Rp1125
-aS'16'
-p1126
-aI22
-aa(lp1127
-g2
-(S'\x07\xde\x02\x11'
-p1128
-tp1129
-Rp1130
-aS'15'
-p1131
-aI23
-aa(lp1132
-g2
-(S'\x07\xde\x02\x11'
-p1133
-tp1134
-Rp1135
-aS'15'
-p1136
-aI23
-aa(lp1137
-g2
-(S'\x07\xde\x03\x06'
-p1138
-tp1139
-Rp1140
-aS'21'
-p1141
-aI25
-aa(lp1142
-g2
-(S'\x07\xde\x03\x06'
-p1143
-tp1144
-Rp1145
-aS'21'
-p1146
-aI23
-aa(lp1147
-g2
-(S'\x07\xde\x03\x13'
-p1148
-tp1149
-Rp1150
-aS'21'
-p1151
-aI27
-aa(lp1152
-g2
-(S'\x07\xde\x03\x13'
-p1153
-tp1154
-Rp1155
-aS'21'
-p1156
-aI24
-aa(lp1157
-g2
-(S'\x07\xde\x03\x13'
-p1158
-tp1159
-Rp1160
-aS'21'
-p1161
-aI23
-aa(lp1162
-g2
-(S'\x07\xde\x03\x13'
-p1163
-tp1164
-Rp1165
-aS'21'
-p1166
-aI23
-aa(lp1167
-g2
-(S'\x07\xde\x04\x15'
-p1168
-tp1169
-Rp1170
-aS'17'
-p1171
-aI23
-aa(lp1172
-g2
-(S'\x07\xde\x04\x15'
-p1173
-tp1174
-Rp1175
-aS'17'
-p1176
-aI23
-aa(lp1177
-g2
-(S'\x07\xde\x04\x15'
-p1178
-tp1179
-Rp1180
-aS'17'
-p1181
-aI21
-aa(lp1182
-g2
-(S'\x07\xde\x04\x15'
-p1183
-tp1184
-Rp1185
-aS'17'
-p1186
-aI19
-aa(lp1187
-g2
-(S'\x07\xde\x04\x15'
-p1188
-tp1189
-Rp1190
-aS'17'
-p1191
-aI19
-aa(lp1192
-g2
-(S'\x07\xde\x05\x04'
-p1193
-tp1194
-Rp1195
-aS'12'
-p1196
-aI17
-aa(lp1197
-g2
-(S'\x07\xde\x05\x04'
-p1198
-tp1199
-Rp1200
-aS'12'
-p1201
-aI17
-aa(lp1202
-g2
-(S'\x07\xde\x05\x04'
-p1203
-tp1204
-Rp1205
-aS'12'
-p1206
-aI15
-aa(lp1207
-g2
-(S'\x07\xde\x05\x04'
-p1208
-tp1209
-Rp1210
-aS'12'
-p1211
-aI15
-aa(lp1212
-g2
-(S'\x07\xde\x05\x04'
-p1213
-tp1214
-Rp1215
-aS'12'
-p1216
-aI15
-aa(lp1217
-g2
-(S'\x07\xde\x05\x04'
-p1218
-tp1219
-Rp1220
-aS'12'
-p1221
-aI15
-aa(lp1222
-g2
-(S'\x07\xde\x05\x1a'
-p1223
-tp1224
-Rp1225
-aS'10'
-p1226
-aI14
-aa(lp1227
-g2
-(S'\x07\xde\x06\t'
-p1228
-tp1229
-Rp1230
-aS'12'
-p1231
-aI18
-aa(lp1232
-g2
-(S'\x07\xde\x06\t'
-p1233
-tp1234
-Rp1235
-aS'12'
-p1236
-aI18
-aa(lp1237
-g2
-(S'\x07\xde\x06\t'
-p1238
-tp1239
-Rp1240
-aS'12'
-p1241
-aI18
-aa(lp1242
-g2
-(S'\x07\xde\x06\x17'
-p1243
-tp1244
-Rp1245
-aS'12'
-p1246
-aI14
-aa(lp1247
-g2
-(S'\x07\xde\x06\x17'
-p1248
-tp1249
-Rp1250
-aS'12'
-p1251
-aI16
-aa(lp1252
-g2
-(S'\x07\xde\x06\x17'
-p1253
-tp1254
-Rp1255
-aS'12'
-p1256
-aI14
-aa(lp1257
-g2
-(S'\x07\xde\x06\x17'
-p1258
-tp1259
-Rp1260
-aS'12'
-p1261
-aI17
-aa(lp1262
-g2
-(S'\x07\xde\x07\x1c'
-p1263
-tp1264
-Rp1265
-aS'11'
-p1266
-aI17
-aa(lp1267
-g2
-(S'\x07\xde\x07\x1c'
-p1268
-tp1269
-Rp1270
-aS'11'
-p1271
-aI17
-aa(lp1272
-g2
-(S'\x07\xde\x07\x1c'
-p1273
-tp1274
-Rp1275
-aS'11'
-p1276
-aI17
-aa(lp1277
-g2
-(S'\x07\xde\x08\x19'
-p1278
-tp1279
-Rp1280
-aS'11'
-p1281
-aI19
-aa(lp1282
-g2
-(S'\x07\xde\x08\x19'
-p1283
-tp1284
-Rp1285
-aS'11'
-p1286
-aI19
-aa(lp1287
-g2
-(S'\x07\xde\x08\x19'
-p1288
-tp1289
-Rp1290
-aS'11'
-p1291
-aI18
-aa(lp1292
-g2
-(S'\x07\xde\x08\x19'
-p1293
-tp1294
-Rp1295
-aS'11'
-p1296
-aI17
-aa(lp1297
-g2
-(S'\x07\xde\x08\x19'
-p1298
-tp1299
-Rp1300
-aS'11'
-p1301
-aI15
-aa(lp1302
-g2
-(S'\x07\xde\x08\x19'
-p1303
-tp1304
-Rp1305
-aS'11'
-p1306
-aI15
-aa(lp1307
-g2
-(S'\x07\xde\x08\x19'
-p1308
-tp1309
-Rp1310
-aS'11'
-p1311
-aI14
-aa(lp1312
-g2
-(S'\x07\xde\t\x16'
-p1313
-tp1314
-Rp1315
-aS'8'
-p1316
-aI15
-aa(lp1317
-g2
-(S'\x07\xde\t\x16'
-p1318
-tp1319
-Rp1320
-ag1316
-aI15
-aa(lp1321
-g2
-(S'\x07\xde\t\x16'
-p1322
-tp1323
-Rp1324
-ag1316
-aI14
-aa(lp1325
-g2
-(S'\x07\xde\t\x16'
-p1326
-tp1327
-Rp1328
-ag1316
-aI14
-aa(lp1329
-g2
-(S'\x07\xde\t\x1d'
-p1330
-tp1331
-Rp1332
-aS'7'
-p1333
-aI13
-aa(lp1334
-g2
-(S'\x07\xde\t\x1d'
-p1335
-tp1336
-Rp1337
-ag1333
-aI13
-aa(lp1338
-g2
-(S'\x07\xde\t\x1d'
-p1339
-tp1340
-Rp1341
-ag1333
-aI13
-aa(lp1342
-g2
-(S'\x07\xde\t\x1d'
-p1343
-tp1344
-Rp1345
-ag1333
-aI13
-aa(lp1346
-g2
-(S'\x07\xde\t\x1d'
-p1347
-tp1348
-Rp1349
-ag1333
-aI13
-aa(lp1350
-g2
-(S'\x07\xde\n\x05'
-p1351
-tp1352
-Rp1353
-aS'6'
-p1354
-aI13
-aa(lp1355
-g2
-(S'\x07\xde\n\x1b'
-p1356
-tp1357
-Rp1358
-ag1333
-aI14
-aa(lp1359
-g2
-(S'\x07\xde\n\x1b'
-p1360
-tp1361
-Rp1362
-ag1333
-aI13
-aa(lp1363
-g2
-(S'\x07\xde\n\x1b'
-p1364
-tp1365
-Rp1366
-ag1333
-aI13
-aa(lp1367
-g2
-(S'\x07\xde\n\x1b'
-p1368
-tp1369
-Rp1370
-ag1333
-aI13
-aa(lp1371
-g2
-(S'\x07\xde\x0b\t'
-p1372
-tp1373
-Rp1374
-aS'5'
-p1375
-aI13
-aa(lp1376
-g2
-(S'\x07\xde\x0b\t'
-p1377
-tp1378
-Rp1379
-ag1375
-aI13
-aa(lp1380
-g2
-(S'\x07\xde\x0b\t'
-p1381
-tp1382
-Rp1383
-ag1375
-aI13
-aa(lp1384
-g2
-(S'\x07\xde\x0b\t'
-p1385
-tp1386
-Rp1387
-ag1375
-aI12
-aa(lp1388
-g2
-(S'\x07\xdf\x01\x04'
-p1389
-tp1390
-Rp1391
-ag1375
-aI12
-aa(lp1392
-g2
-(S'\x07\xdf\x01\x04'
-p1393
-tp1394
-Rp1395
-ag1375
-aI13
-aa(lp1396
-g2
-(S'\x07\xdf\x01\x04'
-p1397
-tp1398
-Rp1399
-ag1375
-aI11
-aa(lp1400
-g2
-(S'\x07\xdf\x01\x13'
-p1401
-tp1402
-Rp1403
-ag1375
-aI11
-aa(lp1404
-g2
-(S'\x07\xdf\x01\x13'
-p1405
-tp1406
-Rp1407
-ag1375
-aI11
-aa(lp1408
-g2
-(S'\x07\xdf\x01\x13'
-p1409
-tp1410
-Rp1411
-ag1375
-aI11
-aa(lp1412
-g2
-(S'\x07\xdf\x01\x13'
-p1413
-tp1414
-Rp1415
-ag1375
-aI11
-aa(lp1416
-g2
-(S'\x07\xdf\x01\x13'
-p1417
-tp1418
-Rp1419
-ag1375
-aI11
-aa(lp1420
-g2
-(S'\x07\xdf\x02\t'
-p1421
-tp1422
-Rp1423
-ag1375
-aI11
-aa(lp1424
-g2
-(S'\x07\xdf\x02\t'
-p1425
-tp1426
-Rp1427
-ag1375
-aI11
-aa(lp1428
-g2
-(S'\x07\xdf\x02\t'
-p1429
-tp1430
-Rp1431
-ag1375
-aI11
-aa(lp1432
-g2
-(S'\x07\xdf\x02\t'
-p1433
-tp1434
-Rp1435
-ag1375
-aI12
-aa(lp1436
-g2
-(S'\x07\xdf\x02\x17'
-p1437
-tp1438
-Rp1439
-ag1375
-aI11
-aa(lp1440
-g2
-(S'\x07\xdf\x02\x17'
-p1441
-tp1442
-Rp1443
-ag1375
-aI12
-aa(lp1444
-g2
-(S'\x07\xdf\x02\x17'
-p1445
-tp1446
-Rp1447
-ag1375
-aI11
-aa(lp1448
-g2
-(S'\x07\xdf\x02\x17'
-p1449
-tp1450
-Rp1451
-ag1375
-aI11
-aa(lp1452
-g2
-(S'\x07\xdf\x02\x17'
-p1453
-tp1454
-Rp1455
-ag1375
-aI11
-aa(lp1456
-g2
-(S'\x07\xdf\x03\x0c'
-p1457
-tp1458
-Rp1459
-ag1375
-aI11
-aa(lp1460
-g2
-(S'\x07\xdf\x03\x0c'
-p1461
-tp1462
-Rp1463
-ag1375
-aI11
-aa(lp1464
-g2
-(S'\x07\xdf\x03\x0c'
-p1465
-tp1466
-Rp1467
-ag1375
-aI11
-aa(lp1468
-g2
-(S'\x07\xdf\x03\x19'
-p1469
-tp1470
-Rp1471
-ag1375
-aI11
-aa(lp1472
-g2
-(S'\x07\xdf\x03\x19'
-p1473
-tp1474
-Rp1475
-ag1375
-aI11
-aa(lp1476
-g2
-(S'\x07\xdf\x03\x19'
-p1477
-tp1478
-Rp1479
-ag1375
-aI11
-aa(lp1480
-g2
-(S'\x07\xdf\x03\x19'
-p1481
-tp1482
-Rp1483
-ag1375
-aI10
-aa(lp1484
-g2
-(S'\x07\xdf\x04\x14'
-p1485
-tp1486
-Rp1487
-ag1375
-aI11
-aa(lp1488
-g2
-(S'\x07\xdf\x04\x14'
-p1489
-tp1490
-Rp1491
-ag1375
-aI11
-aa(lp1492
-g2
-(S'\x07\xdf\x04\x14'
-p1493
-tp1494
-Rp1495
-ag1375
-aI9
-aa(lp1496
-g2
-(S'\x07\xdf\x04\x14'
-p1497
-tp1498
-Rp1499
-ag1375
-aI9
-aa(lp1500
-g2
-(S'\x07\xdf\x04\x14'
-p1501
-tp1502
-Rp1503
-ag1375
-aI9
-aa(lp1504
-g2
-(S'\x07\xdf\x05\x03'
-p1505
-tp1506
-Rp1507
-ag1375
-aI9
-aa(lp1508
-g2
-(S'\x07\xdf\x05\x03'
-p1509
-tp1510
-Rp1511
-ag1375
-aI9
-aa(lp1512
-g2
-(S'\x07\xdf\x05\x03'
-p1513
-tp1514
-Rp1515
-ag1375
-aI9
-aa(lp1516
-g2
-(S'\x07\xdf\x05\x03'
-p1517
-tp1518
-Rp1519
-ag1375
-aI9
-aa(lp1520
-g2
-(S'\x07\xdf\x05\n'
-p1521
-tp1522
-Rp1523
-ag1354
-aI9
-aa(lp1524
-g2
-(S'\x07\xdf\x05\n'
-p1525
-tp1526
-Rp1527
-ag1354
-aI9
-aa(lp1528
-g2
-(S'\x07\xdf\x05\n'
-p1529
-tp1530
-Rp1531
-ag1354
-aI9
-aa(lp1532
-g2
-(S'\x07\xdf\x05\x18'
-p1533
-tp1534
-Rp1535
-ag1375
-aI9
-aa(lp1536
-g2
-(S'\x07\xdf\x05\x18'
-p1537
-tp1538
-Rp1539
-ag1375
-aI9
-aa(lp1540
-g2
-(S'\x07\xdf\x05\x18'
-p1541
-tp1542
-Rp1543
-ag1375
-aI9
-aa(lp1544
-g2
-(S'\x07\xdf\x05\x18'
-p1545
-tp1546
-Rp1547
-ag1375
-aI9
-aa(lp1548
-g2
-(S'\x07\xdf\x06\x0f'
-p1549
-tp1550
-Rp1551
-ag1375
-aI10
-aa(lp1552
-g2
-(S'\x07\xdf\x06\x0f'
-p1553
-tp1554
-Rp1555
-ag1375
-aI10
-aa(lp1556
-g2
-(S'\x07\xdf\x06\x0f'
-p1557
-tp1558
-Rp1559
-ag1375
-aI10
-aa(lp1560
-g2
-(S'\x07\xdf\x06\x0f'
-p1561
-tp1562
-Rp1563
-ag1375
-aI10
-aa(lp1564
-g2
-(S'\x07\xdf\x06\x1d'
-p1565
-tp1566
-Rp1567
-ag1375
-aI11
-aa.
\ No newline at end of file
@@ -0,0 +1,278 @@
+'''
+Storage backends used by data_tools.
+
+A backend knows how to open a connection to the database and how to write
+the few pieces of SQL that differ between database engines. Everything else
+(queries in handle_data and build_database) is written once and runs on
+every backend.
+
+Backend is chosen in settings.py with variable DATABASE_BACKEND:
+- "mysql" - MySQL server, connection settings in MYSQL_SETTINGS.
+- "sqlite" - embedded SQLite database stored in file SQLITE_PATH.
+'''
+
+__author__ = 'riko'
+
+
+import sqlite3
+
+import settings as stg
+
+
+class Backend(object):
+    '''
+    General storage backend. Other backends are derived from it.
+    '''
+
+    name = None
+    placeholder = None
+    text_type = None
+    id_column = None
+
+    def connect(self):
+        '''
+        Opens new connection to the database.
+
+        :return: DB-API connection.
+        '''
+
+        raise Exception("Implement this function!")
+
+    def is_alive(self, connection):
+        '''
+        Health check of an open connection.
+
+        :param connection: DB-API connection.
+        :return: True if connection can still be used, otherwise False.
+        '''
+
+        try:
+            cursor = connection.cursor()
+            cursor.execute("SELECT 1")
+            cursor.fetchall()
+            cursor.close()
+        except Exception:
+            return False
+
+        return True
+
+    def column_type(self, column_type):
+        '''
+        Translates generic column type used in table definitions to the
+        type used by this backend.
+
+        :param column_type: Generic type, e.g. "TEXT", "INT", "DATE".
+        :return: Type as written in CREATE TABLE statement.
+        '''
+
+        if column_type == "TEXT":
+            return self.text_type
+
+        return column_type
+
+    def create_table(self, cursor, table_name, columns, with_id=False,
+                     temporary=False):
+        '''
+        Creates table.
+
+        :param cursor: Database cursor.
+        :param table_name: Name of the table.
+        :param columns: List of pairs (column name, generic column type).
+        :param with_id: If True, auto increment primary key "id" is appended
+                        as the last column.
+        :param temporary: If True, table is only visible to this connection
+                            and is dropped when connection is closed.
+        :return: void.
+        '''
+
+        definitions = ["%s %s" % (name, self.column_type(column_type))
+                       for name, column_type in columns]
+        if with_id:
+            definitions.append(self.id_column)
+
+        kind = "TEMPORARY TABLE" if temporary else "TABLE"
+        cursor.execute("CREATE %s %s (%s)" % (kind, table_name, ", ".join(definitions)))
+
+    def drop_table(self, cursor, table_name):
+        '''
+        Drops table if it exists.
+
+        :param cursor: Database cursor.
+        :param table_name: Name of the table.
+        :return: void.
+        '''
+
+        cursor.execute("DROP TABLE IF EXISTS %s" % table_name)
+
+    def table_exists(self, cursor, table_name):
+        '''
+        Checks whether table exists.
+
+        :param cursor: Database cursor.
+        :param table_name: Name of the table.
+        :return: True if table exists, otherwise False.
+        '''
+
+        raise Exception("Implement this function!")
+
+    def create_index(self, cursor, table_name, columns):
+        '''
+        Creates index on a table.
+
+        :param cursor: Database cursor.
+        :param table_name: Name of the table.
+        :param columns: Name of indexed column or list of names for
+                        composite index.
+        :return: void.
+        '''
+
+        if isinstance(columns, basestring):
+            columns = [columns]
+
+        cursor.execute("CREATE INDEX idx_%s_%s ON %s (%s)" %
+                       (table_name, "_".join(columns), table_name, ", ".join(columns)))
+
+
+class MySQLBackend(Backend):
+    '''
+    MySQL server backend.
+    '''
+
+    name = "mysql"
+    placeholder = "%s"
+    text_type = "VARCHAR (255)"
+    id_column = "id MEDIUMINT NOT NULL AUTO_INCREMENT PRIMARY KEY"
+
+    def __init__(self, db_data):
+        '''
+        Constructor.
+
+        :param db_data: Dictionary with MySQL connection settings.
+        :return: void.
+        '''
+
+        self.db_data = db_data
+
+    def connect(self):
+        '''
+        Opens new connection to the database and sets UTF8 format.
+
+        :return: DB-API connection.
+        '''
+
+        import MySQLdb
+
+        connection = MySQLdb.connect(**self.db_data)
+        connection.set_character_set('utf8')
+
+        cursor = connection.cursor()
+        cursor.execute('SET NAMES utf8;')
+        cursor.execute('SET CHARACTER SET utf8;')
+        cursor.execute('SET character_set_connection=utf8;')
+        cursor.close()
+
+        return connection
+
+    def is_alive(self, connection):
+        '''
+        Health check of an open connection.
+
+        :param connection: DB-API connection.
+        :return: True if connection can still be used, otherwise False.
+        '''
+
+        try:
+            connection.ping()
+        except Exception:
+            return False
+
+        return True
+
+    def table_exists(self, cursor, table_name):
+        '''
+        Checks whether table exists.
+
+        :param cursor: Database cursor.
+        :param table_name: Name of the table.
+        :return: True if table exists, otherwise False.
+        '''
+
+        cursor.execute("SHOW TABLES LIKE %s", (table_name,))
+        return len(cursor.fetchall()) > 0
+
+
+class SQLiteBackend(Backend):
+    '''
+    Embedded SQLite backend. Whole database lives in a single file, so no
+    database server is needed.
+
+    Text columns are compared case insensitive, same as with default MySQL
+    collation, and DATE columns are returned as datetime.date objects.
+    '''
+
+    name = "sqlite"
+    placeholder = "?"
+    text_type = "TEXT COLLATE NOCASE"
+    id_column = "id INTEGER PRIMARY KEY AUTOINCREMENT"
+
+    def __init__(self, path):
+        '''
+        Constructor.
+
+        :param path: Path to the database file.
+        :return: void.
+        '''
+
+        self.path = path
+
+    def connect(self):
+        '''
+        Opens new connection to the database file. Strings are returned
+        UTF8 encoded, same as with MySQL backend. Connection may be used from
+        other threads, as connection pool makes sure only one thread uses it
+        at a time.
+
+        :return: DB-API connection.
+        '''
+
+        connection = sqlite3.connect(self.path, detect_types=sqlite3.PARSE_DECLTYPES,
+                                     check_same_thread=False)
+        connection.text_factory = str
+
+        return connection
+
+    def table_exists(self, cursor, table_name):
+        '''
+        Checks whether table exists.
+
+        :param cursor: Database cursor.
+        :param table_name: Name of the table.
+        :return: True if table exists, otherwise False.
+        '''
+
+        cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name=?", (table_name,))
+        return len(cursor.fetchall()) > 0
+
+
+def get_backend():
+    '''
+    Returns backend selected in settings.py.
+
+    :return: Backend object.
+    '''
+
+    backend_name = getattr(stg, "DATABASE_BACKEND", "mysql")
+
+    if backend_name == "sqlite":
+        return SQLiteBackend(stg.SQLITE_PATH)
+
+    if backend_name == "mysql":
+        try:
+            db_data = stg.MYSQL_SETTINGS
+        except AttributeError:
+            print "Could not load the database settings! Make sure you set them in settings.py"
+            raise
+
+        return MySQLBackend(db_data)
+
+    raise ValueError("Unknown database backend '%s'!" % backend_name)
@@ -1,6 +1,13 @@
 """
 Script that builds whole database.
 Set database connection information in file: settings.py
+Database can be built on any backend from backends.py (MySQL or SQLite).
+Years are parsed and joined in parallel worker processes, only joined rows
+are written to the database.
+Sizes and hashes of source files are kept in table Manifest. When script is
+run again, only years whose files changed are parsed and replaced, unless
+it is run with argument --full.
+At the end all matches are written into binary store (see match_store.py).
 Read about database structure in docs.
 Data is scrapped from next two sources:
 - http://www.tennis-data.co.uk/alldata.php
@@ -10,37 +17,88 @@ Data is scrapped from next two sources:
 START_YEAR = 2003
 END_YEAR = 2015
 
+# How many rows are sent to the database in one executemany call.
+BATCH_SIZE = 1000
+
+# How many processes parse years in parallel. None means one per CPU.
+PROCESSES = None
+
 
 __author__ = 'riko'
 
 
-import _mysql_exceptions
-import MySQLdb
+import datetime
+import hashlib
+import multiprocessing
+import sys
+import time
+
+import pandas as pd
 import xlrd
 
+import backends
+import match_store
 import settings as stg
 
 
 ################################################################################
-#     Set-up database connection.                                              #
+#     Tables.                                                                  #
 ################################################################################
 
 
-try:
-    db_data = stg.MYSQL_SETTINGS
-except AttributeError:
-    print "Could not load the database settings! Make sure you set them in settings.py"
-    raise
+# Columns parsed from .xls file (tennis_betting).
+ODDS_COLUMNS = ["Location", "Tournament", "Date", "Surface", "Length",
+                "Winner", "Loser", "Winner_points", "Loser_points",
+                "Winner_odds", "Loser_odds"]
+
+# Columns parsed from .csv file (tennis_atp).
+STATS_COLUMNS = ["Tournament", "Surface", "Size", "Level", "Date",
+                 "Winner", "Winner_short", "Winner_hand", "Winner_ioc",
+                 "Winner_rank",
+                 "Loser", "Loser_short", "Loser_hand", "Loser_ioc",
+                 "Loser_rank",
+                 "Score", "Best_of", "Round", "Minutes",
+                 "W_sv", "W_1stIn", "W_ace", "W_1stWon", "W_2ndWon",
+                 "L_sv", "L_1stIn", "L_ace", "L_1stWon", "L_2ndWon"]
+
+# Odds and stats are joined on these columns.
+ODDS_JOIN_KEYS = ["Tournament", "Winner", "Loser"]
+STATS_JOIN_KEYS = ["Tournament", "Winner_short", "Loser_short"]
+
+BASE_COLUMNS = [("Location", "TEXT"), ("Tournament", "TEXT"), ("Level", "TEXT"),
+                ("Surface", "TEXT"), ("Size", "INT"), ("Date", "DATE"),
+                ("Winner", "TEXT"), ("Winner_hand", "TEXT"),
+                ("Winner_ioc", "TEXT"), ("Winner_rank", "TEXT"),
+                ("Loser", "TEXT"), ("Loser_short", "TEXT"),
+                ("Loser_hand", "TEXT"), ("Loser_ioc", "TEXT"),
+                ("Loser_rank", "TEXT"),
+                ("Score", "TEXT"), ("Best_of", "INT"), ("Round", "TEXT"),
+                ("Minutes", "INT"),
+                ("W_sv", "INT"), ("W_1stIn", "INT"), ("W_ace", "INT"),
+                ("W_1stWon", "INT"), ("W_2ndWon", "INT"),
+                ("L_sv", "INT"), ("L_1stIn", "INT"), ("L_ace", "INT"),
+                ("L_1stWon", "INT"), ("L_2ndWon", "INT"),
+                ("Winner_odds", "FLOAT"), ("Loser_odds", "FLOAT")]
+
+BASE_INDEXES = ["Date", "Surface", "Winner", "Loser"]
+
+PLAYERS_COLUMNS = [("Name", "TEXT"), ("Hand", "TEXT"), ("Country", "TEXT")]
+
+TOURNAMENTS_COLUMNS = [("Tournament", "TEXT"), ("Surface", "TEXT"),
+                       ("Size", "INT"), ("Date", "DATE"), ("Best_of", "INT")]
+
+MANIFEST_COLUMNS = [("Year", "INT"), ("Csv_size", "INT"), ("Csv_hash", "TEXT"),
+                    ("Xls_size", "INT"), ("Xls_hash", "TEXT"),
+                    ("First_id", "INT"), ("Last_id", "INT")]
+
+
+################################################################################
+#     Set-up database backend.                                                 #
+################################################################################
 
-# Establish a MySQL connection.
-database = MySQLdb.connect(**db_data)
-database.set_character_set('utf8')
 
-# Get the cursor and set UTF8 format.
-cursor = database.cursor()
-cursor.execute('SET NAMES utf8;')
-cursor.execute('SET CHARACTER SET utf8;')
-cursor.execute('SET character_set_connection=utf8;')
+# Connections are opened in main() and in worker processes, not on import.
+backend = backends.get_backend()
 
 
 ################################################################################
@@ -48,31 +106,82 @@ cursor.execute('SET character_set_connection=utf8;')
 ################################################################################
 
 
-def add_id_to_table(table_name):
+def column_names(columns):
+    '''
+    Comma separated list of column names.
+
+    :param columns: List of pairs (column name, column type).
+    :return: Column names as a string.
+    '''
+
+    return ", ".join(name for name, column_type in columns)
+
+
+def insert_query(table_name, columns):
+    '''
+    Parametrized INSERT query for given table.
+
+    :param table_name: Name of table we insert into.
+    :param columns: List of pairs (column name, column type).
+    :return: Query as a string.
     '''
-    Add Id column to table.
 
-    :param table_name: Name of table we want to add ID to.
+    placeholders = ", ".join([backend.placeholder] * len(columns))
+    return "INSERT INTO %s (%s) VALUES (%s)" % (table_name, column_names(columns), placeholders)
+
+
+def bulk_insert(cursor, table_name, columns, rows):
+    '''
+    Inserts rows into table in batches of BATCH_SIZE rows.
+
+    :param cursor: Database cursor.
+    :param table_name: Name of table we insert into.
+    :param columns: List of pairs (column name, column type).
+    :param rows: List of tuples, one tuple of values per row.
     :return: void.
     '''
 
-    cursor.execute("ALTER TABLE %s ADD id MEDIUMINT NOT NULL AUTO_INCREMENT KEY" % table_name)
-    cursor.execute("ALTER TABLE %s DROP primary key, add primary key(Id)" % table_name)
+    query = insert_query(table_name, columns)
+    for i in xrange(0, len(rows), BATCH_SIZE):
+        cursor.executemany(query, rows[i:i + BATCH_SIZE])
 
 
-def drop_table(table_name):
+def drop_table(cursor, table_name):
     '''
     This function tries to drop table with name 'table_name'.
 
+    :param cursor: Database cursor.
     :param table_name: Name of table we are trying to drop.
     :return: void.
     '''
 
-    query = "DROP TABLE %s" % table_name
-    try:
-        cursor.execute(query)
-    except _mysql_exceptions.OperationalError:
-        print "Table %s doesn't exist yet!" % table_name
+    backend.drop_table(cursor, table_name)
+
+
+def to_int(value):
+    '''
+    Converts value from .csv file to integer. Missing values become NULL.
+
+    :param value: Value as a string.
+    :return: Integer or None.
+    '''
+
+    value = value.strip()
+    if value == "":
+        return None
+
+    return int(float(value))
+
+
+def to_date(value):
+    '''
+    Converts date from .csv file (e.g. 20030106) to datetime.date.
+
+    :param value: Date as a string.
+    :return: Date as datetime.date.
+    '''
+
+    return datetime.datetime.strptime(value.strip(), "%Y%m%d").date()
 
 
 def get_short_name(name):
@@ -99,16 +208,102 @@ def get_short_name(name):
     return begin + end
 
 
+def get_short_names(names):
+    '''
+    Shortened versions of many names. Every distinct name is shortened only
+    once.
+
+    :param names: Iterable of names.
+    :return: Dictionary name -> shortened name.
+    '''
+
+    return dict((name, get_short_name(name)) for name in set(names))
+
+
+def join_key(value):
+    '''
+    Normalizes value of a join column, so that values compare same as they
+    did in case insensitive SQL join.
+
+    :param value: Value from .xls or .csv file.
+    :return: Normalized value as unicode string or None.
+    '''
+
+    if value is None:
+        return None
+
+    if isinstance(value, str):
+        value = value.decode("utf-8", "replace")
+    elif not isinstance(value, unicode):
+        value = unicode(value)
+
+    return value.strip().lower()
+
+
+def join_odds(stats_rows, odds_rows):
+    '''
+    Left joins betting odds to match statistics with a hash join. Each match
+    keeps its position, matches with more than one row of odds are repeated
+    in order of odds rows and matches without odds get None odds.
+
+    :param stats_rows: Rows parsed from .csv file, columns STATS_COLUMNS.
+    :param odds_rows: Rows parsed from .xls file, columns ODDS_COLUMNS.
+    :return: Pair (rows for table Base, number of matches with odds).
+    '''
+
+    stats_keys = [STATS_COLUMNS.index(name) for name in STATS_JOIN_KEYS]
+    odds_keys = [ODDS_COLUMNS.index(name) for name in ODDS_JOIN_KEYS]
+
+    stats = pd.DataFrame([[join_key(row[i]) for i in stats_keys] for row in stats_rows],
+                         columns=ODDS_JOIN_KEYS)
+    stats["Stats_line"] = range(len(stats_rows))
+
+    odds = pd.DataFrame([[join_key(row[i]) for i in odds_keys] for row in odds_rows],
+                        columns=ODDS_JOIN_KEYS)
+    odds["Odds_line"] = range(len(odds_rows))
+    odds = odds.dropna(subset=ODDS_JOIN_KEYS)
+
+    joined = stats.merge(odds, how="left", on=ODDS_JOIN_KEYS, sort=False)
+    joined = joined.sort_values(["Stats_line", "Odds_line"], kind="mergesort")
+
+    stats_columns = [STATS_COLUMNS.index(name) for name, column_type in BASE_COLUMNS[1:-2]]
+    location = ODDS_COLUMNS.index("Location")
+    winner_odds = ODDS_COLUMNS.index("Winner_odds")
+    loser_odds = ODDS_COLUMNS.index("Loser_odds")
+
+    rows = []
+    for stats_line, odds_line in zip(joined["Stats_line"].values, joined["Odds_line"].values):
+        match = stats_rows[stats_line]
+        values = tuple(match[i] for i in stats_columns)
+
+        if odds_line == odds_line:
+            odds_row = odds_rows[int(odds_line)]
+            rows.append((odds_row[location],) + values + (odds_row[winner_odds], odds_row[loser_odds]))
+        else:
+            rows.append((None,) + values + (None, None))
+
+    n_matched = joined["Odds_line"].notnull().groupby(joined["Stats_line"]).any().sum()
+
+    return rows, int(n_matched)
+
+
 def parse_tennis_data(year):
     '''
     Long function that parses two excel files. It first parses each of them
     seperately and then combines them together.
     Very ugly, but no other way than to hard code it.
+    It runs in a worker process and joins the files in memory, so only
+    joined rows are sent back and written to the database.
 
     :param year: Parse one year of data from .xls and .csv files.
-    :return: void.
+    :return: Tuple (year, rows, n_rows, joined, elapsed). rows are rows for
+             table Base in deterministic order, n_rows is number of rows
+             loaded from .xls and .csv files, joined is pair (matches with
+             odds, all matches) and elapsed is time spent in seconds.
     '''
 
+    start = time.time()
+
     # FIRST PART - get data from .xls file.
 
     year = str(year)
@@ -118,28 +313,7 @@ def parse_tennis_data(year):
     book = xlrd.open_workbook(excel_dir)
     sheet = book.sheet_by_name(year)
 
-    query = """
-            CREATE TABLE temp_a
-            (
-            Location VARCHAR (255),
-            Tournament VARCHAR (255),
-            Date INT,
-            Surface VARCHAR (255),
-            Length INT ,
-            Winner VARCHAR (255),
-            Loser VARCHAR (255),
-            Winner_points INT,
-            Loser_points INT,
-            Winner_odds FLOAT,
-            Loser_odds FLOAT
-            );
-            """
-
-    drop_table("temp_a")
-    cursor.execute(query)
-
-    query = """INSERT INTO temp_a (Location, Tournament, Date, Surface, Length, Winner, Loser, Winner_points, Loser_points, Winner_odds, Loser_odds) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)"""
-
+    odds_rows = []
     for r in xrange(1, sheet.nrows):
         location = sheet.cell(r,1).value
         tournament = sheet.cell(r,2).value
@@ -165,198 +339,512 @@ def parse_tennis_data(year):
 
         values = (location, tournament, date, surface, length, winner, loser, winner_points, loser_points, winner_odds, loser_odds)
 
-        cursor.execute(query, values)
+        odds_rows.append(values)
 
     # SECOND PART - get data from .csv file
 
-    query = """
-        CREATE TABLE temp_b
-        (
-        Tournament VARCHAR (255),
-        Surface VARCHAR (255),
-        Size INT,
-        Level VARCHAR (255),
-        Date DATE,
-
-        Winner VARCHAR (255),
-        Winner_short VARCHAR (255),
-        Winner_hand VARCHAR (255),
-        Winner_ioc VARCHAR (255),
-        Winner_rank VARCHAR (255),
-
-        Loser VARCHAR (255),
-        Loser_short VARCHAR (255),
-        Loser_hand VARCHAR (255),
-        Loser_ioc VARCHAR (255),
-        Loser_rank VARCHAR (255),
-
-        Score VARCHAR (255),
-        Best_of INT,
-        Round VARCHAR (255),
-        Minutes INT,
-
-        W_sv INT,
-        W_1stIn INT,
-        W_ace INT,
-        W_1stWon INT,
-        W_2ndWon INT,
-
-        L_sv INT,
-        L_1stIn INT,
-        L_ace INT,
-        L_1stWon INT,
-        L_2ndWon INT
-        );
-        """
-
-    drop_table("temp_b")
+    excel_dir = stg.ROOT_PATH + "data/tennis_atp/atp_matches_" + year + ".csv"
+
+    with open(excel_dir) as f:
+        lines = [line.split(",") for line in f.readlines()[1:]]
+
+    short_names = get_short_names([values[10] for values in lines] + [values[20] for values in lines])
+
+    stats_rows = []
+    for values in lines:
+        Tournament = values[1]
+        Surface = values[2]
+        Size = to_int(values[3])
+        Level = values[4]
+        Date = to_date(values[5])
+
+        Winner = values[10]
+        Winner_short = short_names[Winner]
+        Winner_hand = values[11]
+        Winner_ioc = values[13]
+        Winner_rank = values[15]
+
+        Loser = values[20]
+        Loser_short = short_names[Loser]
+        Loser_hand = values[21]
+        Loser_ioc = values[23]
+        Loser_rank = values[25]
+
+        Score = values[27]
+        Best_of = to_int(values[28])
+        Round = values[29]
+        Minutes = to_int(values[30])
+
+        W_sv = to_int(values[33])
+        W_1stIn = to_int(values[34])
+        W_ace = to_int(values[31])
+        W_1stWon = to_int(values[35])
+        W_2ndWon = to_int(values[36])
+
+        L_sv = to_int(values[42])
+        L_1stIn = to_int(values[43])
+        L_ace = to_int(values[40])
+        L_1stWon = to_int(values[44])
+        L_2ndWon = to_int(values[45])
+
+        values = (Tournament, Surface, Size, Level, Date, Winner, Winner_short, Winner_hand, Winner_ioc, Winner_rank, Loser, Loser_short, Loser_hand, Loser_ioc, Loser_rank, Score, Best_of, Round, Minutes, W_sv, W_1stIn, W_ace, W_1stWon, W_2ndWon, L_sv, L_1stIn, L_ace, L_1stWon, L_2ndWon)
+
+        stats_rows.append(values)
+
+    n_rows = len(odds_rows) + len(stats_rows)
+
+    # COMBINE BOTH FILES
+    base_rows, n_matched = join_odds(stats_rows, odds_rows)
+
+    return year, base_rows, n_rows, (n_matched, len(stats_rows)), time.time() - start
+
+
+def parse_years(years, processes=PROCESSES):
+    '''
+    Parses and joins years in a pool of processes.
+
+    :param years: List of years.
+    :param processes: Number of worker processes.
+    :return: Generator of results of parse_tennis_data in year order.
+    '''
+
+    pool = multiprocessing.Pool(processes)
+
+    for result in pool.imap(parse_tennis_data, years):
+        yield result
+
+    pool.close()
+    pool.join()
+
+
+def print_year(year, rows, n_rows, joined, elapsed, load_time):
+    '''
+    Prints speed of parsing and of loading one year. Parse time is measured
+    in the worker, load time covers writing the year to the database.
+
+    :param year: Year.
+    :param rows: Rows for table Base.
+    :param n_rows: Number of rows in source files.
+    :param joined: Pair (matches with odds, all matches).
+    :param elapsed: Parse time in seconds.
+    :param load_time: Load time in seconds.
+    :return: void.
+    '''
+
+    n_matched, n_matches = joined
+    load_time = max(load_time, 1e-6)
+
+    print "Year %s: %d rows parsed in %.2f s (%.0f rows/s), %d rows loaded in %.2f s (%.0f rows/s), " \
+          "odds found for %d of %d matches (%.1f%% missed)." % \
+          (year, n_rows, elapsed, n_rows / elapsed, len(rows), load_time, len(rows) / load_time,
+           n_matched, n_matches, 100.0 * (n_matches - n_matched) / max(n_matches, 1))
+
+
+def insert_base_rows(cursor, rows):
+    '''
+    Appends rows to table Base. Rows get consecutive ids.
+
+    :param cursor: Database cursor.
+    :param rows: Rows for table Base.
+    :return: Pair (first id, last id) of inserted rows, (None, None) if
+             there are no rows.
+    '''
+
+    if not rows:
+        return None, None
+
+    bulk_insert(cursor, "Base", BASE_COLUMNS, rows)
+    cursor.execute("SELECT MAX(id) FROM Base")
+    last_id = int(cursor.fetchone()[0])
+
+    return last_id - len(rows) + 1, last_id
+
+
+def build_base(cursor, processes=PROCESSES):
+    '''
+    Creates table Base. Years are parsed and joined in a pool of processes
+    and merged into Base in year order, so ids are always the same.
+
+    :param cursor: Database cursor.
+    :param processes: Number of worker processes.
+    :return: Dictionary year -> (first id, last id) of its rows in Base.
+    '''
+
+    print "Starting table 'Base' creation."
+
+    drop_table(cursor, "Base")
+    backend.create_table(cursor, "Base", BASE_COLUMNS, with_id=True)
+
+    total_rows = 0
+    total_matched = 0
+    total_matches = 0
+    start = time.time()
+    id_ranges = {}
+
+    years = range(START_YEAR, END_YEAR + 1)
+    for year, rows, n_rows, (n_matched, n_matches), elapsed in parse_years(years, processes):
+        load_start = time.time()
+        id_ranges[int(year)] = insert_base_rows(cursor, rows)
+        print_year(year, rows, n_rows, (n_matched, n_matches), elapsed, time.time() - load_start)
+
+        total_rows += n_rows
+        total_matched += n_matched
+        total_matches += n_matches
+
+    total_time = time.time() - start
+    print "All years: %d rows in %.2f s (%.0f rows/s)." % (total_rows, total_time, total_rows / total_time)
+    print "Odds found for %d of %d matches (%.1f%% missed)." % \
+          (total_matched, total_matches, 100.0 * (total_matches - total_matched) / max(total_matches, 1))
+
+    # Adding indexes to base table.
+    for column in BASE_INDEXES:
+        backend.create_index(cursor, "Base", column)
+
+    print "Table 'Base' done!"
+
+    return id_ranges
+
+
+def build_players(cursor):
+    '''
+    Creates table Players from table Base.
+
+    :param cursor: Database cursor.
+    :return: void.
+    '''
+
+    print "Starting table 'Players' creation."
+
+    drop_table(cursor, "Players")
+    backend.create_table(cursor, "Players", PLAYERS_COLUMNS, with_id=True)
+
+    query = '''
+            INSERT INTO Players (Name, Hand, Country)
+            SELECT Winner as Name, Winner_hand as Hand, Winner_ioc as Country
+            FROM Base
+            GROUP BY Winner, Winner_hand, Winner_ioc
+            UNION
+            SELECT Loser, Loser_hand, Loser_ioc
+            FROM Base
+            GROUP BY Loser, Winner_hand, Winner_ioc
+            '''
+
     cursor.execute(query)
 
-    excel_dir = stg.ROOT_PATH + "data/tennis_atp/atp_matches_" + year + ".csv"
 
-    query = """INSERT INTO temp_b (Tournament, Surface, Size, Level, Date, Winner, Winner_short, Winner_hand, Winner_ioc, Winner_rank, Loser, Loser_short, Loser_hand, Loser_ioc, Loser_rank, Score, Best_of, Round, Minutes, W_sv, W_1stIn, W_ace, W_1stWon, W_2ndWon, L_sv, L_1stIn, L_ace, L_1stWon, L_2ndWon) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)"""
+def build_tournaments(cursor):
+    '''
+    Creates table Tournaments from table Base.
 
-    with open(excel_dir) as f:
-        lines = f.readlines()
-
-        for line in lines[1:]:
-            values = line.split(",")
-
-            Tournament = values[1]
-            Surface = values[2]
-            Size = values[3]
-            Level = values[4]
-            Date = values[5]
-
-            Winner = values[10]
-            Winner_short = get_short_name(Winner)
-            Winner_hand = values[11]
-            Winner_ioc = values[13]
-            Winner_rank = values[15]
-
-            Loser = values[20]
-            Loser_short = get_short_name(Loser)
-            Loser_hand = values[21]
-            Loser_ioc = values[23]
-            Loser_rank = values[25]
-
-            Score = values[27]
-            Best_of = values[28]
-            Round = values[29]
-            Minutes = values[30]
-
-            W_sv = values[33]
-            W_1stIn = values[34]
-            W_ace = values[31]
-            W_1stWon = values[35]
-            W_2ndWon = values[36]
-
-            L_sv = values[42]
-            L_1stIn = values[43]
-            L_ace = values[40]
-            L_1stWon = values[44]
-            L_2ndWon = values[45]
-
-            values = (Tournament, Surface, Size, Level, Date, Winner, Winner_short, Winner_hand, Winner_ioc, Winner_rank, Loser, Loser_short, Loser_hand, Loser_ioc, Loser_rank, Score, Best_of, Round, Minutes, W_sv, W_1stIn, W_ace, W_1stWon, W_2ndWon, L_sv, L_1stIn, L_ace, L_1stWon, L_2ndWon)
-
-            cursor.execute(query, values)
-
-    # COMBINE BOTH TABLES
+    :param cursor: Database cursor.
+    :return: void.
+    '''
+
+    print "Starting table 'Tounaments' creation."
+
+    query = '''
+            INSERT INTO Tournaments (Tournament, Surface, Size, Date, Best_of)
+            SELECT Tournament, Surface, Size, min(Date) as Date, Best_of
+            FROM Base
+            GROUP BY Tournament, Surface, Size, Best_of
+            '''
+
+    drop_table(cursor, "Tournaments")
+    backend.create_table(cursor, "Tournaments", TOURNAMENTS_COLUMNS, with_id=True)
+    cursor.execute(query)
+
+    # CREATE TABLE games
+    """
     query = '''
-            CREATE TABLE new_table
-            AS
-            SELECT b.Location, a.Tournament, a.Level, a.Surface, a.Size, a.Date, a.Winner, a.Winner_hand, a.Winner_ioc, a.Winner_rank, a.Loser, a.Loser_short, a.Loser_hand, a.Loser_ioc, a.Loser_rank, a.Score, a.Best_of, a.Round, a.Minutes, a.W_sv, a.W_1stIn, a.W_ace, a.W_1stWon, a.W_2ndWon, a.L_sv, a.L_1stIn, L_ace, L_1stWon, L_2ndWon, b.Winner_odds, b.Loser_odds
-            FROM tennis.temp_b a
-            LEFT JOIN tennis.temp_a b
-            ON a.Tournament=b.Tournament AND a.Winner_short=b.Winner AND a.Loser_short=b.Loser;
+            CREATE TABLE Games
+            SELECT p1.Id as Winner_ID, p2.Id as Loser_ID, t.Id as Tournament_ID, b.Score, b.Minutes
+            FROM Base b
+            LEFT JOIN Players p1
+            ON b.Winner=p1.Name and b.Winner_hand=p1.Hand and b.Winner_ioc=p1.Country
+            LEFT JOIN Players p2
+            ON b.Loser=p2.Name and b.Loser_hand=p2.Hand and b.Loser_ioc=p2.Country
+            LEFT JOIN Tournaments t
+            ON b.Tournament=t.Tournament and b.Surface=t.Surface and b.Size=t.Size and b.Date=t.Date and b.Best_of=t.Best_of
             '''
 
-    drop_table("new_table")
+    drop_table("Games")
     cursor.execute(query)
+    add_id_to_table("Games")
+    """
 
 
 ################################################################################
-#     Building database step by step.                                          #
+#     Incremental updates.                                                     #
 ################################################################################
 
 
-# CREATE TABLE base
-print "Starting table 'Base' creation."
+def file_info(path):
+    '''
+    Size and SHA1 hash of a file.
+
+    :param path: Path to the file.
+    :return: Pair (size, hash).
+    '''
+
+    with open(path, "rb") as f:
+        content = f.read()
+
+    return len(content), hashlib.sha1(content).hexdigest()
 
-for year in xrange(START_YEAR, END_YEAR + 1):
-    print "Parsing year %s." % year
 
-    parse_tennis_data(year)
+def source_manifest():
+    '''
+    Describes current source files of every year.
 
-    if year == START_YEAR:
-        drop_table("Base")
-        cursor.execute("CREATE TABLE Base LIKE new_table")
+    :return: Dictionary year -> (csv size, csv hash, xls size, xls hash).
+    '''
 
-    cursor.execute("INSERT INTO Base SELECT * FROM new_table")
+    manifest = {}
+    for year in xrange(START_YEAR, END_YEAR + 1):
+        csv_path = stg.ROOT_PATH + "data/tennis_atp/atp_matches_%d.csv" % year
+        xls_path = stg.ROOT_PATH + "data/tennis_betting/%d.xls" % year
+        manifest[year] = file_info(csv_path) + file_info(xls_path)
 
-# Adding ID to base table.
-add_id_to_table("Base")
+    return manifest
 
-# Clear unneeded tables.
-print "Table 'Base' done! Clearing left over tables."
-drop_table("temp_a")
-drop_table("temp_b")
-drop_table("new_table")
 
-# CREATE TABLE players
-print "Starting table 'Players' creation."
+def read_manifest(cursor):
+    '''
+    Reads manifest of the last build from the database.
 
-drop_table("Players")
+    :param cursor: Database cursor.
+    :return: Dictionary year -> (csv size, csv hash, xls size, xls hash,
+             first id, last id) or None if there is no complete build.
+    '''
 
-query = '''
-        CREATE TABLE Players
-        SELECT Winner as Name, Winner_hand as Hand, Winner_ioc as Country
-        FROM Base
-        GROUP BY Winner, Winner_hand, Winner_ioc
-        UNION
-        SELECT Loser, Loser_hand, Loser_ioc
-        FROM Base
-        GROUP BY Loser, Winner_hand, Winner_ioc
-        '''
+    for table_name in ["Base", "Players", "Tournaments", "Manifest"]:
+        if not backend.table_exists(cursor, table_name):
+            return None
 
-cursor.execute(query)
-add_id_to_table("Players")
+    cursor.execute("SELECT %s FROM Manifest" % column_names(MANIFEST_COLUMNS))
 
-# CREATE TABLE tournaments
-print "Starting table 'Tounaments' creation."
+    manifest = {}
+    for row in cursor.fetchall():
+        year, csv_size, csv_hash, xls_size, xls_hash, first_id, last_id = row
+        manifest[int(year)] = (int(csv_size), str(csv_hash), int(xls_size), str(xls_hash),
+                               first_id, last_id)
 
-query = '''
-        CREATE TABLE Tournaments
-        SELECT Tournament, Surface, Size, min(Date) as Date, Best_of
-        FROM Base
-        GROUP BY Tournament, Surface, Size, Best_of
-        '''
+    return manifest
 
-drop_table("Tournaments")
-cursor.execute(query)
-add_id_to_table("Tournaments")
 
-# CREATE TABLE games
-print "Starting table 'Games' creation."
-"""
-query = '''
-        CREATE TABLE Games
-        SELECT p1.Id as Winner_ID, p2.Id as Loser_ID, t.Id as Tournament_ID, b.Score, b.Minutes
-        FROM Base b
-        LEFT JOIN Players p1
-        ON b.Winner=p1.Name and b.Winner_hand=p1.Hand and b.Winner_ioc=p1.Country
-        LEFT JOIN Players p2
-        ON b.Loser=p2.Name and b.Loser_hand=p2.Hand and b.Loser_ioc=p2.Country
-        LEFT JOIN Tournaments t
-        ON b.Tournament=t.Tournament and b.Surface=t.Surface and b.Size=t.Size and b.Date=t.Date and b.Best_of=t.Best_of
-        '''
-
-drop_table("Games")
-cursor.execute(query)
-add_id_to_table("Games")
-"""
+def write_manifest(cursor, sources, id_ranges):
+    '''
+    Replaces manifest in the database.
+
+    :param cursor: Database cursor.
+    :param sources: Result of source_manifest.
+    :param id_ranges: Dictionary year -> (first id, last id).
+    :return: void.
+    '''
+
+    drop_table(cursor, "Manifest")
+    backend.create_table(cursor, "Manifest", MANIFEST_COLUMNS)
+
+    rows = [(year,) + sources[year] + id_ranges[year] for year in sorted(sources)]
+    bulk_insert(cursor, "Manifest", MANIFEST_COLUMNS, rows)
+
+
+def delete_base_rows(cursor, id_range):
+    '''
+    Deletes rows of one year from table Base.
+
+    :param cursor: Database cursor.
+    :param id_range: Pair (first id, last id) of rows.
+    :return: Pair (min date, max date) of deleted rows or None.
+    '''
+
+    if id_range[0] is None:
+        return None
+
+    ph = backend.placeholder
+    cursor.execute("SELECT MIN(Date), MAX(Date) FROM Base WHERE id BETWEEN %s AND %s" % (ph, ph), id_range)
+    date_range = cursor.fetchone()
+    cursor.execute("DELETE FROM Base WHERE id BETWEEN %s AND %s" % (ph, ph), id_range)
+
+    return date_range
+
+
+def update_players(cursor, id_range):
+    '''
+    Updates table Players after rows of Base changed. New players are
+    added and players without matches are removed, all other players keep
+    their ids.
+
+    :param cursor: Database cursor.
+    :param id_range: Pair (first id, last id) of new rows in Base.
+    :return: void.
+    '''
+
+    query = '''
+            DELETE FROM Players
+            WHERE NOT EXISTS (SELECT 1 FROM Base b
+                              WHERE b.Winner=Players.Name AND b.Winner_hand=Players.Hand AND b.Winner_ioc=Players.Country)
+              AND NOT EXISTS (SELECT 1 FROM Base b
+                              WHERE b.Loser=Players.Name AND b.Loser_hand=Players.Hand AND b.Loser_ioc=Players.Country)
+            '''
+    cursor.execute(query)
+
+    if id_range[0] is None:
+        return
+
+    ph = backend.placeholder
+    query = '''
+            INSERT INTO Players (Name, Hand, Country)
+            SELECT n.Name, n.Hand, n.Country
+            FROM (SELECT Winner as Name, Winner_hand as Hand, Winner_ioc as Country
+                  FROM Base WHERE id BETWEEN %s AND %s
+                  UNION
+                  SELECT Loser, Loser_hand, Loser_ioc
+                  FROM Base WHERE id BETWEEN %s AND %s) n
+            WHERE NOT EXISTS (SELECT 1 FROM Players p
+                              WHERE p.Name=n.Name AND p.Hand=n.Hand AND p.Country=n.Country)
+            ''' % (ph, ph, ph, ph)
+    cursor.execute(query, id_range + id_range)
+
+
+def update_tournaments(cursor, id_range, old_dates):
+    '''
+    Updates table Tournaments after rows of Base changed. Tournaments
+    without matches are removed, new ones are added and starting dates of
+    tournaments that might have changed are recalculated.
+
+    :param cursor: Database cursor.
+    :param id_range: Pair (first id, last id) of new rows in Base.
+    :param old_dates: Pair (min date, max date) of deleted rows or None.
+    :return: void.
+    '''
+
+    ph = backend.placeholder
+    same_tournament = "b.Tournament=t.Tournament AND b.Surface=t.Surface AND b.Size=t.Size AND b.Best_of=t.Best_of"
+
+    query = '''
+            DELETE FROM Tournaments
+            WHERE NOT EXISTS (SELECT 1 FROM Base b
+                              WHERE %s)
+            ''' % same_tournament.replace("t.", "Tournaments.")
+    cursor.execute(query)
+
+    if id_range[0] is not None:
+        query = '''
+                INSERT INTO Tournaments (Tournament, Surface, Size, Date, Best_of)
+                SELECT b.Tournament, b.Surface, b.Size, b.Date, b.Best_of
+                FROM (SELECT Tournament, Surface, Size, min(Date) as Date, Best_of
+                      FROM Base WHERE id BETWEEN %s AND %s
+                      GROUP BY Tournament, Surface, Size, Best_of) b
+                WHERE NOT EXISTS (SELECT 1 FROM Tournaments t
+                                  WHERE %s)
+                ''' % (ph, ph, same_tournament)
+        cursor.execute(query, id_range)
+
+    # Starting date can change only for tournaments with new matches or
+    # for those that started while deleted matches were played.
+    conditions = []
+    params = []
+    if id_range[0] is not None:
+        conditions.append("EXISTS (SELECT 1 FROM Base b WHERE %s AND b.id BETWEEN %s AND %s)" %
+                          (same_tournament, ph, ph))
+        params += list(id_range)
+    if old_dates is not None:
+        conditions.append("t.Date BETWEEN %s AND %s" % (ph, ph))
+        params += list(old_dates)
+
+    if not conditions:
+        return
+
+    query = '''
+            UPDATE Tournaments
+            SET Date = (SELECT MIN(b.Date) FROM Base b WHERE %s)
+            WHERE %s
+            ''' % (same_tournament, " OR ".join(conditions))
+    cursor.execute(query.replace("t.", "Tournaments."), params)
+
+
+def update_database(cursor, sources, manifest, processes=PROCESSES):
+    '''
+    Replaces rows of changed years in table Base and updates tables Players
+    and Tournaments accordingly.
+
+    :param cursor: Database cursor.
+    :param sources: Result of source_manifest.
+    :param manifest: Result of read_manifest.
+    :param processes: Number of worker processes.
+    :return: Dictionary year -> (first id, last id) of its rows in Base.
+    '''
+
+    id_ranges = dict((year, value[4:]) for year, value in manifest.iteritems())
+    changed = [year for year in sorted(sources)
+               if year not in manifest or manifest[year][:4] != sources[year]]
+    removed = [year for year in sorted(manifest) if year not in sources]
+
+    if not changed and not removed:
+        print "Database is up to date."
+        return id_ranges
+
+    print "Updating years:", ", ".join(str(year) for year in changed + removed)
+
+    for year in removed:
+        old_dates = delete_base_rows(cursor, id_ranges.pop(year))
+        update_players(cursor, (None, None))
+        update_tournaments(cursor, (None, None), old_dates)
+
+    for year, rows, n_rows, joined, elapsed in parse_years(changed, processes):
+        load_start = time.time()
+        year = int(year)
+        old_dates = None
+        if year in id_ranges:
+            old_dates = delete_base_rows(cursor, id_ranges[year])
+
+        id_ranges[year] = insert_base_rows(cursor, rows)
+        update_players(cursor, id_ranges[year])
+        update_tournaments(cursor, id_ranges[year], old_dates)
+        print_year(year, rows, n_rows, joined, elapsed, time.time() - load_start)
+
+    return id_ranges
+
+
+################################################################################
+#     Building database step by step.                                          #
+################################################################################
+
+
+def main(full=False):
+    '''
+    Builds whole database or updates years whose source files changed.
+
+    :param full: If True, database is rebuilt from scratch.
+    :return: void.
+    '''
+
+    database = backend.connect()
+    cursor = database.cursor()
+
+    sources = source_manifest()
+    manifest = None if full else read_manifest(cursor)
+
+    if manifest is None:
+        id_ranges = build_base(cursor)
+        build_players(cursor)
+        build_tournaments(cursor)
+    else:
+        id_ranges = update_database(cursor, sources, manifest)
+
+    write_manifest(cursor, sources, id_ranges)
+
+    cursor.close()
+    database.commit()
+    database.close()
+
+    # Binary store is rebuilt from committed data.
+    n_matches = match_store.build_store()
+    print "Match store with %d matches written to %s." % (n_matches, match_store.STORE_PATH)
+
+    print "ALL DONE."
+
 
-print "ALL DONE. Closing cursor and database."
-cursor.close()
-database.commit()
-database.close()
\ No newline at end of file
+if __name__ == "__main__":
+    main(full="--full" in sys.argv[1:])
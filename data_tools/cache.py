@@ -0,0 +1,208 @@
+'''
+Columnar on-disk cache for data frames retrieved from the database.
+
+Each cached frame is stored as one .npz file, every column in its own numpy
+array, so loading it back needs no SQL round trip and no row by row parsing.
+Each file carries a signature of the table it was built from. When the
+signature stored in the file does not match the current one, the cached
+frame is treated as missing.
+'''
+
+__author__ = 'riko'
+
+
+import datetime
+import hashlib
+import os
+
+import numpy as np
+import pandas as pd
+
+import settings as stg
+
+
+################################################################################
+#    Cache location.                                                           #
+################################################################################
+
+
+CACHE_PATH = getattr(stg, "CACHE_PATH", stg.ROOT_PATH + "data/cache/")
+
+
+################################################################################
+#    Column encoding.                                                          #
+################################################################################
+
+
+def _encode_column(values):
+    '''
+    Turns one column of a data frame into a numpy array that can be stored
+    without pickling.
+
+    :param values: Pandas series.
+    :return: Tuple (kind, array, null_mask). null_mask is None when column
+             has no missing values.
+    '''
+
+    if values.dtype != object:
+        return "native", values.values, None
+
+    data = values.values
+    null_mask = np.array([x is None for x in data], dtype=bool)
+    present = data[~null_mask]
+
+    if len(present) and all(isinstance(x, datetime.date) and
+                            not isinstance(x, datetime.datetime) for x in present):
+        array = np.array([x if x is not None else "NaT" for x in data],
+                         dtype="datetime64[D]")
+        return "date", array, null_mask
+
+    if any(isinstance(x, unicode) for x in present):
+        array = np.array([x.encode("utf-8") if x is not None else ""
+                          for x in data], dtype=str)
+        return "unicode", array, null_mask
+
+    array = np.array([str(x) if x is not None else "" for x in data], dtype=str)
+    return "str", array, null_mask
+
+
+def _decode_column(kind, array, null_mask):
+    '''
+    Inverse of _encode_column.
+
+    :param kind: Kind of column, as returned by _encode_column.
+    :param array: Stored numpy array.
+    :param null_mask: Stored mask of missing values or None.
+    :return: Numpy array ready to be put in a data frame.
+    '''
+
+    if kind == "native":
+        return array
+
+    if kind == "date":
+        values = array.astype(object)
+    elif kind == "unicode":
+        values = np.array([x.decode("utf-8") for x in array.tolist()], dtype=object)
+    else:
+        values = np.array(array.tolist(), dtype=object)
+
+    if null_mask is not None:
+        values[null_mask] = None
+
+    return values
+
+
+################################################################################
+#    Cache functions.                                                          #
+################################################################################
+
+
+def frame_key(*parts):
+    '''
+    Builds a cache key out of anything that identifies cached frame, for
+    example SQL query and its parameters.
+
+    :param parts: Parts that identify the frame.
+    :return: Key as a hex string.
+    '''
+
+    return hashlib.md5(repr(parts)).hexdigest()
+
+
+def _frame_path(key):
+    '''
+    Path of the file in which frame with given key is cached.
+
+    :param key: Cache key.
+    :return: Path to .npz file.
+    '''
+
+    return os.path.join(CACHE_PATH, "frame_%s.npz" % key)
+
+
+def load_frame(key, signature):
+    '''
+    Loads cached data frame.
+
+    :param key: Cache key of the frame.
+    :param signature: Current signature of the source table.
+    :return: Pandas dataframe or None if frame is not cached or is stale.
+    '''
+
+    path = _frame_path(key)
+    if not os.path.exists(path):
+        return None
+
+    with np.load(path) as f:
+        # Files written before index was encoded are treated as stale.
+        if str(f["__signature__"]) != signature or "__index_kind__" not in f.files:
+            return None
+
+        columns = f["__columns__"].tolist()
+        kinds = f["__kinds__"].tolist()
+        data = {}
+        for i, (name, kind) in enumerate(zip(columns, kinds)):
+            mask_name = "n%d" % i
+            null_mask = f[mask_name] if mask_name in f.files else None
+            data[name] = _decode_column(kind, f["c%d" % i], null_mask)
+
+        # Index is encoded like columns, empty frames have an object index.
+        index_kind = str(f["__index_kind__"])
+        index_mask = f["__index_nulls__"] if "__index_nulls__" in f.files else None
+        index = _decode_column(index_kind, f["__index__"], index_mask)
+
+    return pd.DataFrame(data, index=index, columns=columns)
+
+
+def save_frame(key, signature, df):
+    '''
+    Stores data frame in cache. File is written atomically, so concurrent
+    readers never see half written cache.
+
+    :param key: Cache key of the frame.
+    :param signature: Current signature of the source table.
+    :param df: Pandas dataframe to store.
+    :return: void.
+    '''
+
+    if not os.path.isdir(CACHE_PATH):
+        os.makedirs(CACHE_PATH)
+
+    index_kind, index, index_mask = _encode_column(pd.Series(df.index.values))
+    arrays = {"__signature__": np.array(signature),
+              "__columns__": np.array([str(c) for c in df.columns]),
+              "__index_kind__": np.array(index_kind),
+              "__index__": index}
+    if index_mask is not None and index_mask.any():
+        arrays["__index_nulls__"] = index_mask
+    kinds = []
+
+    for i, name in enumerate(df.columns):
+        kind, array, null_mask = _encode_column(df[name])
+        kinds.append(kind)
+        arrays["c%d" % i] = array
+        if null_mask is not None and null_mask.any():
+            arrays["n%d" % i] = null_mask
+
+    arrays["__kinds__"] = np.array(kinds)
+
+    path = _frame_path(key)
+    temp_path = "%s.%d.tmp" % (path, os.getpid())
+    with open(temp_path, "wb") as f:
+        np.savez(f, **arrays)
+    os.rename(temp_path, path)
+
+
+def clear_cache():
+    '''
+    Removes all cached frames.
+
+    :return: void.
+    '''
+
+    if not os.path.isdir(CACHE_PATH):
+        return
+
+    for name in os.listdir(CACHE_PATH):
+        if name.startswith("frame_") and name.endswith(".npz"):
+            os.remove(os.path.join(CACHE_PATH, name))
@@ -3,30 +3,34 @@
 
 This module provides functions for data retrieval.
 Set database connection information in file: settings.py
+Database backend (MySQL or SQLite) is chosen in settings.py as well.
 """
 
 __author__ = 'riko'
 
 
+import collections
 import datetime
 
-import MySQLdb
 import pandas as pd
 import pandas.io.sql as psql
 
+import backends
+import cache
+import interning
+import pool
 import settings as stg
 
 
 ################################################################################
-#    Get DB data.                                                              #
+#    Get DB backend.                                                           #
 ################################################################################
 
 
-try:
-    db_data = stg.MYSQL_SETTINGS
-except AttributeError:
-    print "Could not load the database settings! Make sure you set them in settings.py"
-    raise
+backend = backends.get_backend()
+
+# Connections are opened lazily and reused by all queries.
+connection_pool = pool.ConnectionPool(backend, getattr(stg, "DB_POOL_SIZE", 4))
 
 
 ################################################################################
@@ -34,59 +38,223 @@ except AttributeError:
 ################################################################################
 
 
-def any_query(query):
+def any_query(query, params=None):
     '''
     Generic query.
 
     :param query: Database query that we want to retrieve.
+    :param params: Values bound to placeholders in query, written as
+                    backend.placeholder.
     :return: A pandas dataframe of the SQL query.
     '''
 
-    mysql_cn = MySQLdb.connect(**db_data)
-    df = psql.read_sql(query, con=mysql_cn)
-    mysql_cn.close()
+    with connection_pool.connection() as connection:
+        df = psql.read_sql(query, con=connection, params=params)
 
     return df
 
 
-def get_main_matches_data(surface="any"):
+def base_signature():
     '''
-    Get main data on all matches.
+    Signature of current content of table Base. It changes whenever rows in
+    Base are added, removed or rebuilt, so it is used to invalidate cache.
 
-    :param t_type:
-    :return: Panda series with columns: Winner, Loser, WSP1, WSP2, Date.
-                WSP1 means what % of serve player 1 won (anlog for WSP2).
+    :return: Signature as a string.
     '''
 
     sql_q = '''
-            SELECT Winner, Loser,
-                    (W_1stWon + W_2ndWon)/(W_sv) as WSP1,
-                    (L_1stWon + L_2ndWon)/(L_sv) as WSP2,
-                    W_sv + L_sv as Serves,
-                    Tournament,
-                    Round,
-                    Best_of,
-                    Minutes,
-                    Date,
-                    Surface,
-                    Score,
-                    Winner_odds,
-                    Loser_odds,
-                    Winner_rank,
-                    Loser_rank
+            SELECT COUNT(*) AS n,
+                    MAX(id) AS max_id,
+                    MAX(Date) AS max_date,
+                    SUM(W_sv + L_sv) AS serves,
+                    SUM(Winner_odds + Loser_odds) AS odds
                 FROM Base
-                WHERE W_sv != 0 AND L_sv != 0
             '''
 
+    df = any_query(sql_q)
+
+    return "|".join(str(x) for x in df.iloc[0])
+
+
+# Columns that get_main_matches_data can return and their SQL expressions.
+MATCH_COLUMNS = collections.OrderedDict([
+    ("Winner", "Winner"),
+    ("Loser", "Loser"),
+    ("WSP1", "(W_1stWon + W_2ndWon)/(W_sv * 1.0)"),
+    ("WSP2", "(L_1stWon + L_2ndWon)/(L_sv * 1.0)"),
+    ("Serves", "W_sv + L_sv"),
+    ("Tournament", "Tournament"),
+    ("Round", "Round"),
+    ("Best_of", "Best_of"),
+    ("Minutes", "Minutes"),
+    ("Date", "Date"),
+    ("Surface", "Surface"),
+    ("Score", "Score"),
+    ("Winner_odds", "Winner_odds"),
+    ("Loser_odds", "Loser_odds"),
+    ("Winner_rank", "Winner_rank"),
+    ("Loser_rank", "Loser_rank"),
+    ("id", "id")
+])
+
+
+def matches_query(surface="any", date_range=None, surfaces=None, levels=None,
+                  columns=None, after=None):
+    '''
+    Builds SQL query on matches in table Base. All filters are compiled into
+    WHERE clause with bound parameters.
+
+    :param surface: Surface of matches or "any" for all matches.
+    :param date_range: Pair [start, end) in datetime.date format. Either of
+                        them can be None for open range.
+    :param surfaces: List of surfaces, matches on any of them are taken.
+    :param levels: List of tournament levels (e.g. ["G", "M"]).
+    :param columns: List of columns from MATCH_COLUMNS. None for all
+                    except id.
+    :param after: Pair (date, id). If set, only matches that come after it
+                    in (Date, id) order are taken.
+    :return: Tuple (query, params).
+    '''
+
+    if columns is None:
+        columns = [column for column in MATCH_COLUMNS if column != "id"]
+
+    select = []
+    for column in columns:
+        try:
+            expression = MATCH_COLUMNS[column]
+        except KeyError:
+            raise ValueError("Unknown match column '%s'!" % column)
+
+        if expression == column:
+            select.append(column)
+        else:
+            select.append("%s as %s" % (expression, column))
+
+    where = ["W_sv != 0", "L_sv != 0"]
+    params = []
+    ph = backend.placeholder
+
     if surface != "any":
-        sql_q += " AND Surface='%s'" % surface
+        surfaces = [surface] + list(surfaces or [])
+
+    if surfaces:
+        where.append("Surface IN (%s)" % ", ".join([ph] * len(surfaces)))
+        params += list(surfaces)
+
+    if levels:
+        where.append("Level IN (%s)" % ", ".join([ph] * len(levels)))
+        params += list(levels)
+
+    if date_range is not None:
+        if date_range[0] is not None:
+            where.append("Date >= %s" % ph)
+            params.append(date_range[0])
+        if date_range[1] is not None:
+            where.append("Date < %s" % ph)
+            params.append(date_range[1])
+
+    if after is not None:
+        where.append("(Date > %s OR (Date = %s AND id > %s))" % (ph, ph, ph))
+        params += [after[0], after[0], after[1]]
+
+    sql_q = '''
+            SELECT %s
+                FROM Base
+                WHERE %s
+            ''' % (",\n                    ".join(select),
+                   "\n                    AND ".join(where))
+
+    return sql_q, params
+
+
+def get_main_matches_data(surface="any", date_range=None, surfaces=None,
+                          levels=None, columns=None, use_cache=True):
+    '''
+    Get main data on all matches. Filters are applied by the database, so
+    only requested rows and columns are retrieved.
+
+    :param surface: Surface of matches or "any" for all matches.
+    :param date_range: Pair [start, end) in datetime.date format. Either of
+                        them can be None for open range.
+    :param surfaces: List of surfaces, matches on any of them are taken.
+    :param levels: List of tournament levels (e.g. ["G", "M"]).
+    :param columns: List of columns from MATCH_COLUMNS. None for all
+                    except id.
+    :param use_cache: If True, result is served from local cache as long as
+                        table Base did not change.
+    :return: Panda series with columns: Winner, Loser, WSP1, WSP2, Date...
+                WSP1 means what % of serve player 1 won (anlog for WSP2).
+                Matches are sorted by date.
+    '''
+
+    sql_q, params = matches_query(surface, date_range, surfaces, levels, columns)
+    sql_q += "    ORDER BY Date, id\n"
+
+    if use_cache:
+        key = cache.frame_key(sql_q, params)
+        signature = base_signature()
+        df_matches = cache.load_frame(key, signature)
+        if df_matches is not None:
+            return df_matches
+
+    df_matches = any_query(sql_q, params)
 
-    df_matches = any_query(sql_q)
-    df_matches = df_matches.sort('Date')
+    if use_cache:
+        cache.save_frame(key, signature, df_matches)
 
     return df_matches
 
 
+def iter_main_matches_data(chunk_size=10000, surface="any", date_range=None,
+                           surfaces=None, levels=None, columns=None):
+    '''
+    Streams the same data as get_main_matches_data in chunks ordered by
+    (Date, id). Chunks are fetched with keyset pagination, so at most one
+    chunk is held in memory and every chunk is an index range scan.
+
+    :param chunk_size: Largest number of matches in one chunk.
+    :param surface: Surface of matches or "any" for all matches.
+    :param date_range: Pair [start, end) in datetime.date format.
+    :param surfaces: List of surfaces, matches on any of them are taken.
+    :param levels: List of tournament levels (e.g. ["G", "M"]).
+    :param columns: List of columns from MATCH_COLUMNS. None for all
+                    except id.
+    :return: Generator of pandas dataframes.
+    '''
+
+    if columns is None:
+        columns = [column for column in MATCH_COLUMNS if column != "id"]
+
+    # Date and id are needed to find where next chunk starts.
+    query_columns = list(columns)
+    for column in ["Date", "id"]:
+        if column not in query_columns:
+            query_columns.append(column)
+
+    after = None
+    offset = 0
+
+    while True:
+        sql_q, params = matches_query(surface, date_range, surfaces, levels,
+                                      query_columns, after)
+        sql_q += "    ORDER BY Date, id LIMIT %d\n" % chunk_size
+
+        df_chunk = any_query(sql_q, params)
+        n = len(df_chunk)
+        if n == 0:
+            break
+
+        after = (df_chunk["Date"].iloc[-1], df_chunk["id"].iloc[-1])
+        df_chunk.index = pd.RangeIndex(offset, offset + n)
+        offset += n
+
+        yield df_chunk[columns]
+
+        if n < chunk_size:
+            break
+
+
 def get_players():
     '''
 
@@ -101,6 +269,45 @@ def get_players():
     return df_players
 
 
+def get_player_ids():
+    '''
+    Stable integer ids of players, taken from table Players.
+
+    :return: Pair of dictionaries (name -> id, id -> name).
+    '''
+
+    df_players = any_query("SELECT id, Name FROM Players")
+
+    return interning.player_ids(df_players)
+
+
+def get_interned_matches_data(surface="any", date_range=None, surfaces=None,
+                              levels=None, columns=None, use_cache=True):
+    '''
+    Same data as get_main_matches_data in compact form: players are int32
+    ids, repeated strings (Surface, Round, Tournament...) are categoricals
+    and numeric columns are downcast. Floats are float32, so model outputs
+    differ slightly from outputs on get_main_matches_data.
+
+    :param surface: Surface of matches or "any" for all matches.
+    :param date_range: Pair [start, end) in datetime.date format.
+    :param surfaces: List of surfaces, matches on any of them are taken.
+    :param levels: List of tournament levels (e.g. ["G", "M"]).
+    :param columns: List of columns from MATCH_COLUMNS. None for all
+                    except id.
+    :param use_cache: If True, matches are served from local cache as long
+                        as table Base did not change.
+    :return: Tuple (dataframe, name -> id, id -> name).
+    '''
+
+    df_matches = get_main_matches_data(surface, date_range, surfaces, levels,
+                                       columns, use_cache)
+    name_to_id, id_to_name = get_player_ids()
+    df_matches = interning.intern_frame(df_matches, name_to_id, id_to_name)
+
+    return df_matches, name_to_id, id_to_name
+
+
 def get_tournaments():
     '''
 
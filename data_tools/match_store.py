@@ -0,0 +1,267 @@
+'''
+Binary store of all matches.
+
+Matches are written into one file with fixed layout, so any process can map
+it with np.memmap and read matches with no parsing, no database connection
+and no pickling. Layout of the file:
+
+- header (HEADER_DTYPE): magic string, format version and offsets of the
+  other sections,
+- matches: structured array of MATCH_DTYPE records ordered by date,
+- player table: UTF8 text with one "id<TAB>name" line per player,
+- surface table: UTF8 text with one surface name per line, surface code of
+  a match is index of the line.
+'''
+
+__author__ = 'riko'
+
+
+import collections
+import datetime
+import os
+
+import numpy as np
+import pandas as pd
+
+import handle_data
+import settings as stg
+
+
+################################################################################
+#    File format.                                                              #
+################################################################################
+
+
+STORE_PATH = getattr(stg, "STORE_PATH", stg.ROOT_PATH + "data/matches.bin")
+
+MAGIC = "TNSMATCH"
+VERSION = 1
+
+HEADER_DTYPE = np.dtype([("magic", "S8"), ("version", "<u4"),
+                         ("record_size", "<u4"), ("n_matches", "<u8"),
+                         ("matches_offset", "<u8"),
+                         ("players_offset", "<u8"), ("players_size", "<u8"),
+                         ("surfaces_offset", "<u8"), ("surfaces_size", "<u8")])
+
+MATCH_DTYPE = np.dtype([("winner", "<i4"), ("loser", "<i4"),
+                        ("wsp1", "<f4"), ("wsp2", "<f4"),
+                        ("best_of", "i1"), ("surface", "i1"),
+                        ("day", "<i4"),
+                        ("winner_odds", "<f4"), ("loser_odds", "<f4")])
+
+# Columns of table Base needed to fill MATCH_DTYPE records.
+STORE_COLUMNS = ["Winner", "Loser", "WSP1", "WSP2", "Best_of", "Surface",
+                 "Date", "Winner_odds", "Loser_odds"]
+
+EPOCH = datetime.date(1970, 1, 1)
+
+
+################################################################################
+#    Store.                                                                    #
+################################################################################
+
+
+class MatchStore(object):
+    '''
+    Matches mapped from a store file.
+    '''
+
+    def __init__(self, matches, player_names, surfaces):
+        '''
+        Constructor.
+
+        :param matches: Array of MATCH_DTYPE records (usually np.memmap).
+        :param player_names: Dictionary player id -> name.
+        :param surfaces: List of surface names, indexed by surface code.
+        :return: void.
+        '''
+
+        self.matches = matches
+        self.player_names = player_names
+        self.surfaces = surfaces
+
+    def __len__(self):
+        '''
+        Number of matches in store.
+
+        :return: Number of matches.
+        '''
+
+        return len(self.matches)
+
+    def dates(self):
+        '''
+        Dates of matches.
+
+        :return: Numpy array of datetime64[D].
+        '''
+
+        return self.matches["day"].astype("datetime64[D]")
+
+    def to_frame(self):
+        '''
+        Converts matches to a dataframe with same columns as
+        get_interned_matches_data, so models can run on them.
+
+        :return: Pandas dataframe.
+        '''
+
+        m = self.matches
+        df = pd.DataFrame(collections.OrderedDict([
+            ("Winner", m["winner"]),
+            ("Loser", m["loser"]),
+            ("WSP1", m["wsp1"]),
+            ("WSP2", m["wsp2"]),
+            ("Best_of", m["best_of"]),
+            ("Surface", pd.Categorical.from_codes(m["surface"], self.surfaces)),
+            ("Date", [EPOCH + datetime.timedelta(days=int(d)) for d in m["day"]]),
+            ("Winner_odds", m["winner_odds"]),
+            ("Loser_odds", m["loser_odds"])
+        ]))
+
+        return df
+
+
+################################################################################
+#    Writing and reading.                                                      #
+################################################################################
+
+
+def _encode_table(lines):
+    '''
+    Encodes table of strings.
+
+    :param lines: List of strings (unicode or UTF8 encoded).
+    :return: UTF8 encoded text.
+    '''
+
+    encoded = []
+    for line in lines:
+        if isinstance(line, unicode):
+            line = line.encode("utf-8")
+        encoded.append(line)
+
+    return "\n".join(encoded)
+
+
+def _decode_table(data):
+    '''
+    Inverse of _encode_table.
+
+    :param data: UTF8 encoded text.
+    :return: List of strings.
+    '''
+
+    if not data:
+        return []
+
+    return data.split("\n")
+
+
+def write_store(df, id_to_name, path=STORE_PATH):
+    '''
+    Writes matches into a store file. File is written atomically, so
+    processes that map the old file are not affected.
+
+    :param df: Compact dataframe of matches (get_interned_matches_data)
+                with columns STORE_COLUMNS, ordered by date.
+    :param id_to_name: Dictionary player id -> name.
+    :param path: Path to store file.
+    :return: void.
+    '''
+
+    surface = df["Surface"].astype("category")
+    surfaces = [str(s) for s in surface.cat.categories]
+
+    matches = np.zeros(len(df), dtype=MATCH_DTYPE)
+    matches["winner"] = df["Winner"].values
+    matches["loser"] = df["Loser"].values
+    matches["wsp1"] = df["WSP1"].values
+    matches["wsp2"] = df["WSP2"].values
+    matches["best_of"] = df["Best_of"].values
+    matches["surface"] = surface.cat.codes.values
+    matches["day"] = [(d - EPOCH).days for d in df["Date"]]
+    matches["winner_odds"] = df["Winner_odds"].values
+    matches["loser_odds"] = df["Loser_odds"].values
+
+    players = _encode_table(["%d\t%s" % (i, id_to_name[i]) for i in sorted(id_to_name)])
+    surfaces = _encode_table(surfaces)
+
+    header = np.zeros(1, dtype=HEADER_DTYPE)
+    header["magic"] = MAGIC
+    header["version"] = VERSION
+    header["record_size"] = MATCH_DTYPE.itemsize
+    header["n_matches"] = len(matches)
+    header["matches_offset"] = HEADER_DTYPE.itemsize
+    header["players_offset"] = HEADER_DTYPE.itemsize + matches.nbytes
+    header["players_size"] = len(players)
+    header["surfaces_offset"] = HEADER_DTYPE.itemsize + matches.nbytes + len(players)
+    header["surfaces_size"] = len(surfaces)
+
+    directory = os.path.dirname(path)
+    if directory and not os.path.isdir(directory):
+        os.makedirs(directory)
+
+    temp_path = "%s.%d.tmp" % (path, os.getpid())
+    with open(temp_path, "wb") as f:
+        f.write(header.tostring())
+        f.write(matches.tostring())
+        f.write(players)
+        f.write(surfaces)
+    os.rename(temp_path, path)
+
+
+def build_store(path=STORE_PATH, use_cache=True):
+    '''
+    Builds store file from table Base.
+
+    :param path: Path to store file.
+    :param use_cache: If True, matches are served from local cache as long
+                        as table Base did not change.
+    :return: Number of matches written.
+    '''
+
+    df, name_to_id, id_to_name = handle_data.get_interned_matches_data(
+        columns=STORE_COLUMNS, use_cache=use_cache)
+    write_store(df, id_to_name, path)
+
+    return len(df)
+
+
+def load_store(path=STORE_PATH):
+    '''
+    Maps store file into memory. Matches are read only and shared with all
+    other processes that map the same file.
+
+    :param path: Path to store file.
+    :return: MatchStore.
+    '''
+
+    header = np.fromfile(path, dtype=HEADER_DTYPE, count=1)
+    if len(header) == 0 or header["magic"][0] != MAGIC:
+        raise ValueError("File '%s' is not a match store!" % path)
+
+    header = header[0]
+    if header["version"] != VERSION or header["record_size"] != MATCH_DTYPE.itemsize:
+        raise ValueError("Match store '%s' has version %d, expected %d! Rebuild it." %
+                         (path, header["version"], VERSION))
+
+    n_matches = int(header["n_matches"])
+    if n_matches:
+        matches = np.memmap(path, dtype=MATCH_DTYPE, mode="r",
+                            offset=int(header["matches_offset"]), shape=(n_matches,))
+    else:
+        matches = np.zeros(0, dtype=MATCH_DTYPE)
+
+    with open(path, "rb") as f:
+        f.seek(int(header["players_offset"]))
+        players = _decode_table(f.read(int(header["players_size"])))
+        f.seek(int(header["surfaces_offset"]))
+        surfaces = _decode_table(f.read(int(header["surfaces_size"])))
+
+    player_names = {}
+    for line in players:
+        i, name = line.split("\t", 1)
+        player_names[int(i)] = name
+
+    return MatchStore(matches, player_names, surfaces)
@@ -0,0 +1,168 @@
+'''
+Thread safe pool of persistent database connections.
+
+Connections are created lazily, only when no idle connection is available,
+and at most "size" of them are open at the same time. A connection is
+checked with a cheap query before it is handed out, so connections closed
+by the server are replaced instead of failing the query.
+'''
+
+__author__ = 'riko'
+
+
+import contextlib
+import os
+import Queue
+import threading
+
+
+class ConnectionPool(object):
+    '''
+    Pool of connections to one backend.
+    '''
+
+    def __init__(self, backend, size=4, timeout=None):
+        '''
+        Constructor.
+
+        :param backend: Backend that opens connections (see backends.py).
+        :param size: Largest number of connections open at the same time.
+        :param timeout: How many seconds checkout waits for a free
+                        connection. None means wait forever.
+        :return: void.
+        '''
+
+        self.backend = backend
+        self.size = size
+        self.timeout = timeout
+        self._lock = threading.Lock()
+        self._reset()
+
+    def _reset(self):
+        '''
+        Forgets all connections. Used on start and in forked processes, which
+        must not share sockets with their parent.
+
+        :return: void.
+        '''
+
+        self._idle = Queue.LifoQueue()
+        self._opened = 0
+        self._pid = os.getpid()
+
+    def _discard(self, connection):
+        '''
+        Closes connection and frees its slot in the pool.
+
+        :param connection: Connection we no longer want.
+        :return: void.
+        '''
+
+        try:
+            connection.close()
+        except Exception:
+            pass
+
+        with self._lock:
+            self._opened -= 1
+
+    def checkout(self):
+        '''
+        Takes connection from the pool. Connection must be returned with
+        checkin once it is no longer used.
+
+        :return: DB-API connection.
+        '''
+
+        with self._lock:
+            if self._pid != os.getpid():
+                self._reset()
+
+            connection = None
+            try:
+                connection = self._idle.get_nowait()
+            except Queue.Empty:
+                if self._opened < self.size:
+                    self._opened += 1
+                    create = True
+                else:
+                    create = False
+
+        if connection is None:
+            if create:
+                try:
+                    return self.backend.connect()
+                except Exception:
+                    with self._lock:
+                        self._opened -= 1
+                    raise
+
+            try:
+                connection = self._idle.get(timeout=self.timeout)
+            except Queue.Empty:
+                raise RuntimeError("No free database connection in %s seconds!" % self.timeout)
+
+        if not self.backend.is_alive(connection):
+            self._discard(connection)
+            with self._lock:
+                self._opened += 1
+            try:
+                connection = self.backend.connect()
+            except Exception:
+                with self._lock:
+                    self._opened -= 1
+                raise
+
+        return connection
+
+    def checkin(self, connection):
+        '''
+        Returns connection to the pool. Open transaction is rolled back, so
+        next user of the connection sees fresh data.
+
+        :param connection: Connection taken with checkout.
+        :return: void.
+        '''
+
+        if self._pid != os.getpid():
+            return
+
+        try:
+            connection.rollback()
+        except Exception:
+            self._discard(connection)
+            return
+
+        self._idle.put(connection)
+
+    @contextlib.contextmanager
+    def connection(self):
+        '''
+        Context manager that checks out connection and returns it to the pool
+        afterwards. If query fails, connection is closed instead of reused.
+
+        :return: DB-API connection.
+        '''
+
+        connection = self.checkout()
+        try:
+            yield connection
+        except Exception:
+            self._discard(connection)
+            raise
+
+        self.checkin(connection)
+
+    def close_all(self):
+        '''
+        Closes all idle connections.
+
+        :return: void.
+        '''
+
+        while True:
+            try:
+                connection = self._idle.get_nowait()
+            except Queue.Empty:
+                break
+            self._discard(connection)
@@ -0,0 +1,27 @@
+'''
+Micro-benchmark of probability functions in calculations, in nanoseconds
+per Python call. Best of REPEAT runs is reported, so numbers are comparable
+between commits on the same machine.
+'''
+
+__author__ = 'riko'
+
+
+import timeit
+
+
+CALLS = [("_prob_win_game", "calc._prob_win_game(0.65)"),
+         ("_prob_win_tiebreaker", "calc._prob_win_tiebreaker(0.65, 0.6)"),
+         ("_prob_win_set", "calc._prob_win_set(0.65, 0.6)"),
+         ("prob_win_match (best of 3)", "calc.prob_win_match(0.65, 0.6, 3)"),
+         ("prob_win_match (best of 5)", "calc.prob_win_match(0.65, 0.6, 5)")]
+
+NUMBER = 20000
+REPEAT = 5
+
+
+print '{:>28s} {:>10s}'.format("Function", "ns/call")
+
+for name, stmt in CALLS:
+    seconds = min(timeit.repeat(stmt, "import models.calculations as calc", number=NUMBER, repeat=REPEAT))
+    print '{:>28s} {:10.0f}'.format(name, 1e9 * seconds / NUMBER)
@@ -16,8 +16,11 @@ elo = models.DoubleEloModel()
 
 train_data = dt.get_main_matches_data()
 
-x = np.array([1.0 * i / 4 for i in range(4, 120)])
-y = np.array([elo._train_params([p], train_data, verbose=True) for p in x])
+# Every K is evaluated in its own worker process.
+grid = np.array([1.0 * i / 4 for i in range(4, 120)])
+result = elo.train_params(train_data, None, method="grid", grid=[grid], verbose=True)
+x, y = result.points[:, 0], result.errors
+print "Best K:", result.x[0], "error:", result.fun
 fig = plt.figure()
 
 plt.plot(x, y, '-r')
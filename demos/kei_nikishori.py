@@ -1,23 +1,68 @@
 """
 Generate graph of Kei Nikishori performance.
+
+Base model rank of a player at a match is his place among all players
+sorted by serve + return rating right after that match, taken from the
+history entry of the match in a single model run. Date of a match is date
+of its tournament, so later matches of the same tournament are not counted.
 """
 
 __author__ = 'riko'
 
 
-import pickle
+import collections
 
 import matplotlib.dates as mdates
 import matplotlib.pyplot as plt
+import numpy as np
+
+import data_tools as dt
+import models
+import models.rating_history as rh
+
+
+NAME = "Kei Nishikori"
+# First matches of a player are left out, his rating is not settled yet.
+SKIP = 55
+
 
-import settings as stg
+data = dt.get_main_matches_data()
+model = models.DoubleEloModel()
+model.record_history = True
+model.run(data)
 
+# History entries of the player, one per rated match, in time order.
+history = model.history
+entries = np.nonzero(history["row"] == model.player_rankings.get(NAME))[0]
+entry_days = history["day"][entries]
 
-file = stg.ROOT_PATH + "data/kei_data.p"
-data = pickle.load(open(file, "rb"))[55:]
-dates = [x[0] for x in data]
-atp = [int(x[1]) for x in data]
-rating = [x[2] for x in data]
+matches = data[(data["Winner"] == NAME) | (data["Loser"] == NAME)]
+days = rh.day_numbers(matches["Date"]).tolist()
+played = collections.Counter(days)
+seen = collections.Counter()
+dates = []
+atp = []
+rating = []
+for winner, date, day, winner_rank, loser_rank in zip(matches["Winner"], matches["Date"], days,
+                                                      matches["Winner_rank"], matches["Loser_rank"]):
+    # k-th match of the player on a date is his k-th entry of that date,
+    # if all his matches on that date were rated.
+    k = seen[day]
+    seen[day] += 1
+    first, last = np.searchsorted(entry_days, [day, day + 1])
+
+    rank = winner_rank if winner == NAME else loser_rank
+    if last - first != played[day] or not str(rank).isdigit():
+        continue
+
+    ratings = history.ratings_after(entries[first + k])
+    strength = ratings["serve"] + ratings["return"]
+
+    dates.append(date)
+    atp.append(int(rank))
+    rating.append(int((strength > strength[NAME]).sum()) + 1)
+
+dates, atp, rating = dates[SKIP:], atp[SKIP:], rating[SKIP:]
 
 fig, ax = plt.subplots()
 plt.ylim(max(atp), min(atp) - 2)
@@ -34,4 +79,3 @@ plt.xlabel('Date', fontsize=10)
 
 plt.gcf().autofmt_xdate()
 plt.show()
-
@@ -0,0 +1,73 @@
+'''
+Accuracy and speed of match win probability lookup tables.
+
+For tables of growing density prints largest absolute error against the
+exact prob_win_match and time per probability. Then runs all models with
+exact probabilities and with table within TOLERANCE and compares their
+win probabilities.
+'''
+
+__author__ = 'riko'
+
+
+import time
+
+import numpy as np
+
+import calculations as calc
+import data_tools as dt
+import models
+import models.match_table as mt
+
+
+SIZES = [26, 51, 101, 201, 401]
+N = 1000000
+TOLERANCE = 1e-6
+
+MODELS = [models.DoubleEloModel, models.DoubleEloSurfaceModel,
+          models.DoubleModifiedGlickoModel, models.DoubleGlicko2Model,
+          models.BarnettModel]
+
+
+rnd = np.random.RandomState(42)
+p = rnd.uniform(mt.LOW, mt.HIGH, N)
+q = rnd.uniform(mt.LOW, mt.HIGH, N)
+
+start = time.time()
+exact = calc.prob_win_match_batch(p, q)
+exact_time = time.time() - start
+
+print '{:>8s} {:>14s} {:>14s} {:>14s} {:>8s}'.format("Points", "Error (bo3)", "Error (bo5)",
+                                                      "Random error", "ns/call")
+
+for n_points in SIZES:
+    table = mt.MatchTable.build(n_points=n_points)
+
+    start = time.time()
+    approx = table.prob_win_match_batch(p, q)
+    table_time = time.time() - start
+
+    print '{:8d} {:14.2e} {:14.2e} {:14.2e} {:8.0f}'.format(n_points, table.errors[3], table.errors[5],
+                                                            np.abs(approx - exact).max(), 1e9 * table_time / N)
+
+print "Exact formula: %.0f ns/call." % (1e9 * exact_time / N)
+print
+
+data = dt.get_main_matches_data()
+table = mt.get_table(TOLERANCE)
+print "Table with %d points, error %.2e." % (table.n_points, table.error)
+print '{:>28s} {:>14s} {:>9s} {:>9s}'.format("Model", "Max difference", "Exact", "Table")
+
+for model_class in MODELS:
+    start = time.time()
+    before = model_class().run(data)["win_prob"].values
+    exact_time = time.time() - start
+
+    model = model_class()
+    model.prob_tolerance = TOLERANCE
+    start = time.time()
+    after = model.run(data)["win_prob"].values
+    table_time = time.time() - start
+
+    print '{:>28s} {:14.2e} {:8.2f}s {:8.2f}s'.format(model_class.__name__, np.nanmax(np.abs(after - before)),
+                                                      exact_time, table_time)
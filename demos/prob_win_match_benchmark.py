@@ -0,0 +1,58 @@
+'''
+Benchmark of batch match probabilities against the scalar loop.
+
+Same random (p, q, best_of) triples are priced with one Python call of
+prob_win_match per triple and with one call of prob_win_match_batch, which
+computes them in parallel with OpenMP. Number of threads is set with
+environment variable OMP_NUM_THREADS.
+'''
+
+__author__ = 'riko'
+
+
+import time
+
+import numpy as np
+
+import models.calculations as calc
+
+
+SIZES = [1000, 10000, 100000, 1000000]
+
+
+def scalar_loop(p, q, best_of):
+    '''
+    Probabilities of winning matches, one call per match.
+
+    :param p: Array of probabilities of player1 winning serve point.
+    :param q: Array of probabilities of player2 winning serve point.
+    :param best_of: Array of numbers of sets.
+    :return: Numpy array of probabilities.
+    '''
+
+    return np.array([calc.prob_win_match(x, y, z) for x, y, z in
+                     zip(p.tolist(), q.tolist(), best_of.tolist())])
+
+
+rnd = np.random.RandomState(42)
+
+print '{:>10s} {:>16s} {:>16s} {:>8s}'.format("Matches", "scalar (ns/call)", "batch (ns/call)", "Speedup")
+
+for n in SIZES:
+    p = rnd.uniform(0.4, 0.8, n)
+    q = rnd.uniform(0.4, 0.8, n)
+    best_of = rnd.choice([3, 5], n)
+    out = np.empty(n)
+
+    start = time.time()
+    before = scalar_loop(p, q, best_of)
+    scalar_time = time.time() - start
+
+    start = time.time()
+    calc.prob_win_match_batch(p, q, best_of, out=out)
+    batch_time = time.time() - start
+
+    assert np.array_equal(before, out)
+
+    print '{:10d} {:16.0f} {:16.0f} {:7.1f}x'.format(n, 1e9 * scalar_time / n, 1e9 * batch_time / n,
+                                                      scalar_time / batch_time)
@@ -0,0 +1,64 @@
+'''
+Benchmark of model replay speed on all matches from 2003 to 2015.
+
+Each model is run twice: once with DataFrame.iterrows, which is how models
+used to iterate over matches, and once with TennisRankingModel.run, which
+takes needed columns out of the dataframe once. Both runs call the same
+per match function, so the difference is only in the iteration.
+'''
+
+__author__ = 'riko'
+
+
+import time
+
+import numpy as np
+
+import data_tools as dt
+import models
+
+
+MODELS = [models.DoubleEloModel, models.DoubleEloSurfaceModel,
+          models.DoubleModifiedGlickoModel, models.DoubleGlicko2Model,
+          models.BarnettModel, models.ModifiedGlickoModel]
+
+
+def run_iterrows(model, data):
+    '''
+    Runs model on data, row by row with DataFrame.iterrows.
+
+    :param model: Tennis ranking model.
+    :param data: Pandas dataframe.
+    :return: List of win probabilities.
+    '''
+
+    probabilities = []
+
+    model._start_run()
+    for i, row in data.iterrows():
+        values = [row[column] for column in model.match_columns]
+        probabilities.append(model._run_match(*values)[0])
+    model._finish_run()
+
+    return probabilities
+
+
+data = dt.get_main_matches_data()
+n = len(data)
+
+print "%d matches." % n
+print '{:>28s} {:>14s} {:>14s} {:>8s}'.format("Model", "iterrows (m/s)", "arrays (m/s)", "Speedup")
+
+for model_class in MODELS:
+    start = time.time()
+    before = run_iterrows(model_class(), data)
+    before_time = time.time() - start
+
+    start = time.time()
+    after = model_class().run(data)["win_prob"].values
+    after_time = time.time() - start
+
+    assert np.array_equal(np.array(before), after)
+
+    print '{:>28s} {:14.0f} {:14.0f} {:7.1f}x'.format(model_class.__name__, n / before_time,
+                                                        n / after_time, before_time / after_time)
@@ -9,7 +9,7 @@ surface = ['any', 'clay', 'hard', 'carpet', 'grass']
 values = []
 
 for s in surface:
-    data = dt.get_main_matches_data(s)
+    data = dt.get_main_matches_data(s, columns=["WSP1", "WSP2"])
     wsp_data = np.append(np.array(data["WSP1"]), np.array(data["WSP2"]))
     predict_mean = np.average(wsp_data, axis=0)
     values.append(predict_mean)
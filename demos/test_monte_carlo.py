@@ -5,12 +5,34 @@ import calculations as calc
 
 p = 0.70
 q = 0.70
+N = 100000
+SEED = 42
 
-start = time.clock()
+start = time.time()
 m1 = calc.prob_win_match(p, q)
-m2 = calc.monte_carlo_match(p, q)
-end = time.clock()
+m2 = calc.monte_carlo_match(p, q, N=N, seed=SEED)
+end = time.time()
 
 print m1
 print m2
 print "Time: ", end - start
+
+# Same seed gives same matches, whatever number of threads (OMP_NUM_THREADS).
+start = time.time()
+winners, points, games, sets = calc.simulate_matches(p, q, 5, N, seed=SEED)
+end = time.time()
+
+print "Best of 5: win %.4f, points %.1f, games %.1f, sets %.2f" % (winners.mean(), points.mean(),
+                                                                    games.mean(), sets.mean())
+print "Exact: %.4f" % calc.prob_win_match(p, q, 5)
+print "Time for %d matches (ms): %.1f, per point (ns): %.1f" % (N, 1000 * (end - start),
+                                                                1e9 * (end - start) / points.sum())
+
+# Simulation stops when 95% confidence interval of win rate is +-0.002.
+for p, q in [(0.70, 0.70), (0.75, 0.60), (0.85, 0.55)]:
+    start = time.time()
+    r = calc.monte_carlo_adaptive(p, q, 3, win_error=0.002, confidence=0.95, seed=SEED)
+    end = time.time()
+
+    print "p=%.2f q=%.2f: win %.4f +- %.4f (exact %.4f) after %d matches, %.1f ms" % (
+        p, q, r["win"], r["win_error"], calc.prob_win_match(p, q), r["N"], 1000 * (end - start))
@@ -8,6 +8,7 @@ __author__ = 'riko'
 
 import datetime
 import math
+import os
 
 import numpy as np
 import scipy as sp
@@ -15,6 +16,7 @@ import scipy.stats
 
 import data_tools as dt
 import settings as stg
+import tennis_model as tm
 
 
 def np_latex_table(a):
@@ -124,7 +126,27 @@ def test_sqme(data):
 
     return  np.sum((1.0 - data["win_prob"]) ** 2) / (1.0 * np.size(data["win_prob"]))
 
-def analyse_ranking_model(model, report_name="report", verbose=False):
+def has_checkpoint(model, path):
+    '''
+    Is there a checkpoint of this model with same parameters?
+
+    :param model: Model derived from TennisModel.
+    :param path: Path to checkpoint or None.
+    :return: True if model can be loaded from checkpoint.
+    '''
+
+    if path is None or not os.path.exists(path):
+        return False
+
+    try:
+        info = tm.read_checkpoint_info(path)
+    except ValueError:
+        return False
+
+    return info["model"] == model.__class__.__name__ and info["params"] == model.params
+
+
+def analyse_ranking_model(model, report_name="report", verbose=False, checkpoint=None):
     '''
     READ BEFORE USE:
     Provides full analysis of model that uses ranking. It will work by first
@@ -141,6 +163,10 @@ def analyse_ranking_model(model, report_name="report", verbose=False):
     :param model: Model one wants to analyse.
     :param report_name: Name of report. It will have timestamp appended.
     :param verbose: If True results will be printed in console as well.
+    :param checkpoint: Path to checkpoint of model trained on 2003 - 2011.
+                        If it exists and was made with same parameters,
+                        training is skipped and model resumes from it.
+                        Otherwise model is trained and checkpoint is saved.
     :return: void.
     '''
 
@@ -163,7 +189,13 @@ def analyse_ranking_model(model, report_name="report", verbose=False):
 
     train_range = [datetime.date(2003, 1, 1), datetime.date(2012, 1, 1)]
     train_data = dt.filter_data_time_range(data, train_range)
-    model.train(train_data, verbose)
+
+    if has_checkpoint(model, checkpoint):
+        model.load_checkpoint(checkpoint)
+    else:
+        model.train(train_data, verbose)
+        if checkpoint is not None:
+            model.save_checkpoint(checkpoint)
 
     if verbose:
         print "Testing:"
@@ -3,114 +3,129 @@ __author__ = 'riko'
 
 import math
 
-import calculations as calc
+import numpy as np
+
 import tennis_model as tm
 from tennis_model import overrides
 
 
-class Player(object):
+class BarnettModel(tm.TennisRankingModel):
     '''
-    Wraper for stats we need to store for each player in Barnett model.
+    This is Barnett model.
     '''
 
-    def __init__(self):
+    def __init__(self, **kwargs):
         '''
         Constructor.
 
         :return: void
         '''
 
-        self.ser = 0.6
-        self.ret = 0.4
-        self.n = 1
+        self.params = {}
+        self.params.update(kwargs)
+        super(self.__class__, self).__init__(**kwargs)
+        self.name = "Barnett"
 
-    def add(self, ser, ret):
-        '''
-        Add functions.
+    @overrides(tm.TennisRankingModel)
+    def rating_columns(self):
         '''
+        Override function from superclass. Player keeps sums of serve and
+        return win percentages and number of them. Sums start with one
+        imaginary match with 60% on serve and 40% on return.
 
-        self.ser += ser
-        self.ret += ret
-        self.n += 1
-
-    def get(self):
+        :return: List of tuples (name, default value, dtype).
         '''
-        Get function.
-        '''
-
-        return self.ser / self.n, self.ret / self.n
 
+        return [("ser", 0.6, np.float64), ("ret", 0.4, np.float64), ("n", 1, np.int64)]
 
-class BarnettModel(tm.TennisRankingModel):
-    '''
-    This is Barnett model.
-    '''
+    history_columns = ("ser", "ret", None)
 
-    def __init__(self, **kwargs):
+    @overrides(tm.TennisRankingModel)
+    def _history_values(self, rows):
         '''
-        Constructor.
+        Override function from superclass. Averages of serve and return win
+        percentages are recorded.
 
-        :return: void
+        :param rows: Numpy array of rows in player_rankings.
+        :return: Tuple of arrays (serve, return, sigma).
         '''
 
-        self.params = {}
-        self.params.update(kwargs)
-        super(self.__class__, self).__init__(**kwargs)
-        self.player_rankings = {}
-        self.name = "Barnett"
+        r = self.player_rankings
+        n = r["n"][rows]
+        return r["ser"][rows] / n, r["ret"][rows] / n, np.nan
 
     @overrides(tm.TennisRankingModel)
-    def run(self, data, verbose=False):
+    def _run_match(self, name1, name2, wsp1, wsp2, best_of):
         '''
         Override function from superclass.
 
-        :param data: Pandas dataframe on which to test model.
-        :return: void
+        :param name1: Winner of the match.
+        :param name2: Loser of the match.
+        :param wsp1: Serve win percentage of the winner.
+        :param wsp2: Serve win percentage of the loser.
+        :param best_of: How many sets were played at most.
+        :return: Tuple (win_prob, bet_amount).
         '''
 
         r = self.player_rankings
-        probabilities = []
-        bet_amount = []
 
-        for i, row in data.iterrows():
-            name1 = row["Winner"]
-            name2 = row["Loser"]
-            wsp1 = row["WSP1"]
-            wsp2 = row["WSP2"]
+        # If there is no data on serve win percentage, skip.
+        if math.isnan(wsp1) or math.isnan(wsp2):
+            return 0.5, 0
+
+        win_prob, p, q = self._predict(name1, name2, best_of)
+
+        w = r.row(name1)
+        l = r.row(name2)
+        ser = r["ser"]
+        ret = r["ret"]
+        n = r["n"]
 
-            # If there is no data on serve win percentage, skip.
-            if math.isnan(wsp1) or math.isnan(wsp2):
-                probabilities.append(0.5)
-                bet_amount.append(0)
-                continue
+        ser[w] += wsp1
+        ret[w] += 1.0 - wsp2
+        n[w] += 1
+        ser[l] += wsp2
+        ret[l] += 1.0 - wsp1
+        n[l] += 1
 
-            if not r.get(name1, False):
-                r[name1] = Player()
-            if not r.get(name2, False):
-                r[name2] = Player()
+        return win_prob, 1
 
-            s1, r1 = r[name1].get()
-            s2, r2 = r[name2].get()
+    @overrides(tm.TennisRankingModel)
+    def _predict(self, player1, player2, best_of, surface=None):
+        '''
+        Override function from superclass.
 
-            p = s1 + r2 - 0.4
-            q = s2 + r1 - 0.4
+        :param player1: First player.
+        :param player2: Second player.
+        :param best_of: How many sets are played at most.
+        :param surface: Not used.
+        :return: Tuple (win_prob, p, q).
+        '''
 
-            win_prob = calc.prob_win_match(p, q, row["Best_of"])
-            probabilities.append(win_prob)
-            bet_amount.append(1)
+        r = self.player_rankings
 
-            r[name1].add(wsp1, 1.0 - wsp2)
-            r[name2].add(wsp2, 1.0 - wsp1)
+        n1, n2 = r.value(player1, "n"), r.value(player2, "n")
+        s1, r1 = r.value(player1, "ser") / n1, r.value(player1, "ret") / n1
+        s2, r2 = r.value(player2, "ser") / n2, r.value(player2, "ret") / n2
 
-        self.player_rankings = r
+        p = s1 + r2 - 0.4
+        q = s2 + r1 - 0.4
 
-        if verbose:
-            sez = sorted([[rt.get()[0], rt.get()[1], key] for key, rt in r.iteritems()], key=lambda x: x[0]+x[1], reverse=True)
-            print '\n'.join(['{:>22s} {:8.5f} {:8.5f}'.format(p[2], p[0], p[1]) for p in sez[:20]]) + "\n\n"
+        return self.prob_win_match(p, q, best_of), p, q
 
-        df = data.copy()
-        df["win_prob"] = probabilities
-        df["bet_amount"] = bet_amount
+    @overrides(tm.TennisRankingModel)
+    def _finish_run(self, verbose=False):
+        '''
+        Override function from superclass.
 
-        return df
+        :param verbose: Log or not?
+        :return: void
+        '''
 
+        if verbose:
+            r = self.player_rankings
+            ser = r["ser"] / r["n"]
+            ret = r["ret"] / r["n"]
+            top_n = r.top_n(20, ser + ret)
+            sez = [[ser[r.get(key)], ret[r.get(key)], key] for key in top_n]
+            print '\n'.join(['{:>22s} {:8.5f} {:8.5f}'.format(str(p[2]), p[0], p[1]) for p in sez]) + "\n\n"
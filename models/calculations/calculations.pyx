@@ -18,12 +18,14 @@ __author__ = 'riko'
 import random
 
 import numpy as np
+from scipy.special import erfinv
 
 cimport numpy as np
 cimport cython
-
-DTYPE = np.int
-ctypedef np.int_t DTYPE_t
+from cython.parallel cimport prange
+from libc.math cimport INFINITY, M_PI, NAN, sqrt
+from libc.stdint cimport uint64_t
+from libc.stdlib cimport abs
 
 
 ################################################################################
@@ -31,7 +33,7 @@ ctypedef np.int_t DTYPE_t
 ################################################################################
 
 
-cdef double prob_win_game(double p):
+cdef double prob_win_game(double p) nogil:
     '''
     Probability of player winning game.
 
@@ -55,7 +57,66 @@ def _prob_win_game(double p):
     return p**4 * ( 15 - 4 * p - (10 * p**2)/den )
 
 
-cdef two_adventage(double p, double q):
+# Coefficients of tiebreaker and set probability polynomials, flat C arrays
+# with 6 values per row. Row of TIEBREAKER_TABLE is (coefficient, power of p,
+# power of 1-p, power of 1-q, power of q, power of two_adventage), row of
+# SET_TABLE is same for game probabilities gp, gq and gt.
+cdef long TIEBREAKER_TABLE[168]
+TIEBREAKER_TABLE[:] = [1, 3, 0, 4, 0, 0,
+                       3, 3, 1, 4, 0, 0,
+                       4, 4, 0, 3, 1, 0,
+                       6, 3, 2, 4, 0, 0,
+                       16, 4, 1, 3, 1, 0,
+                       6, 5, 0, 2, 2, 0,
+                       10, 2, 3, 5, 0, 0,
+                       40, 3, 2, 4, 1, 0,
+                       30, 4, 1, 3, 2, 0,
+                       4, 5, 0, 2, 3, 0,
+                       5, 1, 4, 6, 0, 0,
+                       50, 2, 3, 5, 1, 0,
+                       100, 3, 2, 4, 2, 0,
+                       50, 4, 1, 3, 3, 0,
+                       5, 5, 0, 2, 4, 0,
+                       1, 1, 5, 6, 0, 0,
+                       30, 2, 4, 5, 1, 0,
+                       150, 3, 3, 4, 2, 0,
+                       200, 4, 2, 3, 3, 0,
+                       75, 5, 1, 2, 4, 0,
+                       6, 6, 0, 1, 5, 0,
+                       1, 0, 6, 6, 0, 1,
+                       36, 1, 5, 5, 1, 1,
+                       225, 2, 4, 4, 2, 1,
+                       400, 3, 3, 3, 3, 1,
+                       225, 4, 2, 2, 4, 1,
+                       36, 5, 1, 1, 5, 1,
+                       1, 6, 0, 0, 6, 1]
+
+cdef long SET_TABLE[126]
+SET_TABLE[:] = [1, 3, 0, 3, 0, 0,
+                3, 3, 1, 3, 0, 0,
+                3, 4, 0, 2, 1, 0,
+                6, 2, 2, 4, 0, 0,
+                12, 3, 1, 3, 1, 0,
+                3, 4, 0, 2, 2, 0,
+                4, 2, 3, 4, 0, 0,
+                24, 3, 2, 3, 1, 0,
+                24, 4, 1, 2, 2, 0,
+                4, 5, 0, 1, 3, 0,
+                5, 1, 4, 5, 0, 0,
+                40, 2, 3, 4, 1, 0,
+                60, 3, 2, 3, 2, 0,
+                20, 4, 1, 2, 3, 0,
+                1, 5, 0, 1, 4, 0,
+                1, 0, 5, 5, 0, 1,
+                25, 1, 4, 4, 1, 1,
+                100, 2, 3, 3, 2, 1,
+                100, 3, 2, 2, 3, 1,
+                25, 4, 1, 1, 4, 1,
+                1, 5, 0, 0, 5, 1]
+
+
+@cython.profile(False)
+cdef inline double two_adventage(double p, double q) nogil:
     '''
     Probability for winning tiebreak from 6-6
 
@@ -69,8 +130,24 @@ cdef two_adventage(double p, double q):
     return nom / den
 
 
-@cython.boundscheck(False)
-cdef prob_win_tiebreaker(double p, double q):
+@cython.profile(False)
+cdef inline void fill_powers(double x, double *powers, int n) nogil:
+    '''
+    Powers of x, so polynomials below look them up instead of calling pow
+    for every term.
+
+    :param x: Base.
+    :param powers: Array of at least n doubles, filled with x**0 ... x**(n-1).
+    :param n: Number of powers.
+    :return: void
+    '''
+
+    cdef int k
+    for k in range(n):
+        powers[k] = x ** k
+
+
+cdef double prob_win_tiebreaker(double p, double q) nogil:
     '''
     Probability of winning tiebreaker (when set is 6-6)
 
@@ -79,49 +156,27 @@ cdef prob_win_tiebreaker(double p, double q):
     :return: Probability of player1 winning the tiebreaker.
     '''
 
-    cdef np.ndarray[DTYPE_t, ndim=2] A = np.array([
-                                                [1, 3, 0, 4, 0, 0],
-                                                [3, 3, 1, 4, 0, 0],
-                                                [4, 4, 0, 3, 1, 0],
-                                                [6, 3, 2, 4, 0, 0],
-                                                [16, 4, 1, 3, 1, 0],
-                                                [6, 5, 0, 2, 2, 0],
-                                                [10, 2, 3, 5, 0, 0],
-                                                [40, 3, 2, 4, 1, 0],
-                                                [30, 4, 1, 3, 2, 0],
-                                                [4, 5, 0, 2, 3, 0],
-                                                [5, 1, 4, 6, 0, 0],
-                                                [50, 2, 3, 5, 1, 0],
-                                                [100, 3, 2, 4, 2, 0],
-                                                [50, 4, 1, 3, 3, 0],
-                                                [5, 5, 0, 2, 4, 0],
-                                                [1, 1, 5, 6, 0, 0],
-                                                [30, 2, 4, 5, 1, 0],
-                                                [150, 3, 3, 4, 2, 0],
-                                                [200, 4, 2, 3, 3, 0],
-                                                [75, 5, 1, 2, 4, 0],
-                                                [6, 6, 0, 1, 5, 0],
-                                                [1, 0, 6, 6, 0, 1],
-                                                [36, 1, 5, 5, 1, 1],
-                                                [225, 2, 4, 4, 2, 1],
-                                                [400, 3, 3, 3, 3, 1],
-                                                [225, 4, 2, 2, 4, 1],
-                                                [36, 5, 1, 1, 5, 1],
-                                                [1, 6, 0, 0, 6, 1]
-                                                    ], dtype=DTYPE)
-
-    cdef double d = two_adventage(p, q)
-    cdef Py_ssize_t i;
+    cdef double pw[7]
+    cdef double pl[7]
+    cdef double ql[7]
+    cdef double qw[7]
+    cdef double dw[2]
+    cdef long *A = TIEBREAKER_TABLE
+    cdef Py_ssize_t i
     cdef double result = 0.
 
-    with nogil:
-        for i in xrange(28):
-            result += A[i, 0]*p**A[i, 1]*(1.-p)**A[i, 2]*(1.-q)**A[i, 3]*(q)**A[i, 4]*d**A[i, 5]
+    fill_powers(p, pw, 7)
+    fill_powers(1. - p, pl, 7)
+    fill_powers(1. - q, ql, 7)
+    fill_powers(q, qw, 7)
+    fill_powers(two_adventage(p, q), dw, 2)
+
+    for i in range(0, 168, 6):
+        result += A[i]*pw[A[i+1]]*pl[A[i+2]]*ql[A[i+3]]*qw[A[i+4]]*dw[A[i+5]]
 
     return result
 
 
-@cython.boundscheck(False)
 def _prob_win_tiebreaker(double p, double q):
     '''
     Probability of winning tiebreaker (when set is 6-6)
@@ -131,50 +186,10 @@ def _prob_win_tiebreaker(double p, double q):
     :return: Probability of player1 winning the tiebreaker.
     '''
 
-    cdef np.ndarray[DTYPE_t, ndim=2] A = np.array([
-        [1, 3, 0, 4, 0, 0],
-        [3, 3, 1, 4, 0, 0],
-        [4, 4, 0, 3, 1, 0],
-        [6, 3, 2, 4, 0, 0],
-        [16, 4, 1, 3, 1, 0],
-        [6, 5, 0, 2, 2, 0],
-        [10, 2, 3, 5, 0, 0],
-        [40, 3, 2, 4, 1, 0],
-        [30, 4, 1, 3, 2, 0],
-        [4, 5, 0, 2, 3, 0],
-        [5, 1, 4, 6, 0, 0],
-        [50, 2, 3, 5, 1, 0],
-        [100, 3, 2, 4, 2, 0],
-        [50, 4, 1, 3, 3, 0],
-        [5, 5, 0, 2, 4, 0],
-        [1, 1, 5, 6, 0, 0],
-        [30, 2, 4, 5, 1, 0],
-        [150, 3, 3, 4, 2, 0],
-        [200, 4, 2, 3, 3, 0],
-        [75, 5, 1, 2, 4, 0],
-        [6, 6, 0, 1, 5, 0],
-        [1, 0, 6, 6, 0, 1],
-        [36, 1, 5, 5, 1, 1],
-        [225, 2, 4, 4, 2, 1],
-        [400, 3, 3, 3, 3, 1],
-        [225, 4, 2, 2, 4, 1],
-        [36, 5, 1, 1, 5, 1],
-        [1, 6, 0, 0, 6, 1]
-    ], dtype=DTYPE)
-
-    cdef double d = two_adventage(p, q)
-    cdef Py_ssize_t i;
-    cdef double result = 0.
-
-    with nogil:
-        for i in xrange(28):
-            result += A[i, 0]*p**A[i, 1]*(1.-p)**A[i, 2]*(1.-q)**A[i, 3]*(q)**A[i, 4]*d**A[i, 5]
-
-    return result
+    return prob_win_tiebreaker(p, q)
 
 
-@cython.boundscheck(False)
-cdef double prob_win_set(double p, double q):
+cdef double prob_win_set(double p, double q) nogil:
     '''
     Probability of winning set.
 
@@ -183,46 +198,32 @@ cdef double prob_win_set(double p, double q):
     :return: Probability of player1 winning the set.
     '''
 
-    cdef np.ndarray[DTYPE_t, ndim=2] G = np.array([
-                                                [1, 3, 0, 3, 0, 0],
-                                                [3, 3, 1, 3, 0, 0],
-                                                [3, 4, 0, 2, 1, 0],
-                                                [6, 2, 2, 4, 0, 0],
-                                                [12, 3, 1, 3, 1, 0],
-                                                [3, 4, 0, 2, 2, 0],
-                                                [4, 2, 3, 4, 0, 0],
-                                                [24, 3, 2, 3, 1, 0],
-                                                [24, 4, 1, 2, 2, 0],
-                                                [4, 5, 0, 1, 3, 0],
-                                                [5, 1, 4, 5, 0, 0],
-                                                [40, 2, 3, 4, 1, 0],
-                                                [60, 3, 2, 3, 2, 0],
-                                                [20, 4, 1, 2, 3, 0],
-                                                [1, 5, 0, 1, 4, 0],
-                                                [1, 0, 5, 5, 0, 1],
-                                                [25, 1, 4, 4, 1, 1],
-                                                [100, 2, 3, 3, 2, 1],
-                                                [100, 3, 2, 2, 3, 1],
-                                                [25, 4, 1, 1, 4, 1],
-                                                [1, 5, 0, 0, 5, 1]
-                                                    ], dtype=DTYPE)
-
     cdef double gp = prob_win_game(p)
     cdef double gq = prob_win_game(q)
     cdef double tb = prob_win_tiebreaker(p, q)
     cdef double gt = gp * (1 - gq) + tb * ( gp * gq + (1 - gp) * (1 - gq) )
 
+    cdef double gpw[6]
+    cdef double gpl[6]
+    cdef double gql[6]
+    cdef double gqw[6]
+    cdef double gtw[2]
+    cdef long *G = SET_TABLE
     cdef Py_ssize_t i
-
     cdef double total = 0.
-    with nogil:
-        for i in xrange(21):
-            total += G[i, 0]*gp**G[i, 1]*(1-gp)**G[i, 2]*(1-gq)**G[i, 3]*gq**G[i, 4]*gt**G[i,5]
+
+    fill_powers(gp, gpw, 6)
+    fill_powers(1 - gp, gpl, 6)
+    fill_powers(1 - gq, gql, 6)
+    fill_powers(gq, gqw, 6)
+    fill_powers(gt, gtw, 2)
+
+    for i in range(0, 126, 6):
+        total += G[i]*gpw[G[i+1]]*gpl[G[i+2]]*gql[G[i+3]]*gqw[G[i+4]]*gtw[G[i+5]]
 
     return total
 
 
-@cython.boundscheck(False)
 def _prob_win_set(double p, double q):
     '''
     Probability of winning set.
@@ -232,152 +233,303 @@ def _prob_win_set(double p, double q):
     :return: Probability of player1 winning the set.
     '''
 
-    cdef np.ndarray[DTYPE_t, ndim=2] G = np.array([
-        [1, 3, 0, 3, 0, 0],
-        [3, 3, 1, 3, 0, 0],
-        [3, 4, 0, 2, 1, 0],
-        [6, 2, 2, 4, 0, 0],
-        [12, 3, 1, 3, 1, 0],
-        [3, 4, 0, 2, 2, 0],
-        [4, 2, 3, 4, 0, 0],
-        [24, 3, 2, 3, 1, 0],
-        [24, 4, 1, 2, 2, 0],
-        [4, 5, 0, 1, 3, 0],
-        [5, 1, 4, 5, 0, 0],
-        [40, 2, 3, 4, 1, 0],
-        [60, 3, 2, 3, 2, 0],
-        [20, 4, 1, 2, 3, 0],
-        [1, 5, 0, 1, 4, 0],
-        [1, 0, 5, 5, 0, 1],
-        [25, 1, 4, 4, 1, 1],
-        [100, 2, 3, 3, 2, 1],
-        [100, 3, 2, 2, 3, 1],
-        [25, 4, 1, 1, 4, 1],
-        [1, 5, 0, 0, 5, 1]
-    ], dtype=DTYPE)
+    return prob_win_set(p, q)
 
-    cdef double gp = prob_win_game(p)
-    cdef double gq = prob_win_game(q)
-    cdef double tb = prob_win_tiebreaker(p, q)
-    cdef double gt = gp * (1 - gq) + tb * ( gp * gq + (1 - gp) * (1 - gq) )
 
+################################################################################
+#     Random numbers.                                                          #
+################################################################################
+
+
+# Generator is xoshiro256** (Blackman and Vigna). Its state is 4 64-bit
+# words, seeded with splitmix64. Independent streams are made with jump,
+# which advances state by 2^128 numbers.
+cdef struct rng_state:
+    uint64_t s[4]
+
+
+cdef uint64_t RNG_JUMP[4]
+RNG_JUMP[:] = [0x180ec6d33cfd0abaULL, 0xd5a61266f0c9392cULL,
+               0xa9582618e03fc9aaULL, 0x39abdc4529b1661cULL]
+
+
+@cython.profile(False)
+cdef inline uint64_t rotl(uint64_t x, int k) nogil:
+    '''
+    Rotates bits of x left.
+
+    :param x: 64-bit word.
+    :param k: Number of bits.
+    :return: Rotated word.
+    '''
+
+    return (x << k) | (x >> (64 - k))
+
+
+@cython.profile(False)
+cdef inline uint64_t splitmix64(uint64_t *x) nogil:
+    '''
+    Next number of splitmix64 generator, used for seeding.
+
+    :param x: State of splitmix64, advanced in place.
+    :return: Random 64-bit word.
+    '''
+
+    cdef uint64_t z
+    x[0] += 0x9e3779b97f4a7c15ULL
+    z = x[0]
+    z = (z ^ (z >> 30)) * 0xbf58476d1ce4e5b9ULL
+    z = (z ^ (z >> 27)) * 0x94d049bb133111ebULL
+    return z ^ (z >> 31)
+
+
+@cython.profile(False)
+cdef inline uint64_t rng_next(rng_state *rng) nogil:
+    '''
+    Next number of xoshiro256** generator.
+
+    :param rng: Generator state, advanced in place.
+    :return: Random 64-bit word.
+    '''
+
+    cdef uint64_t *s = rng.s
+    cdef uint64_t result = rotl(s[1] * 5, 7) * 9
+    cdef uint64_t t = s[1] << 17
+
+    s[2] ^= s[0]
+    s[3] ^= s[1]
+    s[1] ^= s[2]
+    s[0] ^= s[3]
+    s[2] ^= t
+    s[3] = rotl(s[3], 45)
+
+    return result
+
+
+@cython.profile(False)
+cdef inline double rng_random(rng_state *rng) nogil:
+    '''
+    Uniform random number from [0, 1), same as random.random.
+
+    :param rng: Generator state, advanced in place.
+    :return: Random double with 53 random bits.
+    '''
+
+    return (rng_next(rng) >> 11) * (1.0 / 9007199254740992.0)
+
+
+@cython.profile(False)
+cdef void rng_seed(rng_state *rng, uint64_t seed) nogil:
+    '''
+    Seeds generator.
+
+    :param rng: Generator state to fill.
+    :param seed: Seed.
+    :return: void
+    '''
+
+    cdef int i
+    for i in range(4):
+        rng.s[i] = splitmix64(&seed)
+
+
+@cython.profile(False)
+cdef void rng_jump(rng_state *rng) nogil:
+    '''
+    Advances generator by 2^128 numbers, so the skipped numbers can be used
+    by another, independent stream.
+
+    :param rng: Generator state, advanced in place.
+    :return: void
+    '''
+
+    cdef uint64_t s[4]
+    cdef int i, b
+
+    s[0] = s[1] = s[2] = s[3] = 0
+    for i in range(4):
+        for b in range(64):
+            if RNG_JUMP[i] & (1ULL << b):
+                s[0] ^= rng.s[0]
+                s[1] ^= rng.s[1]
+                s[2] ^= rng.s[2]
+                s[3] ^= rng.s[3]
+            rng_next(rng)
+
+    rng.s[0] = s[0]
+    rng.s[1] = s[1]
+    rng.s[2] = s[2]
+    rng.s[3] = s[3]
+
+
+def _rng_numbers(state, Py_ssize_t n):
+    '''
+    Numbers of xoshiro256** generator from given state.
+
+    :param state: 4 64-bit words of state.
+    :param n: How many numbers.
+    :return: Numpy array of n uint64.
+    '''
+
+    cdef rng_state rng
+    cdef np.ndarray[np.uint64_t, ndim=1] numbers = np.empty(n, dtype=np.uint64)
     cdef Py_ssize_t i
 
-    cdef double total = 0.
-    with nogil:
-        for i in xrange(21):
-            total += G[i, 0]*gp**G[i, 1]*(1-gp)**G[i, 2]*(1-gq)**G[i, 3]*gq**G[i, 4]*gt**G[i,5]
+    for i in range(4):
+        rng.s[i] = <uint64_t>state[i]
+    for i in range(n):
+        numbers[i] = rng_next(&rng)
 
-    return total
+    return numbers
 
 
-@cython.boundscheck(False)
-cdef int sim_game(double p):
+################################################################################
+#     Simulation.                                                              #
+################################################################################
+
+
+@cython.profile(False)
+cdef int sim_game(double p, rng_state *rng, int *points) nogil:
     '''
     Simulate game.
 
-    :param p: Probability of player 1 winning on serve.
-    :return: Hashed info on result and points played.
+    :param p: Probability of player 1 winning a point of the game.
+    :param rng: Random generator.
+    :param points: Number of points played, increased in place.
+    :return: 1 if player 1 won the game, else 0.
     '''
 
-    cdef double r
     cdef int a = 0
     cdef int b = 0
 
+    cdef int r
+
     while (a<4 and b<4) or abs(a-b)<2:
-        r = random.random()
-        if r < p: a += 1
-        else: b += 1
+        r = rng_random(rng) < p
+        a += r
+        b += 1 - r
 
-    return 1000*(a>b)+a+b
+    points[0] += a + b
+    return a > b
 
 
-@cython.boundscheck(False)
-cdef sim_tiebreaker(double p, double q):
+@cython.profile(False)
+cdef int sim_tiebreaker(double p, double q, rng_state *rng, int *points) nogil:
     '''
     Simulate tiebreaker.
 
     :param p: Probability of player 1 winning on serve.
     :param q: Probability of player 2 winning on serve.
-    :return: Hashed info on result and points played.
+    :param rng: Random generator.
+    :param points: Number of points played, increased in place.
+    :return: 1 if player 1 won the tiebreaker, else 0.
     '''
 
-    cdef double r
+    cdef int r
     cdef int a = 0
     cdef int b = 0
 
     while (a<7 and b<7) or abs(a-b)<2:
-        r = random.random()
+        # Player 1 serves first point, then players change after every
+        # two points.
         if ((a+b+1)/2)%2==0:
-            if r<p: a += 1
-            else: b += 1
+            r = rng_random(rng) < p
         else:
-            if r<q: b += 1
-            else: a += 1
+            r = rng_random(rng) >= q
+        a += r
+        b += 1 - r
 
-    return 1000*(a>b)+a+b
+    points[0] += a + b
+    return a > b
 
 
-@cython.boundscheck(False)
-cdef int sim_set(double p, double q):
+@cython.profile(False)
+cdef int sim_set(double p, double q, rng_state *rng, int *points, int *games) nogil:
     '''
     Simulate set.
 
     :param p: Probability of player 1 winning on serve.
     :param q: Probability of player 2 winning on serve.
-    :return: Hashed info on result and points played.
+    :param rng: Random generator.
+    :param points: Number of points played, increased in place.
+    :param games: Number of games played, increased in place.
+    :return: 1 if player 1 won the set, else 0.
     '''
 
-    cdef int temp
     cdef int a = 0
     cdef int b = 0
-    cdef int s = 0
-    cdef int r, result
+    cdef int r
 
     while a <= 6 and b <= 6:
         if (a==6 or b==6) and abs(a-b)>=2:
             break
 
         if a == b == 6:
-            temp = sim_tiebreaker(p, q)
+            r = sim_tiebreaker(p, q, rng, points)
         else:
-            temp = sim_game(p) if (a+b)%2==0 else sim_game(1.0 - q)
+            r = sim_game(p, rng, points) if (a+b)%2==0 else sim_game(1.0 - q, rng, points)
 
-        result, serve = temp/1000, temp%1000
-        s += serve
-        r = 1 if result else 0
         a += r
         b += (1 - r)
 
-    return 1000*(a>b)+s
+    games[0] += a + b
+    return a > b
 
 
-@cython.boundscheck(False)
-cdef int sim_match(double p, double q, int best_of):
+@cython.profile(False)
+cdef int sim_match(double p, double q, int best_of, rng_state *rng,
+                   int *points, int *games, int *sets) nogil:
     '''
     Simulate match.
 
     :param p: Probability of player 1 winning on serve.
     :param q: Probability of player 2 winning on serve.
     :param best_of: How many sets are played.
-    :return: Hashed info on result and points played.
+    :param rng: Random generator.
+    :param points: Number of points played, increased in place.
+    :param games: Number of games played, increased in place.
+    :param sets: Number of sets played, increased in place.
+    :return: 1 if player 1 won the match, else 0.
     '''
 
     cdef int win_result = (best_of + 1) / 2
     cdef int a = 0
     cdef int b = 0
-    cdef int s = 0
-    cdef int result, serve
+    cdef int r
 
     while a < win_result and b < win_result:
-        temp = sim_set(p, q)
-        result, serve = temp/1000, temp%1000
-        s += serve
-        r = 1 if result else 0
+        r = sim_set(p, q, rng, points, games)
         a += r
         b += (1 - r)
 
-    return 1000*(a>b)+s
+    sets[0] += a + b
+    return a > b
+
+
+################################################################################
+#     C-level functions (no GIL).                                              #
+################################################################################
+
+
+cdef double c_prob_win_match(double p, double q, int best_of) nogil:
+    '''
+    Same as prob_win_match, callable without GIL.
+
+    :param p: Probability of player1 winning serve point.
+    :param q: Probability of player2 winning serve point.
+    :param best_of: On how many sets is match decided.
+    :return: Probability of player1 winning the match or NaN if best_of
+             is not 3 or 5.
+    '''
+
+    cdef double s = prob_win_set(p, q)
+
+    if best_of == 3:
+        return s**2 * (1 + 2 * (1-s))
+    elif best_of == 5:
+        return s**3 * (1 + 3 * (1-s) + 6 * (1-s)**2)
+
+    return NAN
 
 
 ################################################################################
@@ -404,8 +556,188 @@ def prob_win_match(double p, double q, best_of=3):
         return s**3 * (1 + 3 * (1-s) + 6 * (1-s)**2)
 
 
+# Simulated matches are split into chunks of SIM_CHUNK matches, every chunk
+# uses its own random stream. Results depend only on seed, not on number of
+# threads.
+SIM_CHUNK = 4096
+
+
 @cython.boundscheck(False)
-def monte_carlo_match(double p, double q, int best_of=3, int N=100000):
+@cython.wraparound(False)
+cdef simulate(double p, double q, int best_of, Py_ssize_t N, rng_state *rng):
+    '''
+    Simulates N matches, see simulate_matches.
+
+    :param p: Probability of player 1 winning on serve.
+    :param q: Probability of player 2 winning on serve.
+    :param best_of: How many sets are played.
+    :param N: How many matches to simulate.
+    :param rng: Random generator. Every chunk gets its own stream, rng is
+                advanced past all of them, so next call continues with
+                fresh streams.
+    :return: Tuple of numpy arrays (winners, points, games, sets).
+    '''
+
+    cdef Py_ssize_t n_chunks = (N + SIM_CHUNK - 1) / SIM_CHUNK
+    cdef Py_ssize_t chunk = SIM_CHUNK
+    cdef np.ndarray[np.uint64_t, ndim=2, mode="c"] states = np.empty((n_chunks, 4), dtype=np.uint64)
+    cdef np.ndarray[np.int8_t, ndim=1] winners = np.zeros(N, dtype=np.int8)
+    cdef np.ndarray[np.int32_t, ndim=1] points = np.zeros(N, dtype=np.int32)
+    cdef np.ndarray[np.int32_t, ndim=1] games = np.zeros(N, dtype=np.int32)
+    cdef np.ndarray[np.int32_t, ndim=1] sets = np.zeros(N, dtype=np.int32)
+    cdef rng_state *chunk_rng
+    cdef Py_ssize_t c, i, end
+
+    for c in range(n_chunks):
+        states[c, 0] = rng.s[0]
+        states[c, 1] = rng.s[1]
+        states[c, 2] = rng.s[2]
+        states[c, 3] = rng.s[3]
+        rng_jump(rng)
+
+    for c in prange(n_chunks, nogil=True, schedule="dynamic"):
+        chunk_rng = <rng_state *>&states[c, 0]
+        end = min((c + 1) * chunk, N)
+        for i in range(c * chunk, end):
+            winners[i] = sim_match(p, q, best_of, chunk_rng, <int *>&points[i],
+                                   <int *>&games[i], <int *>&sets[i])
+
+    return winners, points, games, sets
+
+
+def _check_probabilities(double p, double q):
+    '''
+    Simulation never ends for some p and q (e.g. tiebreaker with p = q = 1).
+
+    :param p: Probability of player 1 winning on serve.
+    :param q: Probability of player 2 winning on serve.
+    :return: void
+    '''
+
+    if not (0 < p < 1 and 0 < q < 1):
+        raise ValueError("Probabilities p and q must be between 0 and 1!")
+
+
+def simulate_matches(double p, double q, int best_of=3, Py_ssize_t N=100000, seed=None):
+    '''
+    Monte carlo simulation of N matches. Chunks of matches are simulated in
+    parallel without GIL.
+
+    :param p: Probability of player 1 winning on serve.
+    :param q: Probability of player 2 winning on serve.
+    :param best_of: How many sets are played.
+    :param N: How many matches to simulate.
+    :param seed: Seed of random generator (non negative integer), same seed
+                 gives same matches. None means random seed.
+    :return: Tuple of numpy arrays (winners, points, games, sets) with one
+             element per match. Winner is 1 if player 1 won, else 0.
+    '''
+
+    _check_probabilities(p, q)
+
+    if seed is None:
+        seed = random.getrandbits(64)
+
+    cdef rng_state rng
+    rng_seed(&rng, <uint64_t>seed)
+
+    return simulate(p, q, best_of, N, &rng)
+
+
+def monte_carlo_adaptive(double p, double q, int best_of=3, win_error=None, points_error=None,
+                         confidence=None, Py_ssize_t batch=16384, Py_ssize_t max_N=10000000,
+                         seed=None):
+    '''
+    Monte carlo simulation that stops as soon as estimates are precise
+    enough. Matches are simulated in batches (in parallel, see
+    simulate_matches) until standard errors of win rate and of mean number
+    of points are at most win_error and points_error. Lopsided matches need
+    far fewer samples than even ones.
+
+    Batch is rounded up to a multiple of SIM_CHUNK, so first N matches are
+    same as simulate_matches(p, q, best_of, N, seed).
+
+    :param p: Probability of player 1 winning on serve.
+    :param q: Probability of player 2 winning on serve.
+    :param best_of: How many sets are played (3 or 5).
+    :param win_error: Positive target error of win rate or None. Error of
+                      win rate is Agresti-Coull standard error, from
+                      (wins + 2) / (N + 4), so it is never 0.
+    :param points_error: Positive target error of mean number of points or
+                         None.
+    :param confidence: If given (between 0 and 1, e.g. 0.95), targets are half widths of
+                       normal confidence intervals with this confidence
+                       instead of standard errors.
+    :param batch: Number of matches simulated between checks.
+    :param max_N: Largest number of matches (at least 1), simulation stops
+                  there even if targets are not met.
+    :param seed: Seed of random generator, see simulate_matches.
+    :return: Dictionary with win (win rate of player 1), win_error, points
+             (mean number of points), points_error (achieved errors, same
+             kind as targets), N (number of simulated matches) and
+             converged (False if max_N was reached first).
+    '''
+
+    _check_probabilities(p, q)
+
+    if best_of != 3 and best_of != 5:
+        raise ValueError("Matches are played on best of 3 or 5 sets, not %d!" % best_of)
+
+    if max_N < 1:
+        raise ValueError("At least one match must be simulated, max_N is %d!" % max_N)
+
+    if win_error is None and points_error is None:
+        raise ValueError("Give win_error, points_error or both!")
+
+    for name, target in [("win_error", win_error), ("points_error", points_error)]:
+        if target is not None and not target > 0:
+            raise ValueError("Target %s must be positive, not %s!" % (name, target))
+
+    if confidence is not None and not 0 < confidence < 1:
+        raise ValueError("Confidence must be between 0 and 1, not %s!" % confidence)
+
+    if seed is None:
+        seed = random.getrandbits(64)
+
+    # Standard errors are multiplied by z to get half widths.
+    z = 1.0 if confidence is None else sqrt(2.0) * erfinv(confidence)
+    batch = ((max(batch, 1) + SIM_CHUNK - 1) / SIM_CHUNK) * SIM_CHUNK
+
+    cdef rng_state rng
+    rng_seed(&rng, <uint64_t>seed)
+
+    cdef Py_ssize_t n = 0
+    cdef double wins = 0., total = 0., total_sq = 0.
+    cdef double win = NAN, mean = NAN, win_err = INFINITY, mean_err = INFINITY
+    cdef double adjusted
+
+    converged = False
+    while n < max_N:
+        winners, points, games, sets = simulate(p, q, best_of, min(batch, max_N - n), &rng)
+        points = points.astype(np.float64)
+        n += len(winners)
+        wins += winners.sum()
+        total += points.sum()
+        total_sq += np.dot(points, points)
+
+        win = wins / n
+        mean = total / n
+        # Agresti-Coull error, (wins + 2) / (n + 4) is never 0 or 1, so a
+        # batch with no wins (or no losses) does not claim zero error.
+        adjusted = (wins + 2.) / (n + 4.)
+        win_err = z * sqrt(adjusted * (1. - adjusted) / (n + 4.))
+        mean_err = z * sqrt(max(total_sq - n * mean * mean, 0.) / (n - 1) / n) if n > 1 else INFINITY
+
+        if ((win_error is None or win_err <= win_error) and
+                (points_error is None or mean_err <= points_error)):
+            converged = True
+            break
+
+    return {"win": win, "win_error": win_err, "points": mean, "points_error": mean_err,
+            "N": n, "converged": converged}
+
+
+def monte_carlo_match(double p, double q, int best_of=3, int N=100000, seed=None):
     '''
     Make monte carlo simulation that calculates expected result and number
     of points played (this can be used to estimate length of match).
@@ -414,31 +746,30 @@ def monte_carlo_match(double p, double q, int best_of=3, int N=100000):
     :param q: Probability of player 2 winning on serve.
     :param best_of: How many sets are played.
     :param N: How many runs of MC shall we do.
+    :param seed: Seed of random generator, see simulate_matches.
     :return: (result, serve), expected result and number of points played.
+             See monte_carlo_adaptive for simulation with given precision.
     '''
 
-    r = [sim_match(p, q, best_of) for i in xrange(N)]
-    result = 1.0 * sum(map(lambda x: x/1000, r)) / N
-    serve = 1.0 * sum(map(lambda x: x%1000, r)) / N
-    return result, serve
+    winners, points, games, sets = simulate_matches(p, q, best_of, N, seed)
+    return winners.mean(), points.mean()
 
 
-@cython.boundscheck(False)
-def monte_carlo_points_list(double p, double q, int best_of=3, int N=10000):
+def monte_carlo_points_list(double p, double q, int best_of=3, int N=10000, seed=None):
     '''
-    Make monte carlo simulation that calculates expected result and number
-    of points played (this can be used to estimate length of match).
+    Make monte carlo simulation that calculates number of points played
+    in every match (this can be used to estimate length of match).
 
     :param p: Probability of player 1 winning on serve.
     :param q: Probability of player 2 winning on serve.
     :param best_of: How many sets are played.
     :param N: How many runs of MC shall we do.
-    :return: (result, serve), list of results and list of poinst played
+    :param seed: Seed of random generator, see simulate_matches.
+    :return: Numpy array of points played.
     '''
 
-    r = [sim_match(p, q, best_of) for i in xrange(N)]
-    serve = map(lambda x: x%1000, r)
-    return serve
+    winners, points, games, sets = simulate_matches(p, q, best_of, N, seed)
+    return points
 
 
 @cython.boundscheck(False)
@@ -474,3 +805,570 @@ def smooth_time_series_mov(np.ndarray[np.float64_t, ndim=1] input, int k):
         if i>=k: sum -= input[i - k]
         n_array[i] = sum / (i+1 if i<k else k)
     return n_array
+
+
+################################################################################
+#     Batch functions (parallel, no GIL).                                      #
+################################################################################
+
+
+def _batch_arrays(*arrays):
+    '''
+    Broadcasts arguments of a batch function against each other.
+
+    :param arrays: Scalars or array likes.
+    :return: Tuple (shape, list of contiguous 1D float64 arrays).
+    '''
+
+    arrays = np.broadcast_arrays(*[np.asarray(a, dtype=np.float64) for a in arrays])
+    return arrays[0].shape, [np.ascontiguousarray(a).ravel() for a in arrays]
+
+
+def _batch_out(shape, out):
+    '''
+    Output array of a batch function.
+
+    :param shape: Shape of broadcast arguments.
+    :param out: Array to fill or None for a new one.
+    :return: Contiguous 1D float64 array (view of out if given).
+    '''
+
+    if out is None:
+        return np.empty(shape, dtype=np.float64).ravel()
+
+    if out.dtype != np.float64 or out.shape != shape or not out.flags.c_contiguous:
+        raise ValueError("Output array must be C contiguous float64 array of shape %s!" % (shape,))
+
+    return out.reshape(-1)
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def _prob_win_game_batch(p, out=None):
+    '''
+    Vectorized _prob_win_game, elements are computed in parallel.
+
+    :param p: Array of probabilities of player winning point.
+    :param out: Optional C contiguous float64 array for the result.
+    :return: Array of probabilities of player winning game.
+    '''
+
+    shape, (p,) = _batch_arrays(p)
+    result = _batch_out(shape, out)
+
+    cdef np.ndarray[np.float64_t, ndim=1, mode="c"] pv = p
+    cdef np.ndarray[np.float64_t, ndim=1, mode="c"] rv = result
+    cdef Py_ssize_t i, n = pv.shape[0]
+
+    for i in prange(n, nogil=True, schedule="static"):
+        rv[i] = prob_win_game(pv[i])
+
+    return result.reshape(shape)
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def _prob_win_tiebreaker_batch(p, q, out=None):
+    '''
+    Vectorized _prob_win_tiebreaker, elements are computed in parallel.
+
+    :param p: Array of probabilities of player1 winning serve point.
+    :param q: Array of probabilities of player2 winning serve point.
+    :param out: Optional C contiguous float64 array for the result.
+    :return: Array of probabilities of player1 winning the tiebreaker.
+    '''
+
+    shape, (p, q) = _batch_arrays(p, q)
+    result = _batch_out(shape, out)
+
+    cdef np.ndarray[np.float64_t, ndim=1, mode="c"] pv = p
+    cdef np.ndarray[np.float64_t, ndim=1, mode="c"] qv = q
+    cdef np.ndarray[np.float64_t, ndim=1, mode="c"] rv = result
+    cdef Py_ssize_t i, n = pv.shape[0]
+
+    for i in prange(n, nogil=True, schedule="static"):
+        rv[i] = prob_win_tiebreaker(pv[i], qv[i])
+
+    return result.reshape(shape)
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def _prob_win_set_batch(p, q, out=None):
+    '''
+    Vectorized _prob_win_set, elements are computed in parallel.
+
+    :param p: Array of probabilities of player1 winning serve point.
+    :param q: Array of probabilities of player2 winning serve point.
+    :param out: Optional C contiguous float64 array for the result.
+    :return: Array of probabilities of player1 winning the set.
+    '''
+
+    shape, (p, q) = _batch_arrays(p, q)
+    result = _batch_out(shape, out)
+
+    cdef np.ndarray[np.float64_t, ndim=1, mode="c"] pv = p
+    cdef np.ndarray[np.float64_t, ndim=1, mode="c"] qv = q
+    cdef np.ndarray[np.float64_t, ndim=1, mode="c"] rv = result
+    cdef Py_ssize_t i, n = pv.shape[0]
+
+    for i in prange(n, nogil=True, schedule="static"):
+        rv[i] = prob_win_set(pv[i], qv[i])
+
+    return result.reshape(shape)
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def prob_win_match_batch(p, q, best_of=3, out=None):
+    '''
+    Vectorized prob_win_match, elements are computed in parallel without
+    GIL. Arguments are broadcast against each other, so best_of can be a
+    single number.
+
+    :param p: Array of probabilities of player1 winning serve point.
+    :param q: Array of probabilities of player2 winning serve point.
+    :param best_of: Array of numbers of sets (3 or 5).
+    :param out: Optional C contiguous float64 array for the result.
+    :return: Array of probabilities of player1 winning the match, NaN where
+             best_of is not 3 or 5.
+    '''
+
+    shape, (p, q, best_of) = _batch_arrays(p, q, best_of)
+    result = _batch_out(shape, out)
+
+    cdef np.ndarray[np.float64_t, ndim=1, mode="c"] pv = p
+    cdef np.ndarray[np.float64_t, ndim=1, mode="c"] qv = q
+    cdef np.ndarray[np.float64_t, ndim=1, mode="c"] bv = best_of
+    cdef np.ndarray[np.float64_t, ndim=1, mode="c"] rv = result
+    cdef Py_ssize_t i, n = pv.shape[0]
+
+    for i in prange(n, nogil=True, schedule="static"):
+        rv[i] = c_prob_win_match(pv[i], qv[i], <int>bv[i])
+
+    return result.reshape(shape)
+
+
+################################################################################
+#     Interpolation tables.                                                    #
+################################################################################
+
+
+@cython.profile(False)
+cdef inline double cubic(double v0, double v1, double v2, double v3, double t) nogil:
+    '''
+    Catmull-Rom cubic through four equally spaced values.
+
+    :param v0: Value at -1.
+    :param v1: Value at 0.
+    :param v2: Value at 1.
+    :param v3: Value at 2.
+    :param t: Position between 0 and 1.
+    :return: Interpolated value.
+    '''
+
+    return v1 + 0.5 * t * (v2 - v0 + t * (2.0 * v0 - 5.0 * v1 + 4.0 * v2 - v3 +
+                                          t * (3.0 * (v1 - v2) + v3 - v0)))
+
+
+cdef double table_prob_win_match(double *grid, Py_ssize_t m, double low, double step,
+                                 double p, double q, int best_of) nogil:
+    '''
+    Probability of winning a match, bicubic interpolation from a table.
+
+    :param grid: m x m row major table of prob_win_match for one best_of, node
+                 k of both axes is low + (k - 1) * step. First and last nodes
+                 only pad the table for the cubic.
+    :param m: Size of table.
+    :param low: Smallest interpolated p and q.
+    :param step: Distance between nodes.
+    :param p: Probability of player1 winning serve point.
+    :param q: Probability of player2 winning serve point.
+    :param best_of: Used for exact probability when p or q is out of table.
+    :return: Probability of player1 winning the match.
+    '''
+
+    cdef Py_ssize_t cells = m - 3
+    cdef double x = (p - low) / step
+    cdef double y = (q - low) / step
+    cdef Py_ssize_t i, j, r
+    cdef double *row
+    cdef double v[4]
+
+    # Also catches NaN.
+    if not (x >= 0 and x <= cells and y >= 0 and y <= cells):
+        return c_prob_win_match(p, q, best_of)
+
+    i = <Py_ssize_t>x
+    j = <Py_ssize_t>y
+    if i == cells:
+        i -= 1
+    if j == cells:
+        j -= 1
+
+    for r in range(4):
+        row = grid + (i + r) * m + j
+        v[r] = cubic(row[0], row[1], row[2], row[3], y - j)
+
+    return cubic(v[0], v[1], v[2], v[3], x - i)
+
+
+cdef inline double match_prob(double *tables, Py_ssize_t m, double low, double step,
+                              double p, double q, int best_of) nogil:
+    '''
+    Probability of winning a match, exact if there are no tables.
+
+    :param tables: NULL or two m x m tables (best of 3 and best of 5), see
+                   table_prob_win_match.
+    :param m: Size of a table.
+    :param low: Smallest interpolated p and q.
+    :param step: Distance between nodes.
+    :param p: Probability of player1 winning serve point.
+    :param q: Probability of player2 winning serve point.
+    :param best_of: On how many sets is match decided.
+    :return: Probability of player1 winning the match or NaN if best_of
+             is not 3 or 5.
+    '''
+
+    if tables == NULL:
+        return c_prob_win_match(p, q, best_of)
+    elif best_of == 3:
+        return table_prob_win_match(tables, m, low, step, p, q, best_of)
+    elif best_of == 5:
+        return table_prob_win_match(tables + m * m, m, low, step, p, q, best_of)
+
+    return NAN
+
+
+def _table_prob_win_match(np.ndarray[np.float64_t, ndim=3, mode="c"] table,
+                          double low, double step, double p, double q, int best_of=3):
+    '''
+    Probability of winning a match, interpolated from table.
+
+    :param table: Array of shape (2, m, m) with tables for best of 3 and 5.
+    :param low: Smallest interpolated p and q.
+    :param step: Distance between nodes.
+    :param p: Probability of player1 winning serve point.
+    :param q: Probability of player2 winning serve point.
+    :param best_of: On how many sets is match decided.
+    :return: Probability of player1 winning the match.
+    '''
+
+    return match_prob(&table[0, 0, 0], table.shape[1], low, step, p, q, best_of)
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def table_prob_win_match_batch(np.ndarray[np.float64_t, ndim=3, mode="c"] table,
+                               double low, double step, p, q, best_of=3, out=None):
+    '''
+    Vectorized _table_prob_win_match, see prob_win_match_batch.
+
+    :param table: Array of shape (2, m, m) with tables for best of 3 and 5.
+    :param low: Smallest interpolated p and q.
+    :param step: Distance between nodes.
+    :param p: Array of probabilities of player1 winning serve point.
+    :param q: Array of probabilities of player2 winning serve point.
+    :param best_of: Array of numbers of sets (3 or 5).
+    :param out: Optional C contiguous float64 array for the result.
+    :return: Array of probabilities of player1 winning the match.
+    '''
+
+    shape, (p, q, best_of) = _batch_arrays(p, q, best_of)
+    result = _batch_out(shape, out)
+
+    cdef np.ndarray[np.float64_t, ndim=1, mode="c"] pv = p
+    cdef np.ndarray[np.float64_t, ndim=1, mode="c"] qv = q
+    cdef np.ndarray[np.float64_t, ndim=1, mode="c"] bv = best_of
+    cdef np.ndarray[np.float64_t, ndim=1, mode="c"] rv = result
+    cdef double *tables = &table[0, 0, 0]
+    cdef Py_ssize_t m = table.shape[1]
+    cdef Py_ssize_t i, n = pv.shape[0]
+
+    for i in prange(n, nogil=True, schedule="static"):
+        rv[i] = match_prob(tables, m, low, step, pv[i], qv[i], <int>bv[i])
+
+    return result.reshape(shape)
+
+
+################################################################################
+#     Model replay kernels.                                                    #
+################################################################################
+
+
+cdef inline double elo_expect(double rating1, double rating2) nogil:
+    '''
+    Expected score, same as ranking_systems.Elo.expect.
+
+    :param rating1: First rating.
+    :param rating2: Second rating.
+    :return: Expected score for player with rating1.
+    '''
+
+    cdef double exponent = -(rating1 - rating2) / 400
+    return 1.0 / (1.0 + 10.0 ** exponent)
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def double_elo_run(np.ndarray[np.int32_t, ndim=1] winners,
+                   np.ndarray[np.int32_t, ndim=1] losers,
+                   np.ndarray[np.float64_t, ndim=1] wsp1,
+                   np.ndarray[np.float64_t, ndim=1] wsp2,
+                   np.ndarray[np.int32_t, ndim=1] best_of,
+                   np.ndarray[np.float64_t, ndim=1] serve,
+                   np.ndarray[np.float64_t, ndim=1] ret,
+                   np.ndarray[np.float64_t, ndim=1] games,
+                   double K, double edge,
+                   np.ndarray[np.float64_t, ndim=3, mode="c"] table=None,
+                   double low=0., double step=0.):
+    '''
+    Replays matches with double Elo model (models.DoubleEloModel). Gives
+    same results as the model run with ranking_systems.Elo objects.
+
+    :param winners: Indices of winners into rating arrays.
+    :param losers: Indices of losers into rating arrays.
+    :param wsp1: Serve win percentage of winners (NaN if unknown).
+    :param wsp2: Serve win percentage of losers (NaN if unknown).
+    :param best_of: How many sets were played at most.
+    :param serve: Serve ratings of players at start.
+    :param ret: Return ratings of players at start.
+    :param games: Number of rated matches of players at start.
+    :param K: Rating modification factor.
+    :param edge: Edge of the serving player.
+    :param table: Optional array of shape (2, m, m), see
+                  _table_prob_win_match. If given, win probabilities are
+                  interpolated from it.
+    :param low: Smallest interpolated p and q of table.
+    :param step: Distance between nodes of table.
+    :return: Tuple (win_prob, bet_amount, serve, ret, games). Rating arrays
+             are new arrays with ratings after last match.
+    '''
+
+    cdef Py_ssize_t n = winners.shape[0]
+    cdef Py_ssize_t i, w, l
+    cdef double p, q, e1, e2, new_rating
+    cdef double *tables = NULL
+    cdef Py_ssize_t m = 0
+    if table is not None and table.shape[0]:
+        tables = &table[0, 0, 0]
+        m = table.shape[1]
+
+
+    cdef np.ndarray[np.float64_t, ndim=1] win_prob = np.empty(n, dtype=np.float64)
+    cdef np.ndarray[np.int64_t, ndim=1] bet_amount = np.empty(n, dtype=np.int64)
+    serve = serve.copy()
+    ret = ret.copy()
+    games = games.copy()
+
+    with nogil:
+        for i in range(n):
+            # If there is no data on serve win percentage, skip.
+            if wsp1[i] != wsp1[i] or wsp2[i] != wsp2[i]:
+                win_prob[i] = 0.5
+                bet_amount[i] = 0
+                continue
+
+            w = winners[i]
+            l = losers[i]
+
+            p = elo_expect(serve[w], ret[l]) + edge
+            q = elo_expect(serve[l], ret[w]) + edge
+            win_prob[i] = match_prob(tables, m, low, step, p, q, best_of[i])
+
+            games[w] += 1
+            games[l] += 1
+            bet_amount[i] = 1 if games[w] > 50 and games[l] > 50 else 0
+
+            # Both ratings of a pair are updated from old values, same as
+            # Elo.match does. Rating.update adds difference to the rating.
+            e1 = elo_expect(serve[w], ret[l])
+            e2 = elo_expect(ret[l], serve[w])
+            new_rating = serve[w] + K * ((wsp1[i] - edge) - e1)
+            serve[w] += new_rating - serve[w]
+            new_rating = ret[l] + K * ((1.0 - (wsp1[i] - edge)) - e2)
+            ret[l] += new_rating - ret[l]
+
+            e1 = elo_expect(serve[l], ret[w])
+            e2 = elo_expect(ret[w], serve[l])
+            new_rating = serve[l] + K * ((wsp2[i] - edge) - e1)
+            serve[l] += new_rating - serve[l]
+            new_rating = ret[w] + K * ((1.0 - (wsp2[i] - edge)) - e2)
+            ret[w] += new_rating - ret[w]
+
+    return win_prob, bet_amount, serve, ret, games
+
+
+cdef inline double mg_sigma(long t, double sigma_start, double sigma_cap,
+                            double c) nogil:
+    '''
+    Sigma of a rating after t matches, same as
+    ranking_systems.modified_glicko_ranking.Rating.get_sigma.
+
+    :param t: Number of rated matches.
+    :param sigma_start: Starting sigma.
+    :param sigma_cap: Smallest possible sigma.
+    :param c: Sigma decrementing factor.
+    :return: Sigma.
+    '''
+
+    cdef double s_2 = sigma_start - t * c
+    return s_2 if s_2 >= sigma_cap else sigma_cap
+
+
+cdef inline double mg_impact(double sigma, double Q) nogil:
+    '''
+    Impact of opponent's sigma, same as ModifiedGlicko.impact.
+
+    :param sigma: Sigma of opponent.
+    :param Q: Rating modification factor.
+    :return: Impact.
+    '''
+
+    cdef double sqr = 1 + (3 * Q ** 2 * (sigma ** 2) / (M_PI ** 2))
+    return 1 / sqrt(sqr)
+
+
+cdef inline double mg_expect(double rating1, double rating2, double sigma2,
+                             double Q) nogil:
+    '''
+    Expected score, same as ModifiedGlicko.expect.
+
+    :param rating1: First rating.
+    :param rating2: Second rating.
+    :param sigma2: Sigma of second rating.
+    :param Q: Rating modification factor.
+    :return: Expected score for player with rating1.
+    '''
+
+    cdef double impact = mg_impact(sigma2, Q)
+    cdef double exponent = -impact * (rating1 - rating2) / 400
+    return 1.0 / (1 + 10 ** exponent)
+
+
+cdef inline double mg_rate(double rating, double sigma, double other_rating,
+                           double other_sigma, double result, double Q) nogil:
+    '''
+    New rating after a match, same as ModifiedGlicko.rate.
+
+    :param rating: Rating that we rate.
+    :param sigma: Sigma of the rating.
+    :param other_rating: Opponents rating.
+    :param other_sigma: Sigma of opponents rating.
+    :param result: How much did rating score vs other rating; from 0 to 1
+    :param Q: Rating modification factor.
+    :return: New rating.
+    '''
+
+    cdef double E = mg_expect(rating, other_rating, other_sigma, Q)
+    cdef double impact = mg_impact(other_sigma, Q)
+    cdef double d = sqrt( 1.0 / (Q**2 * impact**2 * E * (1 - E)) )
+    cdef double change = (Q / (1/sigma**2 + 1/d**2)) * impact * (result - E)
+    return rating + change
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def double_modified_glicko_run(np.ndarray[np.int32_t, ndim=1] winners,
+                               np.ndarray[np.int32_t, ndim=1] losers,
+                               np.ndarray[np.float64_t, ndim=1] wsp1,
+                               np.ndarray[np.float64_t, ndim=1] wsp2,
+                               np.ndarray[np.int32_t, ndim=1] best_of,
+                               np.ndarray[np.float64_t, ndim=1] att_rating,
+                               np.ndarray[np.int64_t, ndim=1] att_t,
+                               np.ndarray[np.float64_t, ndim=1] def_rating,
+                               np.ndarray[np.int64_t, ndim=1] def_t,
+                               double sigma_start, double sigma_cap,
+                               double c, double Q,
+                               np.ndarray[np.float64_t, ndim=3, mode="c"] table=None,
+                               double low=0., double step=0.):
+    '''
+    Replays matches with double modified Glicko model
+    (models.DoubleModifiedGlickoModel). Gives same results as the model run
+    with ranking_systems.ModifiedGlicko objects.
+
+    :param winners: Indices of winners into rating arrays.
+    :param losers: Indices of losers into rating arrays.
+    :param wsp1: Serve win percentage of winners (NaN if unknown).
+    :param wsp2: Serve win percentage of losers (NaN if unknown).
+    :param best_of: How many sets were played at most.
+    :param att_rating: Serve ratings of players at start.
+    :param att_t: Number of rated matches of serve ratings at start.
+    :param def_rating: Return ratings of players at start.
+    :param def_t: Number of rated matches of return ratings at start.
+    :param sigma_start: Starting sigma.
+    :param sigma_cap: Smallest possible sigma.
+    :param c: Sigma decrementing factor.
+    :param Q: Rating modification factor.
+    :param table: Optional array of shape (2, m, m), see
+                  _table_prob_win_match. If given, win probabilities are
+                  interpolated from it.
+    :param low: Smallest interpolated p and q of table.
+    :param step: Distance between nodes of table.
+    :return: Tuple (win_prob, bet_amount, att_rating, att_t, def_rating,
+             def_t). Rating arrays are new arrays with state after last
+             match.
+    '''
+
+    cdef Py_ssize_t n = winners.shape[0]
+    cdef Py_ssize_t n_players = att_rating.shape[0]
+    cdef Py_ssize_t i, w, l
+    cdef double p, q, a, d
+    cdef double *tables = NULL
+    cdef Py_ssize_t m = 0
+    if table is not None and table.shape[0]:
+        tables = &table[0, 0, 0]
+        m = table.shape[1]
+
+
+    cdef np.ndarray[np.float64_t, ndim=1] win_prob = np.empty(n, dtype=np.float64)
+    cdef np.ndarray[np.int64_t, ndim=1] bet_amount = np.empty(n, dtype=np.int64)
+    cdef np.ndarray[np.float64_t, ndim=1] att_sigma = np.empty(n_players, dtype=np.float64)
+    cdef np.ndarray[np.float64_t, ndim=1] def_sigma = np.empty(n_players, dtype=np.float64)
+    att_rating = att_rating.copy()
+    att_t = att_t.copy()
+    def_rating = def_rating.copy()
+    def_t = def_t.copy()
+
+    with nogil:
+        for i in range(n_players):
+            att_sigma[i] = mg_sigma(att_t[i], sigma_start, sigma_cap, c)
+            def_sigma[i] = mg_sigma(def_t[i], sigma_start, sigma_cap, c)
+
+        for i in range(n):
+            # If there is no data on serve win percentage, skip.
+            if wsp1[i] != wsp1[i] or wsp2[i] != wsp2[i]:
+                win_prob[i] = 0.51
+                bet_amount[i] = 0
+                continue
+
+            w = winners[i]
+            l = losers[i]
+
+            p = mg_expect(att_rating[w], def_rating[l], def_sigma[l], Q)
+            q = mg_expect(att_rating[l], def_rating[w], def_sigma[w], Q)
+            win_prob[i] = match_prob(tables, m, low, step, p, q, best_of[i])
+            bet_amount[i] = 1
+
+            # Serve of winner against return of loser. Both new ratings are
+            # computed from old ones, same as ModifiedGlicko.match does.
+            a = mg_rate(att_rating[w], att_sigma[w], def_rating[l], def_sigma[l], wsp1[i], Q)
+            d = mg_rate(def_rating[l], def_sigma[l], att_rating[w], att_sigma[w], 1.0 - wsp1[i], Q)
+            att_rating[w] = a
+            att_t[w] += 1
+            att_sigma[w] = mg_sigma(att_t[w], sigma_start, sigma_cap, c)
+            def_rating[l] = d
+            def_t[l] += 1
+            def_sigma[l] = mg_sigma(def_t[l], sigma_start, sigma_cap, c)
+
+            # Serve of loser against return of winner.
+            a = mg_rate(att_rating[l], att_sigma[l], def_rating[w], def_sigma[w], wsp2[i], Q)
+            d = mg_rate(def_rating[w], def_sigma[w], att_rating[l], att_sigma[l], 1.0 - wsp2[i], Q)
+            att_rating[l] = a
+            att_t[l] += 1
+            att_sigma[l] = mg_sigma(att_t[l], sigma_start, sigma_cap, c)
+            def_rating[w] = d
+            def_t[w] += 1
+            def_sigma[w] = mg_sigma(def_t[w], sigma_start, sigma_cap, c)
+
+    return win_prob, bet_amount, att_rating, att_t, def_rating, def_t
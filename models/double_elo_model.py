@@ -25,68 +25,74 @@ class DoubleEloModel(tm.TennisRankingModel):
         self.params = {"mu": 1500, "K": 11.35, "edge": 0.1}
         self.params.update(kwargs)
         super(self.__class__, self).__init__(**kwargs)
-        self.player_rankings = {}
-        self.player_games = {}
         self.name = "DoubleElo"
 
     @overrides(tm.TennisRankingModel)
-    def run(self, data, verbose=False):
+    def rating_columns(self):
         '''
         Override function from superclass.
 
-        :param data: Pandas dataframe on which to test model.
-        :return: void
+        :return: List of tuples (name, default value, dtype).
         '''
 
-        r = self.player_rankings
-        g = self.player_games
-        elo = rs.Elo(self.params["mu"], self.params["K"])
-        edge = self.params["edge"]
-        probabilities = []
-        bet_amount = []
-
-        for i, row in data.iterrows():
-            name1 = row["Winner"]
-            name2 = row["Loser"]
-            wsp1 = row["WSP1"]
-            wsp2 = row["WSP2"]
+        mu = self.params["mu"]
+        return [("serve", mu, np.float64), ("return", mu, np.float64),
+                ("games", 0.0, np.float64)]
 
-            # If there is no data on serve win percentage, skip.
-            if math.isnan(wsp1) or math.isnan(wsp2):
-                probabilities.append(0.5)
-                bet_amount.append(0)
-                continue
+    history_columns = ("serve", "return", None)
 
-            if not r.get(name1, False):
-                r[name1] = [elo.create_rating(), elo.create_rating()]
-            if not r.get(name2, False):
-                r[name2] = [elo.create_rating(), elo.create_rating()]
+    # If True, run replays matches with compiled calc.double_elo_run,
+    # otherwise with _run_match. Both give same results.
+    use_kernel = True
 
-            p = elo.expect(r[name1][0], r[name2][1]) + edge
-            q = elo.expect(r[name2][0], r[name1][1]) + edge
-
-            win_prob = calc.prob_win_match(p, q, row["Best_of"])
-            probabilities.append(win_prob)
-            # probabilities.append(random.random())
-            # bet_amount.append(1)
+    @overrides(tm.TennisRankingModel)
+    def run(self, data, verbose=False, checkpoint=None):
+        '''
+        Override function from superclass.
 
-            g[name1] = g.get(name1, 0.0) + 1
-            g[name2] = g.get(name2, 0.0) + 1
+        :param data: Pandas dataframe or match store on which to run model.
+        :param verbose: Log or not?
+        :param checkpoint: Path to checkpoint to start from or None.
+        :return: Copy of data with columns win_prob and bet_amount.
+        '''
 
-            if g[name1]>50 and g[name2]>50:
-                bet_amount.append(1)
-            else:
-                bet_amount.append(0)
+        # Kernel only returns final ratings, history is recorded match by
+        # match.
+        if not self.use_kernel or self.record_history:
+            return super(DoubleEloModel, self).run(data, verbose, checkpoint)
 
-            r[name1][0], r[name2][1] = elo.match(r[name1][0], r[name2][1], wsp1 - edge)
-            r[name2][0], r[name1][1] = elo.match(r[name2][0], r[name1][1], wsp2 - edge)
+        data = self._begin_run(data, checkpoint)
 
-        self.player_rankings = r
-        self.player_games = g
+        self._start_run()
 
-        if verbose:
-            sez = sorted([[rt[0].rating, rt[1].rating, key] for key, rt in r.iteritems()], key=lambda x: x[0]+x[1], reverse=True)
-            print '\n'.join(['{:>22s} {:8.1f} {:8.1f}'.format(str(p[2]), p[0], p[1]) for p in sez[:20]]) + "\n\n"
+        r = self.player_rankings
+        n = len(data)
+        winners = data["Winner"].values
+        losers = data["Loser"].values
+        wsp1 = data["WSP1"].values.astype(np.float64)
+        wsp2 = data["WSP2"].values.astype(np.float64)
+        best_of = data["Best_of"].values.astype(np.int32)
+
+        # Only players with rated matches get rows, same as in _run_match.
+        # Matches without data are skipped by the kernel, their rows are 0.
+        rated = ~(np.isnan(wsp1) | np.isnan(wsp2))
+        rows = r.rows(np.column_stack([winners[rated], losers[rated]]).ravel())
+        winner_rows = np.zeros(n, dtype=np.int32)
+        loser_rows = np.zeros(n, dtype=np.int32)
+        winner_rows[rated] = rows[0::2]
+        loser_rows[rated] = rows[1::2]
+
+        probabilities, bet_amount, serve, ret, games = calc.double_elo_run(
+            winner_rows, loser_rows, wsp1, wsp2, best_of,
+            r["serve"], r["return"], r["games"], self._elo.K, self._edge,
+            **self._kernel_table_args())
+
+        r["serve"] = serve
+        r["return"] = ret
+        r["games"] = games
+
+        self._end_run(data)
+        self._finish_run(verbose)
 
         df = data.copy()
         df["win_prob"] = probabilities
@@ -94,6 +100,116 @@ class DoubleEloModel(tm.TennisRankingModel):
 
         return df
 
+    @overrides(tm.TennisRankingModel)
+    def _start_run(self):
+        '''
+        Override function from superclass.
+
+        :return: void
+        '''
+
+        self._elo = rs.Elo(self.params["mu"], self.params["K"])
+        self._edge = self.params["edge"]
+
+    @overrides(tm.TennisRankingModel)
+    def _run_match(self, name1, name2, wsp1, wsp2, best_of):
+        '''
+        Override function from superclass.
+
+        :param name1: Winner of the match.
+        :param name2: Loser of the match.
+        :param wsp1: Serve win percentage of the winner.
+        :param wsp2: Serve win percentage of the loser.
+        :param best_of: How many sets were played at most.
+        :return: Tuple (win_prob, bet_amount).
+        '''
+
+        r = self.player_rankings
+
+        # If there is no data on serve win percentage, skip.
+        if math.isnan(wsp1) or math.isnan(wsp2):
+            return 0.5, 0
+
+        win_prob, p, q = self._predict(name1, name2, best_of)
+
+        w = r.row(name1)
+        l = r.row(name2)
+        games = r["games"]
+        games[w] += 1
+        games[l] += 1
+
+        if games[w]>50 and games[l]>50:
+            bet = 1
+        else:
+            bet = 0
+
+        self._update(w, l, wsp1, wsp2)
+
+        return win_prob, bet
+
+    @overrides(tm.TennisRankingModel)
+    def _predict(self, player1, player2, best_of, surface=None):
+        '''
+        Override function from superclass.
+
+        :param player1: First player.
+        :param player2: Second player.
+        :param best_of: How many sets are played at most.
+        :param surface: Not used.
+        :return: Tuple (win_prob, p, q).
+        '''
+
+        r = self.player_rankings
+        elo = self._elo
+        edge = self._edge
+
+        serve1 = elo.create_rating(r.value(player1, "serve"))
+        return1 = elo.create_rating(r.value(player1, "return"))
+        serve2 = elo.create_rating(r.value(player2, "serve"))
+        return2 = elo.create_rating(r.value(player2, "return"))
+
+        p = elo.expect(serve1, return2) + edge
+        q = elo.expect(serve2, return1) + edge
+
+        return self.prob_win_match(p, q, best_of), p, q
+
+    def _update(self, w, l, wsp1, wsp2):
+        '''
+        Updates ratings of two players after their match.
+
+        :param w: Row of the winner in player_rankings.
+        :param l: Row of the loser in player_rankings.
+        :param wsp1: Serve win percentage of the winner.
+        :param wsp2: Serve win percentage of the loser.
+        :return: void
+        '''
+
+        r = self.player_rankings
+        elo = self._elo
+        edge = self._edge
+        serve = r["serve"]
+        ret = r["return"]
+
+        s1, r1 = elo.create_rating(serve[w]), elo.create_rating(ret[w])
+        s2, r2 = elo.create_rating(serve[l]), elo.create_rating(ret[l])
+        elo.match_inplace(s1, r2, wsp1 - edge)
+        elo.match_inplace(s2, r1, wsp2 - edge)
+
+        serve[w], ret[l] = s1.rating, r2.rating
+        serve[l], ret[w] = s2.rating, r1.rating
+
+    @overrides(tm.TennisRankingModel)
+    def _finish_run(self, verbose=False):
+        '''
+        Override function from superclass.
+
+        :param verbose: Log or not?
+        :return: void
+        '''
+
+        if verbose:
+            self.top_n_players(20, True)
+
     @overrides(tm.TennisRankingModel)
     def _train_params(self, x, train_data, verbose=False):
         '''
@@ -106,7 +222,6 @@ class DoubleEloModel(tm.TennisRankingModel):
         '''
 
         self.params["K"] = x[0]
-        self.player_rankings = {}
         error = self.train(train_data, verbose)
 
         if verbose:
@@ -126,12 +241,12 @@ class DoubleEloModel(tm.TennisRankingModel):
         :return: Sorted list of top n players.
         '''
 
-        sez = sorted([[rt[0].rating, rt[1].rating, key] for key, rt in self.player_rankings.iteritems()], key=lambda x: x[0]+x[1], reverse=True)
+        r = self.player_rankings
+        top_n = r.top_n(n, r["serve"] + r["return"])
 
         if verbose:
-            print '\n'.join(['{:>22s} {:8.1f} {:8.1f}'.format(str(p[2]), p[0], p[1]) for p in sez[:n]]) + "\n\n"
-
-        top_n = [p[2] for p in sez[:n]]
+            sez = [[r["serve"][r.get(key)], r["return"][r.get(key)], key] for key in top_n]
+            print '\n'.join(['{:>22s} {:8.1f} {:8.1f}'.format(str(p[2]), p[0], p[1]) for p in sez]) + "\n\n"
 
         return top_n
 
@@ -152,11 +267,7 @@ class DoubleEloModel(tm.TennisRankingModel):
         data = {}
 
         r = self.player_rankings
-        g = self.player_games
-        elo = rs.Elo(self.params["mu"], self.params["K"])
-        edge = self.params["edge"]
-        probabilities = []
-        bet_amount = []
+        self._start_run()
 
         for name in top_n:
             data[name] = {"rating": [{"return": 1500, "serve": 1500}], "name": name}
@@ -169,33 +280,22 @@ class DoubleEloModel(tm.TennisRankingModel):
 
             # If there is no data on serve win percentage, skip.
             if math.isnan(wsp1) or math.isnan(wsp2):
-                probabilities.append(0.5)
-                bet_amount.append(0)
                 continue
 
-            if not r.get(name1, False):
-                r[name1] = [elo.create_rating(), elo.create_rating()]
-            if not r.get(name2, False):
-                r[name2] = [elo.create_rating(), elo.create_rating()]
-
-            r[name1][0], r[name2][1] = elo.match(r[name1][0], r[name2][1], wsp1 - edge)
-            r[name2][0], r[name1][1] = elo.match(r[name2][0], r[name1][1], wsp2 - edge)
+            self._update(r.row(name1), r.row(name2), wsp1, wsp2)
 
             if (name1 in top_n or name2 in top_n) and row["Tournament"] != lt:
                 lt = row["Tournament"]
                 tc += 1
                 tours.append({"text": lt + " " + str(row["Date"]), "value": tc, "games": []})
                 for name in top_n:
-                    ser, ret = int(r[name][0].rating), int(r[name][1].rating)
+                    ser, ret = int(r["serve"][r.get(name)]), int(r["return"][r.get(name)])
                     data[name]["rating"].append({"return": ret, "serve": ser})
 
             if len(tours) and row["Tournament"] == lt:
                 game = "%s | %s vs %s: %s." % (row["Round"], name1, name2, row["Score"])
                 tours[-1]["games"].append(game)
 
-        self.player_rankings = r
-        self.player_games = g
-
         alpha = 0.05
         for key, value in data.iteritems():
             points = len(value["rating"])
@@ -6,7 +6,6 @@ import numpy as np
 import scipy as sp
 import scipy.stats
 
-import calculations as calc
 import ranking_systems as rs
 import tennis_model as tm
 from tennis_model import overrides
@@ -14,71 +13,78 @@ from tennis_model import overrides
 ALPHA = 0.01
 CONF = [0,0,0,0]+[sp.stats.t.ppf((1+ALPHA)/2., 100*n2-1) for n2 in xrange(5, 2000)]
 
-class Surface(object):
+class DoubleEloSurfaceModel(tm.TennisRankingModel):
     '''
-    Wrapper for surface stats.
+    This is double surface Elo model.
     '''
 
-    def __init__(self):
+    def __init__(self, **kwargs):
         '''
         Constructor.
-        '''
-
-        self.ser = 0.0
-        self.ret = 0.0
-        self.n = 0
 
-    def get(self):
-        '''
-        Get lower bound.
+        :return: void
         '''
 
-        if self.n == 0:
-            return [0.0, 0.0]
+        self.params = {"mu": 1500, "K": 11.35, "edge": 0.1}
+        self.params.update(kwargs)
+        super(self.__class__, self).__init__(**kwargs)
+        self.name = "DoubleEloSurface"
+
+    match_columns = ["Winner", "Loser", "WSP1", "WSP2", "Best_of", "Surface"]
 
-        return self.ser / self.n, self.ret / self.n
+    history_columns = ("serve", "return", None)
 
-    def update(self, ser, ret):
-        '''
-        Add.
+    @overrides(tm.TennisRankingModel)
+    def rating_columns(self):
         '''
+        Override function from superclass. Besides Elo ratings, player keeps
+        sums of serve and return win percentages and number of matches on
+        all surfaces (columns "All_ser", "All_ret", "All_n"). Same columns
+        for each surface are added once surface is first seen.
 
-        self.ser += ser
-        self.ret += ret
-        self.n += 1
-
+        :return: List of tuples (name, default value, dtype).
+        '''
 
-class Player(object):
-    '''
-    Player stats wrapper.
-    '''
+        mu = self.params["mu"]
+        return [("serve", mu, np.float64), ("return", mu, np.float64),
+                ("games", 0.0, np.float64)] + self._surface_columns("All")
 
-    def __init__(self):
+    def _surface_columns(self, surface):
         '''
-        Constructor.
+        Columns with stats of players on surface.
 
-        :return: void.
+        :param surface: Name of surface.
+        :return: List of tuples (name, default value, dtype).
         '''
 
-        self.surface = {}
-        self.surface["All"] = Surface()
+        return [("%s_ser" % surface, 0.0, np.float64), ("%s_ret" % surface, 0.0, np.float64),
+                ("%s_n" % surface, 0, np.int64)]
 
-    def get_advantage(self, surface):
+    def get_advantage(self, name, surface):
         '''
-        Comment.
+        Advantage of player on surface: difference between his serve (and
+        return) win percentage on this surface and on all surfaces, with
+        half widths of their confidence intervals.
+
+        :param name: Name (or id) of the player.
+        :param surface: Name of surface.
+        :return: Tuple (ser, ret, h1, h2).
         '''
 
-        ser_1, ret_1 = self.surface["All"].get()
-        try: self.surface[surface]
-        except: self.surface[surface] = Surface()
-        ser_2, ret_2 = self.surface[surface].get()
+        r = self.player_rankings
+        if "%s_n" % surface not in r.defaults:
+            return 0.0, 0.0, 1.0, 1.0
 
-        n = self.surface[surface].n
-        n2 = 100 * n
+        n = r.value(name, "%s_n" % surface)
 
         if n <= 5:
             return 0.0, 0.0, 1.0, 1.0
 
+        n_all = r.value(name, "All_n")
+        ser_1, ret_1 = r.value(name, "All_ser") / n_all, r.value(name, "All_ret") / n_all
+        ser_2, ret_2 = r.value(name, "%s_ser" % surface) / n, r.value(name, "%s_ret" % surface) / n
+        n2 = 100 * n
+
         p = ser_2
         predict_var = math.sqrt(p * (1.0 - p) / n2)
         h1 = predict_var * CONF[n]
@@ -91,127 +97,141 @@ class Player(object):
 
         return ser, ret, h1, h2
 
-    def update(self, ser, ret, surface):
+    def update_surface(self, i, ser, ret, surface):
         '''
-        comment
+        Adds match to stats of player on surface and on all surfaces.
+
+        :param i: Row of the player.
+        :param ser: Serve win percentage of the player.
+        :param ret: Return win percentage of the player.
+        :param surface: Name of surface.
+        :return: void
         '''
 
-        self.surface["All"].update(ser, ret)
-        try: self.surface[surface]
-        except: self.surface[surface] = Surface()
+        r = self.player_rankings
 
-        self.surface[surface].update(ser, ret)
+        for prefix in ["All", surface]:
+            r["%s_ser" % prefix][i] += ser
+            r["%s_ret" % prefix][i] += ret
+            r["%s_n" % prefix][i] += 1
 
+    @overrides(tm.TennisRankingModel)
+    def _start_run(self):
+        '''
+        Override function from superclass.
 
-class DoubleEloSurfaceModel(tm.TennisRankingModel):
-    '''
-    This is double surface Elo model.
-    '''
+        :return: void
+        '''
 
-    def __init__(self, **kwargs):
+        self._elo = rs.Elo(self.params["mu"], self.params["K"])
+        self._edge = self.params["edge"]
+
+    @overrides(tm.TennisRankingModel)
+    def _run_match(self, name1, name2, wsp1, wsp2, best_of, surface):
         '''
-        Constructor.
+        Override function from superclass.
 
-        :return: void
+        :param name1: Winner of the match.
+        :param name2: Loser of the match.
+        :param wsp1: Serve win percentage of the winner.
+        :param wsp2: Serve win percentage of the loser.
+        :param best_of: How many sets were played at most.
+        :param surface: Surface of the match.
+        :return: Tuple (win_prob, bet_amount).
         '''
 
-        self.params = {"mu": 1500, "K": 11.35, "edge": 0.1}
-        self.params.update(kwargs)
-        super(self.__class__, self).__init__(**kwargs)
-        self.player_rankings = {}
-        self.surface_advantage = {}
-        self.player_games = {}
-        self.name = "DoubleEloSurface"
+        r = self.player_rankings
+        elo = self._elo
+        edge = self._edge
+
+        # If there is no data on serve win percentage, skip.
+        if math.isnan(wsp1) or math.isnan(wsp2):
+            return 0.5, 0
+
+        if "%s_n" % surface not in r.defaults:
+            for name, default, dtype in self._surface_columns(surface):
+                r.add_column(name, default, dtype)
+
+        win_prob, p, q = self._predict(name1, name2, best_of, surface)
+
+        w = r.row(name1)
+        l = r.row(name2)
+        serve = r["serve"]
+        ret = r["return"]
+        games = r["games"]
+
+        self.update_surface(w, wsp1, 1.0 - wsp2, surface)
+        self.update_surface(l, wsp2, 1.0 - wsp1, surface)
+
+        games[w] += 1
+        games[l] += 1
+
+        s1, r1 = elo.create_rating(serve[w]), elo.create_rating(ret[w])
+        s2, r2 = elo.create_rating(serve[l]), elo.create_rating(ret[l])
+        elo.match_inplace(s1, r2, wsp1 - edge)
+        elo.match_inplace(s2, r1, wsp2 - edge)
+
+        serve[w], ret[l] = s1.rating, r2.rating
+        serve[l], ret[w] = s2.rating, r1.rating
+
+        return win_prob, 1
 
     @overrides(tm.TennisRankingModel)
-    def run(self, data, verbose=False):
+    def _predict(self, player1, player2, best_of, surface=None):
         '''
         Override function from superclass.
 
-        :param data: Pandas dataframe on which to test model.
-        :return: void
+        :param player1: First player.
+        :param player2: Second player.
+        :param best_of: How many sets are played at most.
+        :param surface: Surface of the match. Without it players have no
+                        surface advantage.
+        :return: Tuple (win_prob, p, q).
         '''
 
         r = self.player_rankings
-        s = self.surface_advantage
-        g = self.player_games
-
-        elo = rs.Elo(self.params["mu"], self.params["K"])
-        edge = self.params["edge"]
-        probabilities = []
-        bet_amount = []
-
-        for i, row in data.iterrows():
-            name1 = row["Winner"]
-            name2 = row["Loser"]
-            wsp1 = row["WSP1"]
-            wsp2 = row["WSP2"]
-
-            # If there is no data on serve win percentage, skip.
-            if math.isnan(wsp1) or math.isnan(wsp2):
-                probabilities.append(0.5)
-                bet_amount.append(0)
-                continue
-
-            if not r.get(name1, False):
-                r[name1] = [elo.create_rating(), elo.create_rating()]
-                s[name1] = Player()
-            if not r.get(name2, False):
-                r[name2] = [elo.create_rating(), elo.create_rating()]
-                s[name2] = Player()
-
-            s1, r1, h11, h12 = s[name1].get_advantage(row["Surface"])
-            s2, r2, h21, h22 = s[name2].get_advantage(row["Surface"])
-            h1 = h11 + h22
-            h2 = h12 + h21
-
-            a1 = s1 - r2
-            if a1 + h1 < 0.0: a1 += h1
-            elif a1 - h1 > 0.0: a1 -= h1
-            else: a1 = 0
-
-            a2 = s2 - r1
-            if a2 + h2 < 0.0: a2 += h2
-            elif a2 - h2 > 0.0: a2 -= h2
-            else: a2 = 0
-
-            p = elo.expect(r[name1][0], r[name2][1]) + edge + a1
-            q = elo.expect(r[name2][0], r[name1][1]) + edge + a2
-
-            s[name1].update(wsp1, 1.0 - wsp2, row["Surface"])
-            s[name2].update(wsp2, 1.0 - wsp1, row["Surface"])
-
-            win_prob = calc.prob_win_match(p, q, row["Best_of"])
-
-            g[name1] = g.get(name1, 0.0) + 1
-            g[name2] = g.get(name2, 0.0) + 1
-
-            """
-            if g[name1]>5 and g[name2]>5:
-                bet_amount.append(1)
-            else:
-                bet_amount.append(0)
-            """
-
-            bet_amount.append(1)
-            probabilities.append(win_prob)
-
-            r[name1][0], r[name2][1] = elo.match(r[name1][0], r[name2][1], wsp1 - edge)
-            r[name2][0], r[name1][1] = elo.match(r[name2][0], r[name1][1], wsp2 - edge)
-
-        self.surface_advantage = s
-        self.player_rankings = r
-        self.player_games = g
+        elo = self._elo
+        edge = self._edge
 
-        if verbose:
-            sez = sorted([[rt[0].rating, rt[1].rating, str(key)] for key, rt in r.iteritems()], key=lambda x: x[0]+x[1], reverse=True)
-            print '\n'.join(['{:>22s} {:8.1f} {:8.1f}'.format(p[2], p[0], p[1]) for p in sez[:20]]) + "\n\n"
+        s1, r1, h11, h12 = self.get_advantage(player1, surface)
+        s2, r2, h21, h22 = self.get_advantage(player2, surface)
+        h1 = h11 + h22
+        h2 = h12 + h21
+
+        a1 = s1 - r2
+        if a1 + h1 < 0.0: a1 += h1
+        elif a1 - h1 > 0.0: a1 -= h1
+        else: a1 = 0
+
+        a2 = s2 - r1
+        if a2 + h2 < 0.0: a2 += h2
+        elif a2 - h2 > 0.0: a2 -= h2
+        else: a2 = 0
+
+        serve1 = elo.create_rating(r.value(player1, "serve"))
+        return1 = elo.create_rating(r.value(player1, "return"))
+        serve2 = elo.create_rating(r.value(player2, "serve"))
+        return2 = elo.create_rating(r.value(player2, "return"))
+
+        p = elo.expect(serve1, return2) + edge + a1
+        q = elo.expect(serve2, return1) + edge + a2
 
-        df = data.copy()
-        df["win_prob"] = probabilities
-        df["bet_amount"] = bet_amount
+        return self.prob_win_match(p, q, best_of), p, q
 
-        return df
+    @overrides(tm.TennisRankingModel)
+    def _finish_run(self, verbose=False):
+        '''
+        Override function from superclass.
+
+        :param verbose: Log or not?
+        :return: void
+        '''
+
+        if verbose:
+            r = self.player_rankings
+            top_n = r.top_n(20, r["serve"] + r["return"])
+            sez = [[r["serve"][r.get(key)], r["return"][r.get(key)], str(key)] for key in top_n]
+            print '\n'.join(['{:>22s} {:8.1f} {:8.1f}'.format(str(p[2]), p[0], p[1]) for p in sez]) + "\n\n"
 
     @overrides(tm.TennisRankingModel)
     def _train_params(self, x, train_data, verbose=False):
@@ -225,8 +245,6 @@ class DoubleEloSurfaceModel(tm.TennisRankingModel):
         '''
 
         self.params["K"] = x[0]
-        self.player_rankings = {}
-        self.surface_advantage = {}
         error = self.train(train_data, verbose)
 
         if verbose:
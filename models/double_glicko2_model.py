@@ -2,7 +2,8 @@ __author__ = 'riko'
 
 import math
 
-import calculations as calc
+import numpy as np
+
 import ranking_systems as rs
 import tennis_model as tm
 from tennis_model import overrides
@@ -28,66 +29,140 @@ class DoubleGlicko2Model(tm.TennisRankingModel):
                        }
         self.params.update(kwargs)
         super(self.__class__, self).__init__(**kwargs)
-        self.player_rankings = {}
         self.name = "DoubleGlicko2"
 
+    # Rating deviation phi of serve rating is recorded as sigma.
+    history_columns = ("serve_mu", "return_mu", "serve_phi")
+
+    @overrides(tm.TennisRankingModel)
+    def rating_columns(self):
+        '''
+        Override function from superclass. Serve and return rating both keep
+        mu, phi and sigma.
+
+        :return: List of tuples (name, default value, dtype).
+        '''
+
+        p = self.params
+        columns = []
+        for prefix in ["serve", "return"]:
+            columns += [(prefix + "_mu", p["mu"], np.float64), (prefix + "_phi", p["phi"], np.float64),
+                        (prefix + "_sigma", p["sigma"], np.float64)]
+
+        return columns
+
     @overrides(tm.TennisRankingModel)
-    def run(self, data, verbose=False):
+    def _start_run(self):
         '''
         Override function from superclass.
 
-        :param data: Pandas dataframe on which to test model.
         :return: void
         '''
 
-        r = self.player_rankings
         p = self.params
-        glicko = rs.Glicko2(p["mu"], p["phi"], p["sigma"], p["tau"], p["eps"])
-        probabilities = []
-        bet_amount = []
-        P = []
-        Q = []
-
-        for i, row in data.iterrows():
-            name1 = row["Winner"]
-            name2 = row["Loser"]
-            wsp1 = row["WSP1"]
-            wsp2 = row["WSP2"]
-
-            # If there is no data on serve win percentage, skip.
-            if math.isnan(wsp1) or math.isnan(wsp2):
-                probabilities.append(0.5)
-                bet_amount.append(0)
-                continue
-
-            if not r.get(name1, False):
-                r[name1] = [glicko.create_rating(), glicko.create_rating()]
-            if not r.get(name2, False):
-                r[name2] = [glicko.create_rating(), glicko.create_rating()]
-
-            p = glicko.expect(r[name1][0], r[name2][1])
-            q = glicko.expect(r[name2][0], r[name1][1])
-            P.append(p)
-            Q.append(q)
-            win_prob = calc.prob_win_match(p, q, row["Best_of"])
-            probabilities.append(win_prob)
-            bet_amount.append(1)
-
-            r[name1][0], r[name2][1] = glicko.rate_1vs1(r[name1][0], r[name2][1], wsp1 )
-            r[name2][0], r[name1][1] = glicko.rate_1vs1(r[name2][0], r[name1][1], wsp2)
-
-        self.player_rankings = r
+        self._glicko = rs.Glicko2(p["mu"], p["phi"], p["sigma"], p["tau"], p["eps"])
 
-        if verbose:
-            sez = sorted([[rt[0].mu, rt[1].mu, key] for key, rt in r.iteritems()], key=lambda x: x[0]+x[1], reverse=True)
-            print '\n'.join(['{:>22s} {:8.1f} {:8.1f}'.format(p[2], p[0], p[1]) for p in sez[:20]]) + "\n\n"
+    @overrides(tm.TennisRankingModel)
+    def _run_match(self, name1, name2, wsp1, wsp2, best_of):
+        '''
+        Override function from superclass.
+
+        :param name1: Winner of the match.
+        :param name2: Loser of the match.
+        :param wsp1: Serve win percentage of the winner.
+        :param wsp2: Serve win percentage of the loser.
+        :param best_of: How many sets were played at most.
+        :return: Tuple (win_prob, bet_amount).
+        '''
+
+        r = self.player_rankings
+        glicko = self._glicko
+
+        # If there is no data on serve win percentage, skip.
+        if math.isnan(wsp1) or math.isnan(wsp2):
+            return 0.5, 0
+
+        serve1, return1 = self.get_rating(name1, "serve"), self.get_rating(name1, "return")
+        serve2, return2 = self.get_rating(name2, "serve"), self.get_rating(name2, "return")
+
+        p = glicko.expect(serve1, return2)
+        q = glicko.expect(serve2, return1)
+        win_prob = self.prob_win_match(p, q, best_of)
+
+        glicko.rate_1vs1_inplace(serve1, return2, wsp1)
+        glicko.rate_1vs1_inplace(serve2, return1, wsp2)
+
+        self.set_rating(name1, "serve", serve1)
+        self.set_rating(name1, "return", return1)
+        self.set_rating(name2, "serve", serve2)
+        self.set_rating(name2, "return", return2)
+
+        return win_prob, 1
+
+    @overrides(tm.TennisRankingModel)
+    def _predict(self, player1, player2, best_of, surface=None):
+        '''
+        Override function from superclass.
+
+        :param player1: First player.
+        :param player2: Second player.
+        :param best_of: How many sets are played at most.
+        :param surface: Not used.
+        :return: Tuple (win_prob, p, q).
+        '''
+
+        glicko = self._glicko
+
+        p = glicko.expect(self.get_rating(player1, "serve"), self.get_rating(player2, "return"))
+        q = glicko.expect(self.get_rating(player2, "serve"), self.get_rating(player1, "return"))
+
+        return self.prob_win_match(p, q, best_of), p, q
 
+    def get_rating(self, name, prefix):
+        '''
+        Glicko2 rating object from player_rankings. Player that is not in
+        player_rankings gets starting rating.
+
+        :param name: Name (or id) of the player.
+        :param prefix: "serve" or "return".
+        :return: Rating.
+        '''
 
-        df = data.copy()
-        df["win_prob"] = probabilities
-        df["bet_amount"] = bet_amount
+        r = self.player_rankings
+        return self._glicko.create_rating(r.value(name, prefix + "_mu"), r.value(name, prefix + "_phi"),
+                                          r.value(name, prefix + "_sigma"))
 
-        return df
+    def set_rating(self, name, prefix, rating):
+        '''
+        Writes Glicko2 rating object to player_rankings. New player is added
+        to player_rankings.
+
+        :param name: Name (or id) of the player.
+        :param prefix: "serve" or "return".
+        :param rating: Rating.
+        :return: void
+        '''
+
+        r = self.player_rankings
+        i = r.row(name)
+        r[prefix + "_mu"][i] = rating.mu
+        r[prefix + "_phi"][i] = rating.phi
+        r[prefix + "_sigma"][i] = rating.sigma
+
+    @overrides(tm.TennisRankingModel)
+    def _finish_run(self, verbose=False):
+        '''
+        Override function from superclass.
+
+        :param verbose: Log or not?
+        :return: void
+        '''
+
+        if verbose:
+            r = self.player_rankings
+            top_n = r.top_n(20, r["serve_mu"] + r["return_mu"])
+            sez = [[r["serve_mu"][r.get(key)], r["return_mu"][r.get(key)], key] for key in top_n]
+            print '\n'.join(['{:>22s} {:8.1f} {:8.1f}'.format(str(p[2]), p[0], p[1]) for p in sez]) + "\n\n"
 
     @overrides(tm.TennisRankingModel)
     def _train_params(self, x, train_data, verbose=False):
@@ -59,7 +59,7 @@ class Match(object):
     '''
 
     def __init__(self, mu=1500, sigma_start=350,
-                 sigma_cap=100, c=100, Q=1.0/200):
+                 sigma_cap=100, c=100, Q=1.0/200, prob_win_match=None):
         '''
         Constructor.
 
@@ -68,6 +68,9 @@ class Match(object):
         :param sigma_cap: Final sigma.
         :param c: Sigma decrementing factor.
         :param Q: Rating modification factor.
+        :param prob_win_match: Function (p, q, best_of) -> probability of
+                                winning match, default is exact
+                                calc.prob_win_match.
         :return: void
         '''
 
@@ -77,6 +80,7 @@ class Match(object):
         self.c = c
         self.Q = Q
         self.glicko = rs.ModifiedGlicko(mu, sigma_start, sigma_cap, c, Q)
+        self.prob_win_match = prob_win_match or calc.prob_win_match
 
     def create_player(self, name=None, mu=None, sigma_start=None,
                       sigma_cap=None,c=None):
@@ -119,13 +123,8 @@ class Match(object):
         :return: Tuple of updates classes player1 and player2
         '''
 
-        a = player1.mg_att
-        r = player2.mg_def
-        player1.mg_att, player2.mg_def = self.glicko.match(a, r, result1)
-
-        a = player2.mg_att
-        r = player1.mg_def
-        player2.mg_att, player1.mg_def = self.glicko.match(a, r, result2)
+        self.glicko.match_inplace(player1.mg_att, player2.mg_def, result1)
+        self.glicko.match_inplace(player2.mg_att, player1.mg_def, result2)
 
         return player1, player2
 
@@ -160,7 +159,7 @@ class Match(object):
 
         p, q = self.expect(player1, player2)
 
-        win_prob = calc.prob_win_match(p, q, best_of)
+        win_prob = self.prob_win_match(p, q, best_of)
 
         return (win_prob, 1 - win_prob, p, q)
 
@@ -201,74 +200,201 @@ class DoubleModifiedGlickoModel(tm.TennisRankingModel):
                        }
         self.params.update(kwargs)
         super(self.__class__, self).__init__(**kwargs)
-        self.player_rankings = {}
-        self.player_games = {}
         self.name = "DoubleModifiedGlicko"
 
     @overrides(tm.TennisRankingModel)
-    def run(self, data, verbose=False):
+    def rating_columns(self):
         '''
-        Override function from superclass.
+        Override function from superclass. Both serve and return rating
+        keep rating, number of matches t and sigma.
 
-        :param data: Pandas dataframe on which to test model.
-        :return: void
+        :return: List of tuples (name, default value, dtype).
         '''
 
-        r = self.player_rankings
         p = self.params
-        g = self.player_games
-        glicko = Match(p["mu"], p["start_sigma"], p["end_sigma"], p["c"], p["Q"])
-        probabilities = []
-        bet_amount = []
-        P = []
-        Q = []
-        ser_list = []
-        ret_list = []
-
-        for i, row in data.iterrows():
-            name1 = row["Winner"]
-            name2 = row["Loser"]
-            wsp1 = row["WSP1"]
-            wsp2 = row["WSP2"]
+        sigma = 1.0 * max(p["start_sigma"], p["end_sigma"])
+        columns = []
+        for prefix in ["serve", "return"]:
+            columns += [(prefix, p["mu"], np.float64), (prefix + "_t", 0, np.int64),
+                        (prefix + "_sigma", sigma, np.float64)]
 
-            # If there is no data on serve win percentage, skip.
-            if math.isnan(wsp1) or math.isnan(wsp2):
-                probabilities.append(0.51)
-                bet_amount.append(0)
-                continue
+        return columns
 
-            if not r.get(name1, False):
-                r[name1] = glicko.create_player(name1)
-            if not r.get(name2, False):
-                r[name2] = glicko.create_player(name2)
+    history_columns = ("serve", "return", "serve_sigma")
 
-            p1, p2, p, q = glicko.win_probabilities(r[name1], r[name2], row["Best_of"])
-            probabilities.append(p1)
-            bet_amount.append(1)
-            s1 = r[name1].mg_att.sigma
-            s2 = r[name2].mg_att.sigma
-            s = r[name1].mg_att.sigma_cap
+    # If True, run replays matches with compiled
+    # calc.double_modified_glicko_run, otherwise with _run_match. Both give
+    # same results.
+    use_kernel = True
 
+    @overrides(tm.TennisRankingModel)
+    def run(self, data, verbose=False, checkpoint=None):
+        '''
+        Override function from superclass.
 
-            r1, r2 = glicko.match(r[name1], r[name2], wsp1, wsp2)
-            r[name1], r[name2] = r1, r2
+        :param data: Pandas dataframe or match store on which to run model.
+        :param verbose: Log or not?
+        :param checkpoint: Path to checkpoint to start from or None.
+        :return: Copy of data with columns win_prob and bet_amount.
+        '''
 
-            ret, ser = r1.mg_def.rating, r1.mg_att.rating
+        # Kernel only returns final ratings, history is recorded match by
+        # match.
+        if not self.use_kernel or self.record_history:
+            return super(DoubleModifiedGlickoModel, self).run(data, verbose, checkpoint)
 
+        data = self._begin_run(data, checkpoint)
 
-        self.player_rankings = r
-        self.player_games = g
+        self._start_run()
 
-        if verbose:
-            self.top_n_players(20, True)
+        r = self.player_rankings
+        glicko = self._glicko
+        n = len(data)
+        winners = data["Winner"].values
+        losers = data["Loser"].values
+        wsp1 = data["WSP1"].values.astype(np.float64)
+        wsp2 = data["WSP2"].values.astype(np.float64)
+        best_of = data["Best_of"].values.astype(np.int32)
+
+        # Only players with rated matches get rows, same as in _run_match.
+        # Matches without data are skipped by the kernel, their rows are 0.
+        rated = ~(np.isnan(wsp1) | np.isnan(wsp2))
+        rows = r.rows(np.column_stack([winners[rated], losers[rated]]).ravel())
+        winner_rows = np.zeros(n, dtype=np.int32)
+        loser_rows = np.zeros(n, dtype=np.int32)
+        winner_rows[rated] = rows[0::2]
+        loser_rows[rated] = rows[1::2]
+
+        probabilities, bet_amount, att_rating, att_t, def_rating, def_t = \
+            calc.double_modified_glicko_run(winner_rows, loser_rows, wsp1, wsp2, best_of,
+                                            r["serve"], r["serve_t"], r["return"], r["return_t"],
+                                            glicko.sigma_start, glicko.sigma_cap,
+                                            glicko.c, glicko.Q, **self._kernel_table_args())
+
+        r["serve"] = att_rating
+        r["serve_t"] = att_t
+        r["serve_sigma"] = np.maximum(glicko.sigma_start - att_t * glicko.c, glicko.sigma_cap)
+        r["return"] = def_rating
+        r["return_t"] = def_t
+        r["return_sigma"] = np.maximum(glicko.sigma_start - def_t * glicko.c, glicko.sigma_cap)
+
+        self._end_run(data)
+        self._finish_run(verbose)
 
         df = data.copy()
         df["win_prob"] = probabilities
         df["bet_amount"] = bet_amount
 
+        return df
 
+    @overrides(tm.TennisRankingModel)
+    def _start_run(self):
+        '''
+        Override function from superclass.
 
-        return df
+        :return: void
+        '''
+
+        p = self.params
+        self._glicko = Match(p["mu"], p["start_sigma"], p["end_sigma"], p["c"], p["Q"],
+                             self.prob_win_match)
+
+    @overrides(tm.TennisRankingModel)
+    def _run_match(self, name1, name2, wsp1, wsp2, best_of):
+        '''
+        Override function from superclass.
+
+        :param name1: Winner of the match.
+        :param name2: Loser of the match.
+        :param wsp1: Serve win percentage of the winner.
+        :param wsp2: Serve win percentage of the loser.
+        :param best_of: How many sets were played at most.
+        :return: Tuple (win_prob, bet_amount).
+        '''
+
+        glicko = self._glicko
+
+        # If there is no data on serve win percentage, skip.
+        if math.isnan(wsp1) or math.isnan(wsp2):
+            return 0.51, 0
+
+        player1 = self.get_player(name1)
+        player2 = self.get_player(name2)
+
+        p1, p2, p, q = glicko.win_probabilities(player1, player2, best_of)
+
+        player1, player2 = glicko.match(player1, player2, wsp1, wsp2)
+        self.set_player(player1)
+        self.set_player(player2)
+
+        return p1, 1
+
+    @overrides(tm.TennisRankingModel)
+    def _predict(self, player1, player2, best_of, surface=None):
+        '''
+        Override function from superclass.
+
+        :param player1: First player.
+        :param player2: Second player.
+        :param best_of: How many sets are played at most.
+        :param surface: Not used.
+        :return: Tuple (win_prob, p, q).
+        '''
+
+        player1 = self.get_player(player1)
+        player2 = self.get_player(player2)
+
+        p1, p2, p, q = self._glicko.win_probabilities(player1, player2, best_of)
+
+        return p1, p, q
+
+    def get_player(self, name):
+        '''
+        Player object with current ratings from player_rankings. Player that
+        is not in player_rankings gets starting ratings.
+
+        :param name: Name (or id) of the player.
+        :return: Player.
+        '''
+
+        r = self.player_rankings
+        player = self._glicko.create_player(name)
+
+        for rating, prefix in [(player.mg_att, "serve"), (player.mg_def, "return")]:
+            rating.rating = r.value(name, prefix)
+            rating.t = r.value(name, prefix + "_t")
+            rating.sigma = r.value(name, prefix + "_sigma")
+
+        return player
+
+    def set_player(self, player):
+        '''
+        Writes ratings of player object to player_rankings. New player is
+        added to player_rankings.
+
+        :param player: Player.
+        :return: void
+        '''
+
+        r = self.player_rankings
+        i = r.row(player.name)
+
+        for rating, prefix in [(player.mg_att, "serve"), (player.mg_def, "return")]:
+            r[prefix][i] = rating.rating
+            r[prefix + "_t"][i] = rating.t
+            r[prefix + "_sigma"][i] = rating.sigma
+
+    @overrides(tm.TennisRankingModel)
+    def _finish_run(self, verbose=False):
+        '''
+        Override function from superclass.
+
+        :param verbose: Log or not?
+        :return: void
+        '''
+
+        if verbose:
+            self.top_n_players(20, True)
 
     @overrides(tm.TennisRankingModel)
     def _train_params(self, x, train_data, verbose=False):
@@ -284,7 +410,6 @@ class DoubleModifiedGlickoModel(tm.TennisRankingModel):
         self.params["start_sigma"] = x[0]
         self.params["end_sigma"] = x[1]
         self.params["c"] = x[2]
-        self.player_rankings = {}
         error = self.train(train_data, verbose)
 
         if verbose:
@@ -304,14 +429,13 @@ class DoubleModifiedGlickoModel(tm.TennisRankingModel):
         :return: Sorted list of top n players.
         '''
 
-        sez = [player.get_info() for id, player in self.player_rankings.iteritems()]
-        sez = sorted(sez, key=lambda x: x[1] + x[2], reverse=True)
+        r = self.player_rankings
+        top_n = r.top_n(n, r["serve"] + r["return"])
 
         if verbose:
-            for p in sez[:n]:
-                print '{:>22s} {:8.1f} {:8.1f}'.format(str(p[0]), p[1], p[2])
-
-        top_n = [p[0] for p in sez[:n]]
+            for key in top_n:
+                i = r.get(key)
+                print '{:>22s} {:8.1f} {:8.1f}'.format(str(key), r["serve"][i], r["return"][i])
 
         return top_n
 
@@ -0,0 +1,257 @@
+'''
+Lookup tables of match win probabilities.
+
+prob_win_match is evaluated once on a dense (p, q) grid for best of 3 and
+best of 5 matches, after that probabilities inside the grid are bicubic
+(Catmull-Rom) interpolations of 16 neighbouring nodes, which is a constant
+amount of work. Probabilities outside of the grid are computed exactly.
+
+Every table knows its largest absolute error against the exact formula,
+measured in ERROR_OFFSETS of every grid cell, where error of a cubic is
+largest. get_table returns a table within given error tolerance. It is read from
+disk on first use and built (and saved) only if there is no table on disk
+that covers asked range with asked tolerance.
+'''
+
+__author__ = 'riko'
+
+
+import os
+
+import numpy as np
+
+import calculations as calc
+import settings as stg
+
+
+TABLE_PATH = getattr(stg, "TABLE_PATH", stg.ROOT_PATH + "data/match_table.npz")
+
+# Version of table files. Increase it when layout of the file changes.
+TABLE_VERSION = 1
+
+# Tables hold best of 3 and best of 5 matches, in this order.
+BEST_OF = (3, 5)
+
+# Default range of p and q, model outputs are practically always in it.
+LOW = 0.4
+HIGH = 0.9
+
+# Default and largest number of nodes per axis used by get_table.
+N_POINTS = 51
+MAX_POINTS = 1601
+
+# Positions inside a grid cell (per axis) where error is measured. Error of
+# cubic interpolation is largest at 1/2 +- 1/(2 sqrt(3)) and in the middle.
+ERROR_OFFSETS = np.array([0.5 - 0.5 / np.sqrt(3), 0.5, 0.5 + 0.5 / np.sqrt(3)])
+
+# Tables already used in this process, by path.
+_tables = {}
+
+
+class MatchTable(object):
+    '''
+    Table of match win probabilities on a (p, q) grid.
+    '''
+
+    def __init__(self, table, low, high, errors=None):
+        '''
+        Constructor.
+
+        :param table: Array of shape (2, n_points + 2, n_points + 2), see
+                        calculations._table_prob_win_match.
+        :param low: Smallest p and q in table.
+        :param high: Largest p and q in table.
+        :param errors: Dictionary best_of -> largest error, measured if None.
+        :return: void
+        '''
+
+        self.table = np.ascontiguousarray(table, dtype=np.float64)
+        self.low = low
+        self.high = high
+        self.n_points = self.table.shape[1] - 2
+        self.step = (high - low) / (self.n_points - 1)
+        self.errors = self.measure_errors() if errors is None else errors
+
+    @classmethod
+    def build(cls, low=LOW, high=HIGH, n_points=N_POINTS):
+        '''
+        Evaluates prob_win_match on grid.
+
+        :param low: Smallest p and q in table.
+        :param high: Largest p and q in table.
+        :param n_points: Number of nodes per axis between low and high.
+        :return: MatchTable.
+        '''
+
+        step = (high - low) / (n_points - 1)
+        if not 0.0 < low - step < high + step < 1.0:
+            raise ValueError("Table from %s to %s with %d points does not fit between 0 and 1!" %
+                             (low, high, n_points))
+
+        # One node on every side pads the table for the cubic.
+        nodes = low + step * np.arange(-1, n_points + 1)
+        p, q = np.meshgrid(nodes, nodes, indexing="ij")
+        table = np.array([calc.prob_win_match_batch(p, q, best_of) for best_of in BEST_OF])
+
+        return cls(table, low, high)
+
+    @property
+    def error(self):
+        '''
+        Largest error of table.
+
+        :return: Largest absolute error against exact formula.
+        '''
+
+        return max(self.errors.values())
+
+    def covers(self, low, high):
+        '''
+        Is range from low to high inside of table?
+
+        :param low: Smallest p and q.
+        :param high: Largest p and q.
+        :return: True or False.
+        '''
+
+        return self.low <= low and high <= self.high
+
+    def prob_win_match(self, p, q, best_of=3):
+        '''
+        Probability of winning a match, same as calculations.prob_win_match.
+
+        :param p: Probability of player1 winning serve point.
+        :param q: Probability of player2 winning serve point.
+        :param best_of: On how many sets is match decided.
+        :return: Probability of player1 winning the match.
+        '''
+
+        if best_of not in BEST_OF:
+            return calc.prob_win_match(p, q, best_of)
+
+        return calc._table_prob_win_match(self.table, self.low, self.step, p, q, best_of)
+
+    def prob_win_match_batch(self, p, q, best_of=3, out=None):
+        '''
+        Vectorized prob_win_match, see calculations.prob_win_match_batch.
+
+        :param p: Array of probabilities of player1 winning serve point.
+        :param q: Array of probabilities of player2 winning serve point.
+        :param best_of: Array of numbers of sets (3 or 5).
+        :param out: Optional C contiguous float64 array for the result.
+        :return: Array of probabilities of player1 winning the match.
+        '''
+
+        return calc.table_prob_win_match_batch(self.table, self.low, self.step, p, q, best_of, out)
+
+    def kernel_args(self):
+        '''
+        Arguments of model replay kernels in calculations.
+
+        :return: Dictionary with table, low and step.
+        '''
+
+        return {"table": self.table, "low": self.low, "step": self.step}
+
+    def measure_errors(self):
+        '''
+        Largest absolute error against exact formula, at ERROR_OFFSETS of
+        every grid cell.
+
+        :return: Dictionary best_of -> error.
+        '''
+
+        cells = np.arange(self.n_points - 1)
+        points = self.low + self.step * (cells[:, None] + ERROR_OFFSETS).ravel()
+        p, q = np.meshgrid(points, points, indexing="ij")
+
+        errors = {}
+        for best_of in BEST_OF:
+            exact = calc.prob_win_match_batch(p, q, best_of)
+            errors[best_of] = float(np.abs(self.prob_win_match_batch(p, q, best_of) - exact).max())
+
+        return errors
+
+    def save(self, path=TABLE_PATH):
+        '''
+        Saves table. File is written atomically, see
+        TennisRankingModel.save_checkpoint.
+
+        :param path: Path to table file.
+        :return: void
+        '''
+
+        directory = os.path.dirname(path)
+        if directory and not os.path.isdir(directory):
+            os.makedirs(directory)
+
+        temp_path = "%s.%d.tmp.npz" % (path, os.getpid())
+        np.savez_compressed(temp_path, version=TABLE_VERSION, table=self.table,
+                            low=self.low, high=self.high,
+                            best_of=np.array(BEST_OF),
+                            errors=np.array([self.errors[b] for b in BEST_OF]))
+        os.rename(temp_path, path)
+
+    @classmethod
+    def load(cls, path=TABLE_PATH):
+        '''
+        Loads table saved with save.
+
+        :param path: Path to table file.
+        :return: MatchTable.
+        '''
+
+        with np.load(path) as data:
+            if int(data["version"]) != TABLE_VERSION:
+                raise ValueError("Table '%s' has version %d, expected %d!" %
+                                 (path, int(data["version"]), TABLE_VERSION))
+
+            errors = dict(zip(data["best_of"].tolist(), data["errors"].tolist()))
+            return cls(data["table"], float(data["low"]), float(data["high"]), errors)
+
+
+def get_table(tolerance, low=LOW, high=HIGH, path=TABLE_PATH):
+    '''
+    Table with error at most tolerance from low to high. Table is loaded
+    from path on first call. If it is missing, too small or not accurate
+    enough, a new table is built and saved to path. New table also covers
+    range and tolerance of the old one, so models with different
+    tolerances do not overwrite each other's tables. Error of cubic
+    interpolation falls with third power of step, so number of nodes is
+    estimated from error of a small table.
+
+    :param tolerance: Largest allowed absolute error.
+    :param low: Smallest p and q.
+    :param high: Largest p and q.
+    :param path: Path to table file or None to not use disk.
+    :return: MatchTable.
+    '''
+
+    table = _tables.get(path)
+    if table is None and path is not None and os.path.exists(path):
+        table = MatchTable.load(path)
+        _tables[path] = table
+
+    if table is not None:
+        if table.covers(low, high) and table.error <= tolerance:
+            return table
+
+        low, high = min(low, table.low), max(high, table.high)
+        tolerance = min(tolerance, table.error)
+
+    n_points = N_POINTS
+    table = MatchTable.build(low, high, n_points)
+    while table.error > tolerance:
+        # 10% more nodes than estimated, so one more build is usually enough.
+        factor = 1.1 * (table.error / tolerance) ** (1.0 / 3)
+        n_points = int(np.ceil((n_points - 1) * factor)) + 1
+        if n_points > MAX_POINTS:
+            raise ValueError("Table with error at most %g needs more than %d points!" %
+                             (tolerance, MAX_POINTS))
+        table = MatchTable.build(low, high, n_points)
+
+    if path is not None:
+        table.save(path)
+    _tables[path] = table
+
+    return table
@@ -1,9 +1,11 @@
 __author__ = 'riko'
 
 
+import numpy as np
+
+import ranking_systems as rs
 import tennis_model as tm
 from tennis_model import overrides
-import modified_glicko as mg
 
 
 class ModifiedGlickoModel(tm.TennisRankingModel):
@@ -36,46 +38,110 @@ class ModifiedGlickoModel(tm.TennisRankingModel):
         super(self.__class__, self).__init__(**kwargs)
         self.name = "ModifiedGlicko"
 
+    match_columns = ["Winner", "Loser"]
+
+    # Model has only one rating, it is recorded as serve rating.
+    history_columns = ("rating", None, "sigma")
+
     @overrides(tm.TennisRankingModel)
-    def run(self, data, verbose=False):
+    def rating_columns(self):
+        '''
+        Override function from superclass.
+
+        :return: List of tuples (name, default value, dtype).
+        '''
+
+        p = self.params
+        sigma = 1.0 * max(p["start_sigma"], p["end_sigma"])
+        return [("rating", p["mu"], np.float64), ("t", 0, np.int64), ("sigma", sigma, np.float64)]
+
+    @overrides(tm.TennisRankingModel)
+    def _start_run(self):
         '''
         Override function from superclass.
 
-        :param data: Pandas dataframe on which to run model.
         :return: void
         '''
 
         p = self.params
-        glicko = mg.ModifiedGlicko(p["mu"], p["start_sigma"], p["end_sigma"], p["c"], p["Q"])
+        self._glicko = rs.ModifiedGlicko(p["mu"], p["start_sigma"], p["end_sigma"], p["c"], p["Q"])
 
-        r = self.player_rankings
-        probabilities = []
-        bet_amount = []
-        for i, row in data.iterrows():
-            name1 = row["Winner"]
-            name2 = row["Loser"]
+    @overrides(tm.TennisRankingModel)
+    def _run_match(self, name1, name2):
+        '''
+        Override function from superclass.
 
-            if not r.get(name1, False):
-                r[name1] = glicko.create_rating()
-            if not r.get(name2, False):
-                r[name2] = glicko.create_rating()
+        :param name1: Winner of the match.
+        :param name2: Loser of the match.
+        :return: Tuple (win_prob, bet_amount).
+        '''
+
+        glicko = self._glicko
 
-            prob = glicko.expect(r[name1], r[name2])
-            probabilities.append(prob)
+        rating1 = self.get_rating(name1)
+        rating2 = self.get_rating(name2)
 
-            s1 = r[name1].sigma
-            s2 = r[name2].sigma
-            s = r[name1].sigma_cap
-            bet_amount.append((1./s1 + 1./s2) / (2. / s))
+        prob = glicko.expect(rating1, rating2)
 
-            r[name1], r[name2] = glicko.match(r[name1], r[name2], 1.0)
+        s1 = rating1.sigma
+        s2 = rating2.sigma
+        s = rating1.sigma_cap
+        bet = (1./s1 + 1./s2) / (2. / s)
 
-        self.player_rankings = r
-        df = data.copy()
-        df["win_prob"] = probabilities
-        df["bet_amount"] = bet_amount
+        glicko.match_inplace(rating1, rating2, 1.0)
+        self.set_rating(name1, rating1)
+        self.set_rating(name2, rating2)
 
-        return df
+        return prob, bet
+
+    @overrides(tm.TennisRankingModel)
+    def _predict(self, player1, player2, best_of, surface=None):
+        '''
+        Override function from superclass. Model has no serve ratings, so p
+        and q are NaN.
+
+        :param player1: First player.
+        :param player2: Second player.
+        :param best_of: Not used.
+        :param surface: Not used.
+        :return: Tuple (win_prob, p, q).
+        '''
+
+        prob = self._glicko.expect(self.get_rating(player1), self.get_rating(player2))
+
+        return prob, float("nan"), float("nan")
+
+    def get_rating(self, name):
+        '''
+        Rating object from player_rankings. Player that is not in
+        player_rankings gets starting rating.
+
+        :param name: Name (or id) of the player.
+        :return: Rating.
+        '''
+
+        r = self.player_rankings
+        rating = self._glicko.create_rating(r.value(name, "rating"))
+        rating.t = r.value(name, "t")
+        rating.sigma = r.value(name, "sigma")
+
+        return rating
+
+    def set_rating(self, name, rating):
+        '''
+        Writes rating object to player_rankings. New player is added to
+        player_rankings.
+
+        :param name: Name (or id) of the player.
+        :param rating: Rating.
+        :return: void
+        '''
+
+        r = self.player_rankings
+        i = r.row(name)
+        r["rating"][i] = rating.rating
+        r["t"][i] = rating.t
+        r["sigma"][i] = rating.sigma
 
     @overrides(tm.TennisRankingModel)
     def _train_params(self, x, train_data, verbose=False):
@@ -0,0 +1,291 @@
+'''
+Parallel search of model parameters.
+
+Candidate parameter vectors are evaluated with _train_params of the model
+in a pool of worker processes. Every worker gets its own copy of the model
+(with all its settings, e.g. prob_tolerance) and train data once, when it
+starts, so only parameter vectors and errors are
+sent between processes afterwards.
+
+Search methods:
+- "grid" - all combinations of given values (or n_points values between
+  bounds) of every parameter,
+- "random" - n_points vectors drawn uniformly from bounds,
+- "multistart" - Nelder-Mead from approx and from n_points - 1 random
+  starting points, each start running in its own worker.
+'''
+
+__author__ = 'riko'
+
+
+import copy
+import itertools
+import multiprocessing
+import time
+
+import numpy as np
+import scipy.optimize as sco
+
+
+METHODS = ["grid", "random", "multistart"]
+
+
+################################################################################
+#    Workers.                                                                  #
+################################################################################
+
+
+# Model and data of a worker process, set by _init_worker.
+_worker = {}
+
+
+class TimeBudgetExceeded(Exception):
+    '''
+    Raised inside Nelder-Mead when time budget is used up.
+    '''
+
+    pass
+
+
+def _init_worker(model, train_data):
+    '''
+    Initializer of worker processes.
+
+    :param model: Copy of the model, used only by this worker.
+    :param train_data: Data to train params on.
+    :return: void
+    '''
+
+    _worker["model"] = model
+    _worker["data"] = train_data
+
+
+def _evaluate(x):
+    '''
+    Error of model for parameters x.
+
+    :param x: Parameter vector.
+    :return: Error, NaN is replaced with inf.
+    '''
+
+    error = float(_worker["model"]._train_params(list(x), _worker["data"], False))
+    if np.isnan(error):
+        return np.inf
+
+    return error
+
+
+def _evaluate_task(task):
+    '''
+    Evaluates one candidate of grid or random search.
+
+    :param task: Pair (index of candidate, parameter vector).
+    :return: Tuple (index, error).
+    '''
+
+    i, x = task
+    return i, _evaluate(x)
+
+
+def _minimize_task(task):
+    '''
+    Runs Nelder-Mead from one starting point.
+
+    :param task: Tuple (starting point, deadline as time.time() or None,
+                    options of scipy.optimize.minimize).
+    :return: Pair of lists (evaluated points, their errors).
+    '''
+
+    x0, deadline, options = task
+    points = []
+    errors = []
+
+    def error(x):
+        if deadline is not None and time.time() > deadline:
+            raise TimeBudgetExceeded()
+        e = _evaluate(x)
+        points.append(list(x))
+        errors.append(e)
+        return e
+
+    try:
+        sco.minimize(error, x0, method="Nelder-Mead", options=options)
+    except TimeBudgetExceeded:
+        pass
+
+    return points, errors
+
+
+################################################################################
+#    Candidates.                                                               #
+################################################################################
+
+
+def grid_points(grid=None, bounds=None, n_points=10):
+    '''
+    Candidates of grid search.
+
+    :param grid: List with array of values for every parameter.
+    :param bounds: List of pairs (low, high), used if grid is None.
+    :param n_points: Number of values between bounds of every parameter,
+                        integer or list with one integer per parameter.
+    :return: Numpy array with one candidate per row.
+    '''
+
+    if grid is None:
+        if bounds is None:
+            raise ValueError("Grid search needs grid or bounds!")
+        if np.isscalar(n_points):
+            n_points = [n_points] * len(bounds)
+        grid = [np.linspace(low, high, n) for (low, high), n in zip(bounds, n_points)]
+
+    return np.array(list(itertools.product(*grid)), dtype=np.float64)
+
+
+def random_points(bounds, n_points, seed=None):
+    '''
+    Candidates drawn uniformly from bounds.
+
+    :param bounds: List of pairs (low, high).
+    :param n_points: Number of candidates.
+    :param seed: Seed of random generator.
+    :return: Numpy array with one candidate per row.
+    '''
+
+    if bounds is None:
+        raise ValueError("Random search needs bounds!")
+
+    low, high = np.array(bounds, dtype=np.float64).T
+    rnd = np.random.RandomState(seed)
+    return low + (high - low) * rnd.random_sample((n_points, len(low)))
+
+
+################################################################################
+#    Search.                                                                   #
+################################################################################
+
+
+def _make_pool(model, train_data, processes):
+    '''
+    Pool of workers. With one process candidates are evaluated in this
+    process, without a pool.
+
+    :param model: Model whose parameters we search.
+    :param train_data: Data to train params on.
+    :param processes: Number of worker processes.
+    :return: multiprocessing.Pool or None.
+    '''
+
+    # Workers search on a copy, so model itself is not changed, but keeps
+    # its settings (prob_tolerance, use_kernel...).
+    worker_model = copy.deepcopy(model)
+    worker_model.reset_rankings()
+    args = (worker_model, train_data)
+
+    if processes == 1:
+        _init_worker(*args)
+        return None
+
+    return multiprocessing.Pool(processes, _init_worker, args)
+
+
+def search_params(model, train_data, method, approx=None, bounds=None, grid=None,
+                  n_points=10, processes=None, time_budget=None, seed=None,
+                  options=None, verbose=False):
+    '''
+    Searches parameters of model in parallel. Model itself is not changed.
+
+    :param model: Model derived from TennisRankingModel.
+    :param train_data: Data to train params on (dataframe or match store).
+    :param method: "grid", "random" or "multistart".
+    :param approx: Approximation of parameters, first start of multistart.
+    :param bounds: List of pairs (low, high), one per parameter.
+    :param grid: List of arrays of values, one per parameter (grid only).
+    :param n_points: Grid points per parameter (grid), number of candidates
+                        (random) or number of starts (multistart).
+    :param processes: Number of worker processes, default is number of CPUs.
+    :param time_budget: Seconds after which no new candidate is evaluated.
+                        None means no limit.
+    :param seed: Seed of random candidates.
+    :param options: Options of Nelder-Mead (multistart only).
+    :param verbose: Log or not?
+    :return: scipy.optimize.OptimizeResult with x (best parameters), fun
+                (their error), points (all evaluated parameters, one per
+                row), errors (their errors), nfev, elapsed and success
+                (False if time budget stopped search).
+    '''
+
+    if method not in METHODS:
+        raise ValueError("Unknown search method '%s', use one of %s!" % (method, METHODS))
+
+    start = time.time()
+    deadline = None if time_budget is None else start + time_budget
+    processes = processes or multiprocessing.cpu_count()
+
+    if method == "grid":
+        candidates = grid_points(grid, bounds, n_points)
+    elif method == "random":
+        candidates = random_points(bounds, n_points, seed)
+    else:
+        n_random = n_points - (approx is not None)
+        candidates = [np.array([approx], dtype=np.float64)] if approx is not None else []
+        if n_random > 0:
+            candidates.append(random_points(bounds, n_random, seed))
+        candidates = np.vstack(candidates)
+
+    pool = _make_pool(model, train_data, processes)
+    complete = True
+
+    if method == "multistart":
+        tasks = [(x0, deadline, options) for x0 in candidates]
+        results = pool.imap_unordered(_minimize_task, tasks) if pool else itertools.imap(_minimize_task, tasks)
+
+        points = []
+        errors = []
+        for start_points, start_errors in results:
+            points += start_points
+            errors += start_errors
+            if verbose:
+                i = int(np.argmin(start_errors)) if start_errors else None
+                if i is not None:
+                    print "Start finished: best", start_points[i], "error", start_errors[i]
+
+        complete = deadline is None or time.time() <= deadline
+        points = np.array(points, dtype=np.float64).reshape(-1, candidates.shape[1])
+        errors = np.array(errors, dtype=np.float64)
+    else:
+        tasks = list(enumerate(candidates))
+        results = pool.imap_unordered(_evaluate_task, tasks) if pool else itertools.imap(_evaluate_task, tasks)
+
+        done = np.zeros(len(candidates), dtype=bool)
+        errors = np.empty(len(candidates), dtype=np.float64)
+        for i, error in results:
+            done[i] = True
+            errors[i] = error
+            if verbose:
+                print "Parameters:", candidates[i], "Error:", error
+            if deadline is not None and time.time() > deadline and not done.all():
+                complete = False
+                break
+
+        # Candidates are returned in their order, e.g. grid order.
+        points = candidates[done]
+        errors = errors[done]
+
+    if pool is not None:
+        if complete:
+            pool.close()
+        else:
+            pool.terminate()
+        pool.join()
+    else:
+        _worker.clear()
+
+    if not len(errors):
+        raise RuntimeError("No parameters were evaluated in time budget of %s seconds!" % time_budget)
+
+    best = int(np.argmin(errors))
+
+    return sco.OptimizeResult(x=points[best], fun=errors[best], points=points, errors=errors,
+                              nfev=len(errors), elapsed=time.time() - start, success=complete,
+                              method=method)
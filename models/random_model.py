@@ -24,23 +24,50 @@ class RandomModel(tm.TennisRankingModel):
         self.params = {}
         self.params.update(kwargs)
         super(self.__class__, self).__init__(**kwargs)
-        self.player_rankings = {}
         self.name = "Random"
 
     @overrides(tm.TennisRankingModel)
-    def run(self, data, verbose=False):
+    def run(self, data, verbose=False, checkpoint=None):
         '''
         Override function from superclass.
 
         :param data: Pandas dataframe on which to test model.
+        :param checkpoint: Path to checkpoint to start from or None.
         :return: Updated dataframe.
         '''
 
+        data = self._begin_run(data, checkpoint)
         n = np.size(data["Winner"])
         probabilities = [random.random() for i in xrange(n)]
         bet_amount = [1.0 for i in xrange(n)]
         df = data.copy()
         df["win_prob"] = probabilities
         df["bet_amount"] = bet_amount
+        self._end_run(data)
 
-        return df
\ No newline at end of file
+        return df
+
+    @overrides(tm.TennisRankingModel)
+    def _run_match(self, *values):
+        '''
+        Override function from superclass.
+
+        :param values: Values of match_columns for one match, not used.
+        :return: Tuple (win_prob, bet_amount).
+        '''
+
+        return random.random(), 1.0
+
+    @overrides(tm.TennisRankingModel)
+    def _predict(self, player1, player2, best_of, surface=None):
+        '''
+        Override function from superclass.
+
+        :param player1: First player, not used.
+        :param player2: Second player, not used.
+        :param best_of: Not used.
+        :param surface: Not used.
+        :return: Tuple (win_prob, p, q).
+        '''
+
+        return random.random(), float("nan"), float("nan")
@@ -0,0 +1,271 @@
+'''
+History of player ratings.
+
+While model runs, every rated match appends one entry per player: day of
+the match, row of the player in RatingStore and his serve rating, return
+rating and sigma after the match. Entries are kept in flat append-only
+arrays. For lookups they are ordered by player once (stable, so entries of
+each player stay in time order), after that rating of one player at a date
+is a binary search and ratings of all players at a date are one vectorized
+pass.
+'''
+
+__author__ = 'riko'
+
+
+import collections
+import datetime
+
+import numpy as np
+import pandas as pd
+
+
+# Days are counted from EPOCH, same as in data_tools.match_store.
+EPOCH = datetime.date(1970, 1, 1)
+
+HISTORY_DTYPES = collections.OrderedDict([("day", np.int32), ("row", np.int32),
+                                          ("serve", np.float64), ("return", np.float64),
+                                          ("sigma", np.float64)])
+
+
+def day_number(date):
+    '''
+    Number of days from EPOCH.
+
+    :param date: datetime.date, datetime or anything pd.Timestamp accepts.
+    :return: Integer.
+    '''
+
+    return (pd.Timestamp(date).date() - EPOCH).days
+
+
+def day_numbers(dates):
+    '''
+    Vectorized day_number.
+
+    :param dates: Array of dates.
+    :return: Numpy array of int32.
+    '''
+
+    days = pd.to_datetime(pd.Series(dates)).values.astype("datetime64[D]")
+    return days.astype(np.int64).astype(np.int32)
+
+
+class RatingHistory(object):
+    '''
+    Append-only history of ratings of players from one RatingStore.
+    '''
+
+    def __init__(self, store, capacity=1024):
+        '''
+        Constructor.
+
+        :param store: RatingStore of the model, used to map player keys to
+                        rows.
+        :param capacity: Number of entries allocated at start.
+        :return: void
+        '''
+
+        self.store = store
+        self._n = 0
+        self._capacity = capacity
+        self._data = dict((name, np.empty(capacity, dtype=dtype))
+                          for name, dtype in HISTORY_DTYPES.iteritems())
+        self._index = None
+
+    def __len__(self):
+        '''
+        Number of entries.
+
+        :return: Number of entries.
+        '''
+
+        return self._n
+
+    def __getitem__(self, name):
+        '''
+        Column of history (day, row, serve, return or sigma), ordered by
+        time of entries.
+
+        :param name: Name of the column.
+        :return: Numpy array.
+        '''
+
+        return self._data[name][:self._n]
+
+    def append(self, day, rows, serve, ret, sigma):
+        '''
+        Adds entries.
+
+        :param day: Day number of entries (scalar or one per entry).
+        :param rows: Rows of players in store.
+        :param serve: Serve ratings after the match.
+        :param ret: Return ratings after the match.
+        :param sigma: Sigmas after the match (NaN for models without it).
+        :return: void
+        '''
+
+        rows = np.atleast_1d(rows)
+        start = self._n
+        end = start + len(rows)
+
+        if end > self._capacity:
+            capacity = max(end, 2 * self._capacity)
+            for name, array in self._data.items():
+                new_array = np.empty(capacity, dtype=array.dtype)
+                new_array[:start] = array[:start]
+                self._data[name] = new_array
+            self._capacity = capacity
+
+        for name, values in [("day", day), ("row", rows), ("serve", serve),
+                             ("return", ret), ("sigma", sigma)]:
+            self._data[name][start:end] = values
+
+        self._n = end
+        self._index = None
+
+    def _get_index(self):
+        '''
+        Entries ordered by player. Built once after entries change.
+
+        :return: Tuple (order, starts), entries of player in row i are
+                    order[starts[i]:starts[i + 1]], oldest first.
+        '''
+
+        if self._index is None:
+            rows = self["row"]
+            order = np.argsort(rows, kind="mergesort")
+            n_players = max(len(self.store), rows.max() + 1 if len(rows) else 0)
+            starts = np.searchsorted(rows[order], np.arange(n_players + 1))
+            self._index = (order, starts)
+
+        return self._index
+
+    def _entries(self, key):
+        '''
+        Entries of one player.
+
+        :param key: Player key.
+        :return: Numpy array of entry positions, oldest first.
+        '''
+
+        row = self.store.get(key)
+        order, starts = self._get_index()
+        if row is None or row + 1 >= len(starts):
+            return order[:0]
+
+        return order[starts[row]:starts[row + 1]]
+
+    def at(self, key, date):
+        '''
+        Rating of player after all his matches up to and including date.
+
+        :param key: Player key.
+        :param date: datetime.date.
+        :return: Tuple (serve, return, sigma) or None if player has no
+                    match up to date.
+        '''
+
+        entries = self._entries(key)
+        i = np.searchsorted(self["day"][entries], day_number(date), side="right") - 1
+        if i < 0:
+            return None
+
+        entry = entries[i]
+        return self["serve"][entry], self["return"][entry], self["sigma"][entry]
+
+    def trajectory(self, key):
+        '''
+        All ratings of player, one row per match.
+
+        :param key: Player key.
+        :return: Pandas dataframe with columns Date, serve, return, sigma.
+        '''
+
+        entries = self._entries(key)
+        days = self["day"][entries].astype("datetime64[D]")
+
+        return pd.DataFrame(collections.OrderedDict([
+            ("Date", [d.item() for d in days]),
+            ("serve", self["serve"][entries]),
+            ("return", self["return"][entries]),
+            ("sigma", self["sigma"][entries])
+        ]))
+
+    def ratings_at(self, date):
+        '''
+        Ratings of all players after all matches up to and including date.
+
+        :param date: datetime.date.
+        :return: Pandas dataframe with columns serve, return, sigma indexed
+                    by player key. Players without match up to date are
+                    left out.
+        '''
+
+        order, _ = self._get_index()
+        return self._latest(self["day"][order] <= day_number(date))
+
+    def ratings_after(self, entry):
+        '''
+        Ratings of all players right after entry was added, so matches
+        played later on the same day are not counted.
+
+        :param entry: Position of entry (in time order).
+        :return: Pandas dataframe, same as ratings_at.
+        '''
+
+        order, _ = self._get_index()
+        return self._latest(order <= entry)
+
+    def _latest(self, mask):
+        '''
+        Last entry of every player among entries that pass mask.
+
+        :param mask: Boolean numpy array over entries ordered by player
+                        (see _get_index).
+        :return: Pandas dataframe, same as ratings_at.
+        '''
+
+        order, starts = self._get_index()
+        columns = ["serve", "return", "sigma"]
+        if not len(order):
+            return pd.DataFrame(columns=columns)
+
+        # Within each player entries are in time order, so the last entry
+        # that passes the mask is the largest position that passes it.
+        positions = np.where(mask, np.arange(len(order)), -1)
+
+        players = np.nonzero(starts[1:] > starts[:-1])[0]
+        last = np.maximum.reduceat(positions, starts[players])
+        found = last >= 0
+        players, entries = players[found], order[last[found]]
+
+        keys = self.store.keys
+        return pd.DataFrame(collections.OrderedDict((name, self[name][entries]) for name in columns),
+                            index=pd.Index([keys[i] for i in players], dtype=object))
+
+    def get_state(self):
+        '''
+        History as plain numpy arrays, see RatingStore.get_state.
+
+        :return: Dictionary "history_<column>" -> numpy array.
+        '''
+
+        return dict(("history_" + name, self[name]) for name in HISTORY_DTYPES)
+
+    @classmethod
+    def from_state(cls, store, state):
+        '''
+        Inverse of get_state.
+
+        :param store: RatingStore the history belongs to.
+        :param state: Dictionary (or np.load result) from get_state.
+        :return: RatingHistory.
+        '''
+
+        n = len(state["history_day"])
+        history = cls(store, max(n, 1024))
+        history.append(state["history_day"], state["history_row"], state["history_serve"],
+                       state["history_return"], state["history_sigma"])
+
+        return history
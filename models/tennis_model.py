@@ -7,9 +7,26 @@ It is used for training, testing and parameter setting.
 __author__ = 'riko'
 
 
+import collections
+import datetime
+import json
+import os
+
 import numpy as np
+import pandas as pd
 import scipy.optimize as sco
 
+import calculations as calc
+import match_table as mt
+import param_search as ps
+import rating_history as rh
+from rating_history import RatingHistory
+
+
+# Version of checkpoint files written by save_checkpoint. Increase it when
+# layout of the file changes.
+CHECKPOINT_VERSION = 3
+
 
 def overrides(interface_class):
     def overrider(method):
@@ -18,6 +35,267 @@ def overrides(interface_class):
     return overrider
 
 
+class RatingStore(object):
+    '''
+    Ratings of all players, stored column wise. Every player (key can be
+    a name or an id) gets a row and every value a model keeps for a player
+    (serve rating, sigma, number of games...) is one numpy column. Columns
+    grow by doubling, so adding a player is amortised O(1), and a player
+    takes only a few numbers instead of a few objects.
+    '''
+
+    def __init__(self, columns=None, capacity=256):
+        '''
+        Constructor.
+
+        :param columns: List of tuples (name, default value, dtype).
+        :param capacity: Number of rows allocated at start.
+        :return: void
+        '''
+
+        self.index = {}
+        self.keys = []
+        self.defaults = collections.OrderedDict()
+        self._data = {}
+        self._capacity = capacity
+
+        for name, default, dtype in columns or []:
+            self.add_column(name, default, dtype)
+
+    def __len__(self):
+        '''
+        Number of players.
+
+        :return: Number of players.
+        '''
+
+        return len(self.keys)
+
+    def __contains__(self, key):
+        '''
+        Is player in store?
+
+        :param key: Player key.
+        :return: True if player has a row.
+        '''
+
+        return key in self.index
+
+    def __iter__(self):
+        '''
+        Iterates over player keys in order of rows.
+
+        :return: Iterator of keys.
+        '''
+
+        return iter(self.keys)
+
+    def __getitem__(self, name):
+        '''
+        Column of the store. It is a view, so changes are written into the
+        store, but it is only valid until next player is added.
+
+        :param name: Name of the column.
+        :return: Numpy array with one value per player.
+        '''
+
+        return self._data[name][:len(self.keys)]
+
+    def __setitem__(self, name, values):
+        '''
+        Overwrites whole column.
+
+        :param name: Name of the column.
+        :param values: One value per player.
+        :return: void
+        '''
+
+        self._data[name][:len(self.keys)] = values
+
+    @property
+    def columns(self):
+        '''
+        Names of columns.
+
+        :return: List of names.
+        '''
+
+        return list(self.defaults)
+
+    def add_column(self, name, default=0.0, dtype=np.float64):
+        '''
+        Adds column. Existing players get default value.
+
+        :param name: Name of the column.
+        :param default: Value of new players.
+        :param dtype: Numpy type of the column.
+        :return: void
+        '''
+
+        array = np.empty(self._capacity, dtype=dtype)
+        array[:len(self.keys)] = default
+        self.defaults[name] = default
+        self._data[name] = array
+
+    def _grow(self, size):
+        '''
+        Makes sure columns have room for "size" rows.
+
+        :param size: Needed number of rows.
+        :return: void
+        '''
+
+        if size <= self._capacity:
+            return
+
+        capacity = max(size, 2 * self._capacity)
+        n = len(self.keys)
+        for name, array in self._data.items():
+            new_array = np.empty(capacity, dtype=array.dtype)
+            new_array[:n] = array[:n]
+            self._data[name] = new_array
+
+        self._capacity = capacity
+
+    def get(self, key, default=None):
+        '''
+        Row of a player.
+
+        :param key: Player key.
+        :param default: Returned if player is not in store.
+        :return: Row or default.
+        '''
+
+        return self.index.get(key, default)
+
+    def value(self, key, name):
+        '''
+        Value of a player in column. Player that is not in store has default
+        value and is not added.
+
+        :param key: Player key.
+        :param name: Name of the column.
+        :return: Value.
+        '''
+
+        array = self._data[name]
+        row = self.index.get(key)
+        if row is None:
+            return array.dtype.type(self.defaults[name])
+
+        return array[row]
+
+    def row(self, key):
+        '''
+        Row of a player. New player is added with default values.
+
+        :param key: Player key.
+        :return: Row.
+        '''
+
+        row = self.index.get(key)
+        if row is None:
+            row = len(self.keys)
+            self._grow(row + 1)
+            for name, default in self.defaults.iteritems():
+                self._data[name][row] = default
+            self.index[key] = row
+            self.keys.append(key)
+
+        return row
+
+    def rows(self, keys):
+        '''
+        Rows of many players. New players are added with default values in
+        order of their first appearance.
+
+        :param keys: Array of player keys.
+        :return: Numpy array of rows.
+        '''
+
+        new_keys = [key for key in pd.unique(keys) if key not in self.index]
+        if new_keys:
+            start = len(self.keys)
+            end = start + len(new_keys)
+            self._grow(end)
+            for name, default in self.defaults.iteritems():
+                self._data[name][start:end] = default
+            for row, key in enumerate(new_keys, start):
+                self.index[key] = row
+            self.keys.extend(new_keys)
+
+        index = self.index
+        return np.array([index[key] for key in keys], dtype=np.int32)
+
+    def top_n(self, n, score):
+        '''
+        Players with highest score.
+
+        :param n: Number of players.
+        :param score: Numpy array with one score per player, e.g.
+                        store["serve"] + store["return"].
+        :return: List of n player keys, best first.
+        '''
+
+        order = np.argsort(-score, kind="mergesort")[:n]
+        return [self.keys[i] for i in order]
+
+    def to_frame(self):
+        '''
+        Exports store.
+
+        :return: Pandas dataframe with one row per player, indexed by key.
+        '''
+
+        data = collections.OrderedDict((name, self[name].copy()) for name in self.defaults)
+        return pd.DataFrame(data, index=pd.Index(self.keys, dtype=object), columns=self.columns)
+
+    def get_state(self):
+        '''
+        Whole store as plain numpy arrays, so it can be saved with np.savez
+        without pickling.
+
+        :return: Dictionary name -> numpy array. Keys are in "keys", column
+                    names in "columns", their defaults in "defaults" and
+                    values of column c in "column_c".
+        '''
+
+        keys = np.array(self.keys)
+        if keys.dtype == object:
+            raise ValueError("Player keys must be all strings or all numbers!")
+
+        state = {"keys": keys,
+                 "columns": np.array(self.columns),
+                 "defaults": np.array(self.defaults.values(), dtype=np.float64)}
+        for name in self.defaults:
+            state["column_" + name] = self[name]
+
+        return state
+
+    @classmethod
+    def from_state(cls, state):
+        '''
+        Inverse of get_state.
+
+        :param state: Dictionary (or np.load result) from get_state.
+        :return: RatingStore.
+        '''
+
+        keys = state["keys"].tolist()
+        store = cls(capacity=max(len(keys), 256))
+
+        for name, default in zip(state["columns"].tolist(), state["defaults"].tolist()):
+            values = state["column_" + name]
+            store.add_column(name, values.dtype.type(default), values.dtype)
+
+        store.keys = keys
+        store.index = dict((key, i) for i, key in enumerate(keys))
+        for name in store.defaults:
+            store[name] = state["column_" + name]
+
+        return store
+
+
 class TennisRankingModel(object):
     '''
     General tennis model. Other models are derived from it.
@@ -32,9 +310,17 @@ class TennisRankingModel(object):
         '''
 
         self.params.update(kwargs)
-        self.player_rankings = {}
-        self.surface_advantage = {}
-        self.player_games = {}
+        self.reset_rankings()
+
+    def rating_columns(self):
+        '''
+        Columns of RatingStore in which model keeps state of players.
+        Override it in derived class.
+
+        :return: List of tuples (name, default value, dtype).
+        '''
+
+        return []
 
     def reset_rankings(self):
         '''
@@ -43,22 +329,108 @@ class TennisRankingModel(object):
         :return: void.
         '''
 
-        self.player_rankings = {}
+        self.player_rankings = RatingStore(self.rating_columns())
+        self.history = RatingHistory(self.player_rankings)
+        self._started = False
+        self.last_date = None
+        self.last_count = 0
+        self.last_id = None
+
+    # If True, run records ratings of both players after every match into
+    # self.history (see rating_history.py).
+    record_history = False
+
+    # Columns of RatingStore recorded as serve rating, return rating and
+    # sigma in history. None means model has no such value (recorded as NaN),
+    # history_columns = None means model can not record history.
+    history_columns = None
+
+    # Largest allowed error of match win probabilities. None means exact
+    # calc.prob_win_match, otherwise probabilities are interpolated from
+    # match_table.get_table(prob_tolerance).
+    prob_tolerance = None
+
+    def prob_win_match(self, p, q, best_of=3):
+        '''
+        Probability of winning a match, exact or from lookup table, see
+        prob_tolerance.
+
+        :param p: Probability of player1 winning serve point.
+        :param q: Probability of player2 winning serve point.
+        :param best_of: On how many sets is match decided.
+        :return: Probability of player1 winning the match.
+        '''
+
+        if self.prob_tolerance is None:
+            return calc.prob_win_match(p, q, best_of)
+
+        return mt.get_table(self.prob_tolerance).prob_win_match(p, q, best_of)
+
+    def _kernel_table_args(self):
+        '''
+        Lookup table arguments of replay kernels in calculations.
+
+        :return: Dictionary, empty if probabilities are exact.
+        '''
+
+        if self.prob_tolerance is None:
+            return {}
+
+        return mt.get_table(self.prob_tolerance).kernel_args()
+
+    def _history_values(self, rows):
+        '''
+        Values recorded in history for players. Override it if they are not
+        plain columns of RatingStore.
+
+        :param rows: Numpy array of rows in player_rankings.
+        :return: Tuple of arrays (serve, return, sigma).
+        '''
+
+        r = self.player_rankings
+        return tuple(r[name][rows] if name else np.nan for name in self.history_columns)
+
+    def _record_match(self, day, name1, name2):
+        '''
+        Records ratings of both players after their match. Players that
+        were not rated (e.g. match without serve data) are skipped.
+
+        :param day: Day number of the match.
+        :param name1: Winner of the match.
+        :param name2: Loser of the match.
+        :return: void
+        '''
+
+        r = self.player_rankings
+        w = r.get(name1)
+        l = r.get(name2)
+        if w is None or l is None:
+            return
+
+        rows = np.array([w, l], dtype=np.int32)
+        serve, ret, sigma = self._history_values(rows)
+        self.history.append(day, rows, serve, ret, sigma)
 
     def train(self, train_data, verbose=False):
         '''
         Override function from superclass.
 
-        :param test_data: Pandas dataframe on which to train model.
+        :param test_data: Pandas dataframe on which to train model or
+                            iterable of date ordered dataframe chunks
+                            (e.g. data_tools.iter_main_matches_data).
         :return: void
         '''
 
-        self.player_rankings = {}
-        self.surface_advantage = {}
-        self.player_games = {}
-        df = self.run(train_data, verbose)
+        self.reset_rankings()
 
-        return np.sum(-np.log(df["win_prob"]))
+        if isinstance(train_data, pd.DataFrame):
+            train_data = [train_data]
+
+        error = 0.0
+        for df in self.run_chunks(train_data, verbose):
+            error += np.sum(-np.log(df["win_prob"]))
+
+        return error
 
     def test(self, test_data, verbose=False):
         '''
@@ -70,17 +442,296 @@ class TennisRankingModel(object):
 
         return self.run(test_data, verbose)
 
-    def run(self, data, verbose=False):
+    # Columns of data that run passes to _run_match, in this order.
+    match_columns = ["Winner", "Loser", "WSP1", "WSP2", "Best_of"]
+
+    def run(self, data, verbose=False, checkpoint=None):
         '''
-        Override function from superclass.
+        Runs model on data, match by match. Needed columns are taken out of
+        data once and each match is passed to _run_match as plain values.
+
+        :param data: Pandas dataframe on which to run model or match store
+                        (data_tools.match_store.MatchStore).
+        :param verbose: Log or not?
+        :param checkpoint: Path to checkpoint (see save_checkpoint). If
+                            given, model starts from its state and matches
+                            it already contains are skipped.
+        :return: Copy of data with columns win_prob and bet_amount.
+        '''
+
+        data = self._begin_run(data, checkpoint)
+
+        columns = [data[column].tolist() for column in self.match_columns]
+        run_match = self._run_match
+        probabilities = []
+        bet_amount = []
+
+        self._start_run()
+        self._started = True
+
+        if self.record_history and self.history_columns and "Date" in data:
+            record = self._record_match
+            days = rh.day_numbers(data["Date"]).tolist()
+            for values, day in zip(zip(*columns), days):
+                win_prob, bet = run_match(*values)
+                probabilities.append(win_prob)
+                bet_amount.append(bet)
+                record(day, values[0], values[1])
+        else:
+            for values in zip(*columns):
+                win_prob, bet = run_match(*values)
+                probabilities.append(win_prob)
+                bet_amount.append(bet)
+
+        self._end_run(data)
+        self._finish_run(verbose)
+
+        df = data.copy()
+        df["win_prob"] = probabilities
+        df["bet_amount"] = bet_amount
+
+        return df
+
+    def _begin_run(self, data, checkpoint=None):
+        '''
+        Prepares data for run. Match store is converted to a dataframe and,
+        if checkpoint is given, model state is restored from it and matches
+        it already contains are dropped.
 
-        :param data: Pandas dataframe on which to run model.
+        :param data: Pandas dataframe or match store.
+        :param checkpoint: Path to checkpoint or None.
+        :return: Pandas dataframe with matches to run.
+        '''
+
+        if not isinstance(data, pd.DataFrame):
+            data = data.to_frame()
+
+        if checkpoint is not None:
+            self.load_checkpoint(checkpoint)
+            data = self.unprocessed(data)
+
+        return data
+
+    def _end_run(self, data):
+        '''
+        Remembers date and id of the last match run and how many matches
+        were run on that date, so checkpoint knows where to resume from.
+
+        :param data: Pandas dataframe with matches that were run.
         :return: void
         '''
 
+        if not len(data):
+            return
+
+        if "Date" in data:
+            dates = pd.to_datetime(data["Date"]).dt.normalize()
+            last_date = dates.iloc[-1].date()
+            count = int((dates == dates.iloc[-1]).sum())
+            # Data ending mid-day is continued by the next run on same day.
+            if last_date == self.last_date:
+                count += self.last_count
+            self.last_date = last_date
+            self.last_count = count
+        if "id" in data:
+            self.last_id = int(data["id"].iloc[-1])
+
+    def unprocessed(self, data):
+        '''
+        Matches that model has not seen yet. Data with ids is ordered by
+        (Date, id), ids alone do not follow dates, so matches up to
+        (last_date, last_id) in that order are skipped, same as
+        handle_data.matches_query(after=...). Without ids matches before
+        last_date and first last_count matches on last_date are skipped, so
+        data can also end in the middle of a day.
+
+        :param data: Pandas dataframe ordered by date (and id).
+        :return: Matches after (last_date, last_id).
+        '''
+
+        if self.last_date is None or "Date" not in data:
+            if self.last_id is not None and "id" in data:
+                return data[data["id"] > self.last_id]
+            return data
+
+        dates = pd.to_datetime(data["Date"]).dt.normalize().values
+        last_date = pd.Timestamp(self.last_date).to_datetime64()
+        on_last_date = dates == last_date
+
+        if self.last_id is not None and "id" in data:
+            seen = on_last_date & (data["id"].values <= self.last_id)
+        else:
+            seen = on_last_date & (np.cumsum(on_last_date) <= self.last_count)
+
+        return data[(dates >= last_date) & ~seen]
+
+    def save_checkpoint(self, path):
+        '''
+        Saves full state of model (ratings, game counts, surface stats,
+        rating history...), its parameters and last processed match to a compressed npz file.
+        File is written atomically.
+
+        :param path: Path to checkpoint file.
+        :return: void
+        '''
+
+        state = self.player_rankings.get_state()
+        state.update(self.history.get_state())
+        state["version"] = np.array(CHECKPOINT_VERSION)
+        state["model"] = np.array(self.__class__.__name__)
+        state["params"] = np.array(json.dumps(self.params, sort_keys=True,
+                                              default=lambda value: value.item()))
+        state["last_date"] = np.array(self.last_date.isoformat() if self.last_date else "")
+        state["last_count"] = np.array(self.last_count, dtype=np.int64)
+        state["last_id"] = np.array(-1 if self.last_id is None else self.last_id, dtype=np.int64)
+
+        directory = os.path.dirname(path)
+        if directory and not os.path.isdir(directory):
+            os.makedirs(directory)
+
+        temp_path = "%s.%d.tmp" % (path, os.getpid())
+        with open(temp_path, "wb") as f:
+            np.savez_compressed(f, **state)
+        os.rename(temp_path, path)
+
+    def load_checkpoint(self, path):
+        '''
+        Restores state saved by save_checkpoint. Parameters of the model are
+        replaced by the ones in checkpoint.
+
+        :param path: Path to checkpoint file.
+        :return: void
+        '''
+
+        info = read_checkpoint_info(path)
+        if info["model"] != self.__class__.__name__:
+            raise ValueError("Checkpoint '%s' was made by %s, not %s!" %
+                             (path, info["model"], self.__class__.__name__))
+
+        with np.load(path) as f:
+            store = RatingStore.from_state(f)
+            history = RatingHistory.from_state(store, f)
+
+        self.params.update(info["params"])
+        self.player_rankings = store
+        self.history = history
+        self._started = False
+        self.last_date = info["last_date"]
+        self.last_count = info["last_count"]
+        self.last_id = info["last_id"]
+
+    def __getstate__(self):
+        '''
+        State for pickle and copy. Objects made by _start_run (private
+        attributes) can hold bound methods, which do not pickle, so they are
+        left out and built again on next run.
+
+        :return: Dictionary of attributes.
+        '''
+
+        state = dict((key, value) for key, value in self.__dict__.iteritems()
+                     if not key.startswith("_"))
+        state["_started"] = False
+
+        return state
+
+    def _start_run(self):
+        '''
+        Called by run before the first match. Override it to prepare objects
+        used by _run_match.
+
+        :return: void
+        '''
+
+        pass
+
+    def _run_match(self, *values):
+        '''
+        Function to be implemented in derived class, used by run. It
+        predicts one match and then updates ratings with its result.
+
+        :param values: Values of match_columns for one match.
+        :return: Tuple (win_prob, bet_amount).
+        '''
+
+        raise Exception("Implement this function!")
+
+    def _finish_run(self, verbose=False):
+        '''
+        Called by run after the last match.
+
+        :param verbose: Log or not?
+        :return: void
+        '''
+
+        pass
+
+    def predict(self, player1, player2, best_of=3, surface=None):
+        '''
+        Predicts match between two players from current ratings, without
+        changing them. For a match with serve data, win_prob is the same as
+        run gives before the match is played.
+
+        :param player1: First player (name or id, same as in data).
+        :param player2: Second player.
+        :param best_of: How many sets are played at most.
+        :param surface: Surface of the match, used only by surface models.
+        :return: Tuple (win_prob, p, q), where win_prob is probability that
+                    player1 wins and p (q) is probability that player1
+                    (player2) wins a point on his serve. Models without
+                    serve ratings return NaN for p and q.
+        '''
+
+        if not self._started:
+            self._start_run()
+            self._started = True
+
+        return self._predict(player1, player2, best_of, surface)
+
+    def update(self, match):
+        '''
+        Folds one finished match into ratings, same as run does.
+
+        :param match: Dictionary (or any mapping, e.g. dataframe row) with
+                        values of match_columns.
+        :return: Tuple (win_prob, bet_amount) that run gives for the match.
+        '''
+
+        if not self._started:
+            self._start_run()
+            self._started = True
+
+        return self._run_match(*[match[column] for column in self.match_columns])
+
+    def _predict(self, player1, player2, best_of, surface):
+        '''
+        Function to be implemented in derived class, used by predict.
+
+        :param player1: First player.
+        :param player2: Second player.
+        :param best_of: How many sets are played at most.
+        :param surface: Surface of the match.
+        :return: Tuple (win_prob, p, q).
+        '''
+
         raise Exception("Implement this function!")
 
-    def train_params(self, train_data, approx, verbose=False):
+    def run_chunks(self, chunks, verbose=False):
+        '''
+        Runs model on date ordered chunks of data, one chunk at a time.
+        Model state is carried from chunk to chunk, so result is the same as
+        if run was called on all data at once, while only one chunk has to
+        be held in memory.
+
+        :param chunks: Iterable of pandas dataframes.
+        :param verbose: Log or not?
+        :return: Generator of dataframes returned by run, one per chunk.
+        '''
+
+        for chunk in chunks:
+            yield self.run(chunk, verbose)
+
+    def train_params(self, train_data, approx, verbose=False, method="Nelder-Mead", **kwargs):
         '''
         Train parameters of the model.
         NOTE: _train_params function should return error on train data.
@@ -88,9 +739,19 @@ class TennisRankingModel(object):
         :param train_data: Data to train parameters on.
         :param approx: Approximation of parameters of the model.
         :param verbose: Log or not?
+        :param method: "Nelder-Mead" for serial optimization from approx or
+                        "grid", "random", "multistart" for parallel search,
+                        see param_search.search_params for its arguments
+                        (bounds, grid, n_points, processes, time_budget...).
         :return: Optimized parameters (at best global at worst local optimum).
+                    Parallel search also returns all evaluated parameters
+                    (points) and their errors.
         '''
 
+        if method != "Nelder-Mead":
+            return ps.search_params(self, train_data, method, approx=approx,
+                                    verbose=verbose, **kwargs)
+
         res = sco.minimize(self._train_params, approx,
                            (train_data, verbose), method='Nelder-Mead')
         return res
@@ -106,4 +767,37 @@ class TennisRankingModel(object):
         :return: Error, for given parameters.
         '''
 
-        raise Exception("Implement this function!")
\ No newline at end of file
+        raise Exception("Implement this function!")
+
+
+def read_checkpoint_info(path):
+    '''
+    Reads description of a checkpoint without loading ratings.
+
+    :param path: Path to checkpoint file.
+    :return: Dictionary with keys model (name of model class), params,
+                last_date (datetime.date or None), last_count (number of
+                matches run on last_date) and last_id (int or None).
+    '''
+
+    with np.load(path) as f:
+        version = int(f["version"])
+        if version != CHECKPOINT_VERSION:
+            raise ValueError("Checkpoint '%s' has version %d, expected %d!" %
+                             (path, version, CHECKPOINT_VERSION))
+
+        params = json.loads(f["params"].item())
+        last_date = f["last_date"].item()
+        last_id = int(f["last_id"])
+
+        info = {"model": str(f["model"].item()),
+                "params": dict((str(key), value) for key, value in params.iteritems()),
+                "last_date": None,
+                "last_count": int(f["last_count"]),
+                "last_id": None if last_id < 0 else last_id}
+
+    if last_date:
+        info["last_date"] = datetime.datetime.strptime(last_date, "%Y-%m-%d").date()
+
+    return info
+
@@ -15,6 +15,8 @@ class Rating(object):
     Wrapper class containing all information needed about a rating.
     '''
 
+    __slots__ = ("rating",)
+
     def __init__(self, rating):
         '''
         Constructor.
@@ -100,13 +102,37 @@ class Elo(object):
         :return: New rating for player with rating "rating".
         '''
 
-        E = self.expect(rating, other_rating)
-        new_rating = rating.rating + self.K * (result - E)
         rating_result = copy.copy(rating)
-        rating_result.update(new_rating)
+        rating_result.update(self.new_rating(rating, other_rating, result))
 
         return rating_result
 
+    def new_rating(self, rating, other_rating, result):
+        '''
+        Value of rating after rating wins/loses against other_rating with
+        result "result". Ratings are not changed.
+
+        :param rating: Rating that we rate.
+        :param other_rating: Opponents rating.
+        :param result: How much did rating score vs other rating; from 0 to 1
+        :return: New value of rating.
+        '''
+
+        E = self.expect(rating, other_rating)
+        return rating.rating + self.K * (result - E)
+
+    def rate_inplace(self, rating, other_rating, result):
+        '''
+        Same as rate, but rating is updated in place instead of copied.
+
+        :param rating: Rating that we rate.
+        :param other_rating: Opponents rating.
+        :param result: How much did rating score vs other rating; from 0 to 1
+        :return: void
+        '''
+
+        rating.update(self.new_rating(rating, other_rating, result))
+
     def match(self, rating1, rating2, result):
         '''
         Update ratings rating1 and rating2 after match with result "result".
@@ -119,3 +145,20 @@ class Elo(object):
 
         return [self.rate(rating1, rating2, result),
                 self.rate(rating2, rating1, 1.0 - result)]
+
+    def match_inplace(self, rating1, rating2, result):
+        '''
+        Same as match, but ratings are updated in place instead of copied.
+        Both new values are computed from ratings before the match.
+
+        :param rating1: First rating.
+        :param rating2: Second rating,
+        :param result: How much rating1 scored vs rating2.
+        :return: void
+        '''
+
+        new_rating1 = self.new_rating(rating1, rating2, result)
+        new_rating2 = self.new_rating(rating2, rating1, 1.0 - result)
+
+        rating1.update(new_rating1)
+        rating2.update(new_rating2)
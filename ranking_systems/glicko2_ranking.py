@@ -32,10 +32,14 @@ EPSILON = 0.000001
 #: A constant which is used to standardize the logistic function to
 #: `1/(1+exp(-x))` from `1/(1+10^(-r/400))`
 Q = math.log(10) / 400
+#: Ratio between the Glicko and the Glicko-2 scale
+RATIO = 173.7178
 
 
 class Rating(object):
 
+    __slots__ = ('mu', 'phi', 'sigma')
+
     def __init__(self, mu=MU, phi=PHI, sigma=SIGMA):
         self.mu = mu
         self.phi = phi
@@ -65,12 +69,12 @@ class Glicko2(object):
             sigma = self.sigma
         return Rating(mu, phi, sigma)
 
-    def scale_down(self, rating, ratio=173.7178):
+    def scale_down(self, rating, ratio=RATIO):
         mu = (rating.mu - self.mu) / ratio
         phi = rating.phi / ratio
         return self.create_rating(mu, phi, rating.sigma)
 
-    def scale_up(self, rating, ratio=173.7178):
+    def scale_up(self, rating, ratio=RATIO):
         mu = rating.mu * ratio + self.mu
         phi = rating.phi * ratio
         return self.create_rating(mu, phi, rating.sigma)
@@ -91,10 +95,15 @@ class Glicko2(object):
 
     def determine_sigma(self, rating, difference, variance):
         """Determines new sigma."""
-        phi = rating.phi
+        return self._determine_sigma(rating.phi, rating.sigma, difference, variance)
+
+    def _determine_sigma(self, phi, sigma, difference, variance):
+        """Same as :meth:`determine_sigma`, but takes phi and sigma of the
+        rating (on the Glicko-2 scale) instead of the rating.
+        """
         difference_squared = difference ** 2
         # 1. Let a = ln(s^2), and define f(x)
-        alpha = math.log(rating.sigma ** 2)
+        alpha = math.log(sigma ** 2)
         def f(x):
             """This function is twice the conditional log-posterior density of
             phi, and is the optimality criterion.
@@ -132,9 +141,22 @@ class Glicko2(object):
         return math.exp(1) ** (a / 2)
 
     def rate(self, rating, series):
+        return self.create_rating(*self._rate(rating, series))
+
+    def rate_inplace(self, rating, series):
+        """Same as :meth:`rate`, but updates the rating in place instead of
+        creating a new one.
+        """
+        rating.mu, rating.phi, rating.sigma = self._rate(rating, series)
+
+    def _rate(self, rating, series):
+        """Rates the rating on plain floats, so no intermediate ratings are
+        created. Returns new `(mu, phi, sigma)` on the original scale.
+        """
         # Step 2. For each player, convert the rating and RD's onto the
         #         Glicko-2 scale.
-        rating = self.scale_down(rating)
+        mu = (rating.mu - self.mu) / RATIO
+        phi = rating.phi / RATIO
         # Step 3. Compute the quantity v. This is the estimated variance of the
         #         team's/player's rating based only on game outcomes.
         # Step 4. Compute the quantity difference, the estimated improvement in
@@ -144,9 +166,10 @@ class Glicko2(object):
         variance_inv = 0
         difference = 0
         for actual_score, other_rating in series:
-            other_rating = self.scale_down(other_rating)
-            impact = self.reduce_impact(other_rating)
-            expected_score = self.expect_score(rating, other_rating, impact)
+            other_mu = (other_rating.mu - self.mu) / RATIO
+            other_phi = other_rating.phi / RATIO
+            impact = 1 / math.sqrt(1 + (3 * other_phi ** 2) / (math.pi ** 2))
+            expected_score = 1. / (1 + math.exp(-impact * (mu - other_mu)))
             variance_inv += impact ** 2 * expected_score * (1 - expected_score)
             difference += impact * (actual_score - expected_score)
             d_square_inv += (
@@ -154,25 +177,33 @@ class Glicko2(object):
                 (Q ** 2) * (impact ** 2))
         difference /= variance_inv
         variance = 1. / variance_inv
-        denom = rating.phi ** -2 + d_square_inv
-        mu = rating.mu + Q / denom * (difference / variance_inv)
-        phi = math.sqrt(1 / denom)
+        denom = phi ** -2 + d_square_inv
+        phi_new = math.sqrt(1 / denom)
         # Step 5. Determine the new value, Sigma', ot the sigma. This
         #         computation requires iteration.
-        sigma = self.determine_sigma(rating, difference, variance)
+        sigma = self._determine_sigma(phi, rating.sigma, difference, variance)
         # Step 6. Update the rating deviation to the new pre-rating period
         #         value, Phi*.
-        phi_star = math.sqrt(phi ** 2 + sigma ** 2)
+        phi_star = math.sqrt(phi_new ** 2 + sigma ** 2)
         # Step 7. Update the rating and RD to the new values, Mu' and Phi'.
-        phi = 1 / math.sqrt(1 / phi_star ** 2 + 1 / variance)
-        mu = rating.mu + phi ** 2 * (difference / variance)
+        phi_new = 1 / math.sqrt(1 / phi_star ** 2 + 1 / variance)
+        mu_new = mu + phi_new ** 2 * (difference / variance)
         # Step 8. Convert ratings and RD's back to original scale.
-        return self.scale_up(self.create_rating(mu, phi, sigma))
+        return mu_new * RATIO + self.mu, phi_new * RATIO, sigma
 
     def rate_1vs1(self, rating1, rating2, result):
         return (self.rate(rating1, [(result, rating2)]),
                 self.rate(rating2, [(1.0 - result, rating1)]))
 
+    def rate_1vs1_inplace(self, rating1, rating2, result):
+        """Same as :meth:`rate_1vs1`, but updates both ratings in place. Both
+        new ratings are computed from ratings before the match.
+        """
+        new_rating1 = self._rate(rating1, [(result, rating2)])
+        new_rating2 = self._rate(rating2, [(1.0 - result, rating1)])
+        rating1.mu, rating1.phi, rating1.sigma = new_rating1
+        rating2.mu, rating2.phi, rating2.sigma = new_rating2
+
     def quality_1vs1(self, rating1, rating2):
         expected_score1 = self.expect_score(rating1, rating2, self.reduce_impact(rating1))
         expected_score2 = self.expect_score(rating2, rating1, self.reduce_impact(rating2))
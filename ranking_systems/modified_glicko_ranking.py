@@ -17,6 +17,8 @@ class Rating(object):
     Wrapper class containing all information needed about a rating.
     '''
 
+    __slots__ = ("rating", "c", "sigma_start", "sigma_cap", "t", "sigma")
+
     def __init__(self, mu, sigma_start, sigma_cap, c):
         '''
         Constructor.
@@ -147,16 +149,38 @@ class ModifiedGlicko(object):
         :return: New rating for player with rating "rating".
         '''
 
+        rating_result = copy.copy(rating)
+        rating_result.update(self.new_rating(rating, other_rating, result))
+
+        return rating_result
+
+    def new_rating(self, rating, other_rating, result):
+        '''
+        Value of rating after rating wins/loses against other_rating with
+        result "result". Ratings are not changed.
+        :param rating: Rating that we rate.
+        :param other_rating: Opponents rating.
+        :param result: How much did rating score vs other rating; from 0 to 1
+        :return: New value of rating.
+        '''
+
         E = self.expect(rating, other_rating)
         impact = self.impact(other_rating)
         d = math.sqrt( 1.0 / (self.Q**2 * impact**2 * E * (1 - E)) )
         change = (self.Q / (1/rating.sigma**2 + 1/d**2)) * impact * (result - E)
-        new_rating = rating.rating + change
 
-        rating_result = copy.copy(rating)
-        rating_result.update(new_rating)
+        return rating.rating + change
 
-        return rating_result
+    def rate_inplace(self, rating, other_rating, result):
+        '''
+        Same as rate, but rating is updated in place instead of copied.
+        :param rating: Rating that we rate.
+        :param other_rating: Opponents rating.
+        :param result: How much did rating score vs other rating; from 0 to 1
+        :return: void
+        '''
+
+        rating.update(self.new_rating(rating, other_rating, result))
 
     def match(self, rating1, rating2, result):
         '''
@@ -170,6 +194,22 @@ class ModifiedGlicko(object):
         return [self.rate(rating1, rating2, result),
                 self.rate(rating2, rating1, 1.0 - result)]
 
+    def match_inplace(self, rating1, rating2, result):
+        '''
+        Same as match, but ratings are updated in place instead of copied.
+        Both new values are computed from ratings before the match.
+        :param rating1: First rating.
+        :param rating2: Second rating,
+        :param result: How much rating1 scored vs rating2.
+        :return: void
+        '''
+
+        new_rating1 = self.new_rating(rating1, rating2, result)
+        new_rating2 = self.new_rating(rating2, rating1, 1.0 - result)
+
+        rating1.update(new_rating1)
+        rating2.update(new_rating2)
+
 """
 mg = ModifiedGlicko(1500, 300, 100, 20)
 p1 = mg.create_rating()
@@ -0,0 +1,106 @@
+'''
+Micro-benchmark of copying and in-place rating updates.
+
+Every ranking system is asked to play the same matches twice: once with
+match (rate_1vs1 for Glicko2), which returns new Rating objects, and once
+with match_inplace (rate_1vs1_inplace), which changes ratings in place.
+Both must end with same ratings.
+
+Run it with: python -m ranking_systems.tests.benchmark_ranking
+'''
+
+__author__ = 'riko'
+
+
+import random
+import timeit
+
+import ranking_systems as rs
+
+
+N_PLAYERS = 100
+N_MATCHES = 20000
+
+
+def make_matches(seed=42):
+    '''
+    Random matches between players.
+
+    :param seed: Seed of random generator.
+    :return: List of tuples (player1, player2, result).
+    '''
+
+    rnd = random.Random(seed)
+    return [(rnd.randrange(N_PLAYERS), rnd.randrange(N_PLAYERS), rnd.random())
+            for i in xrange(N_MATCHES)]
+
+
+def replay(create, play, matches):
+    '''
+    Plays matches with copying function, which returns new ratings.
+
+    :param create: Function that creates new rating.
+    :param play: Function (rating1, rating2, result) -> (new1, new2).
+    :param matches: List of matches from make_matches.
+    :return: List of ratings.
+    '''
+
+    ratings = [create() for i in xrange(N_PLAYERS)]
+    for i, j, result in matches:
+        if i != j:
+            ratings[i], ratings[j] = play(ratings[i], ratings[j], result)
+
+    return ratings
+
+
+def replay_inplace(create, play, matches):
+    '''
+    Plays matches with in-place function.
+
+    :param create: Function that creates new rating.
+    :param play: Function (rating1, rating2, result) that changes ratings.
+    :param matches: List of matches from make_matches.
+    :return: List of ratings.
+    '''
+
+    ratings = [create() for i in xrange(N_PLAYERS)]
+    for i, j, result in matches:
+        if i != j:
+            play(ratings[i], ratings[j], result)
+
+    return ratings
+
+
+def main():
+    matches = make_matches()
+
+    elo = rs.Elo(1500, 32)
+    glicko = rs.ModifiedGlicko(1500, 300, 100, 10, 0.0057565)
+    glicko2 = rs.Glicko2()
+
+    systems = [("Elo", elo.create_rating, elo.match, elo.match_inplace, ["rating"]),
+               ("ModifiedGlicko", glicko.create_rating, glicko.match, glicko.match_inplace,
+                ["rating", "t", "sigma"]),
+               ("Glicko2", glicko2.create_rating, glicko2.rate_1vs1, glicko2.rate_1vs1_inplace,
+                ["mu", "phi", "sigma"])]
+
+    print "%d matches." % N_MATCHES
+    print '{:>16s} {:>14s} {:>14s} {:>8s}'.format("System", "copy (us/m)", "inplace (us/m)", "Speedup")
+
+    for name, create, play, play_inplace, fields in systems:
+        before = replay(create, play, matches)
+        after = replay_inplace(create, play_inplace, matches)
+        for r1, r2 in zip(before, after):
+            assert [getattr(r1, f) for f in fields] == [getattr(r2, f) for f in fields]
+
+        copy_time = min(timeit.repeat(lambda: replay(create, play, matches), number=1, repeat=3))
+        inplace_time = min(timeit.repeat(lambda: replay_inplace(create, play_inplace, matches),
+                                         number=1, repeat=3))
+
+        print '{:>16s} {:14.2f} {:14.2f} {:7.2f}x'.format(name, 1e6 * copy_time / N_MATCHES,
+                                                          1e6 * inplace_time / N_MATCHES,
+                                                          copy_time / inplace_time)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+'''
+Tests for the on-disk cache of data frames.
+'''
+
+__author__ = 'riko'
+
+
+import datetime
+import shutil
+import tempfile
+import unittest
+
+import pandas as pd
+
+from data_tools import cache
+
+
+class TestCache(unittest.TestCase):
+    '''
+    Test cases for save_frame and load_frame.
+    '''
+
+    def setUp(self):
+        '''
+        Points cache to an empty directory.
+
+        :return: void.
+        '''
+
+        self.cache_path = cache.CACHE_PATH
+        cache.CACHE_PATH = tempfile.mkdtemp()
+
+    def tearDown(self):
+        '''
+        Removes cache directory.
+
+        :return: void.
+        '''
+
+        shutil.rmtree(cache.CACHE_PATH)
+        cache.CACHE_PATH = self.cache_path
+
+    def test_frame(self):
+        '''
+        Tests that frame is read back as it was written.
+
+        :return: void.
+        '''
+
+        df = pd.DataFrame({"Winner": ["Roger Federer", None],
+                           "Date": [datetime.date(2005, 1, 3), datetime.date(2005, 1, 10)],
+                           "WSP1": [0.65, 0.7]},
+                          columns=["Winner", "Date", "WSP1"])
+        cache.save_frame("frame", "signature", df)
+
+        self.assertTrue(cache.load_frame("frame", "signature").equals(df))
+        self.assertIsNone(cache.load_frame("frame", "other signature"))
+
+    def test_empty_frame(self):
+        '''
+        Tests empty query result, which has object columns and index.
+
+        :return: void.
+        '''
+
+        df = pd.DataFrame.from_records([], columns=["Winner", "Date", "WSP1"])
+        cache.save_frame("empty", "signature", df)
+        loaded = cache.load_frame("empty", "signature")
+
+        self.assertEqual(len(loaded), 0)
+        self.assertEqual(loaded.columns.tolist(), ["Winner", "Date", "WSP1"])
@@ -0,0 +1,129 @@
+'''
+Tests for random numbers and simulations in calculations.
+'''
+
+__author__ = 'riko'
+
+
+import os
+import subprocess
+import sys
+import unittest
+
+import numpy as np
+
+import calculations as calc
+
+
+# Prints digest of simulated matches, run in processes with different
+# numbers of OpenMP threads.
+SIMULATE = '''
+import hashlib
+import calculations as calc
+print hashlib.md5("".join(a.tobytes() for a in calc.simulate_matches(0.65, 0.6, 5, 10000, seed=7))).hexdigest()
+'''
+
+
+class TestRandomNumbers(unittest.TestCase):
+    '''
+    Test cases for xoshiro256** generator.
+    '''
+
+    def test_reference(self):
+        '''
+        Tests first numbers from state {1, 2, 3, 4} against reference
+        implementation of xoshiro256**.
+
+        :return: void.
+        '''
+
+        numbers = calc._rng_numbers([1, 2, 3, 4], 4)
+        self.assertEqual(numbers.tolist(), [11520, 0, 1509978240, 1215971899390074240])
+
+
+class TestSimulateMatches(unittest.TestCase):
+    '''
+    Test cases for simulate_matches.
+    '''
+
+    def test_seed(self):
+        '''
+        Tests that same seed gives same matches and different seed
+        different ones.
+
+        :return: void.
+        '''
+
+        first = calc.simulate_matches(0.65, 0.6, 3, 10000, seed=7)
+        second = calc.simulate_matches(0.65, 0.6, 3, 10000, seed=7)
+        other = calc.simulate_matches(0.65, 0.6, 3, 10000, seed=8)
+
+        for a, b in zip(first, second):
+            self.assertTrue(np.array_equal(a, b))
+        self.assertFalse(np.array_equal(first[1], other[1]))
+
+    def test_threads(self):
+        '''
+        Tests that matches do not depend on number of threads
+        (OMP_NUM_THREADS).
+
+        :return: void.
+        '''
+
+        digests = []
+        for threads in ["1", "4"]:
+            env = dict(os.environ, OMP_NUM_THREADS=threads)
+            output = subprocess.check_output([sys.executable, "-c", SIMULATE], env=env)
+            digests.append(output.strip())
+
+        self.assertEqual(digests[0], digests[1])
+
+
+class TestMonteCarloAdaptive(unittest.TestCase):
+    '''
+    Test cases for monte_carlo_adaptive.
+    '''
+
+    def test_prefix(self):
+        '''
+        Tests that simulation stops once target is met and that its matches
+        are the first matches of simulate_matches with same seed.
+
+        :return: void.
+        '''
+
+        result = calc.monte_carlo_adaptive(0.75, 0.6, 3, win_error=0.01, seed=7)
+        winners, points, _, _ = calc.simulate_matches(0.75, 0.6, 3, result["N"], seed=7)
+
+        self.assertTrue(result["converged"])
+        self.assertTrue(result["win_error"] <= 0.01)
+        self.assertEqual(result["win"], winners.mean())
+        self.assertAlmostEqual(result["points"], points.mean())
+
+    def test_one_sided(self):
+        '''
+        Tests that batches without losses do not claim zero error.
+
+        :return: void.
+        '''
+
+        result = calc.monte_carlo_adaptive(0.95, 0.3, 3, win_error=1e-9, max_N=10000, seed=7)
+
+        self.assertEqual(result["win"], 1.0)
+        self.assertTrue(result["win_error"] > 0)
+        self.assertFalse(result["converged"])
+
+    def test_arguments(self):
+        '''
+        Tests that invalid arguments raise ValueError.
+
+        :return: void.
+        '''
+
+        invalid = [dict(win_error=0.0), dict(win_error=-0.01), dict(points_error=0.0),
+                   dict(win_error=float("nan")), dict(win_error=0.01, confidence=0.0),
+                   dict(win_error=0.01, confidence=1.0), dict(win_error=0.01, confidence=1.5),
+                   dict(win_error=0.01, best_of=4), dict(win_error=0.01, max_N=0), dict()]
+
+        for kwargs in invalid:
+            self.assertRaises(ValueError, calc.monte_carlo_adaptive, 0.65, 0.6, **kwargs)
@@ -0,0 +1,114 @@
+'''
+Tests for resuming model runs from checkpoints.
+'''
+
+__author__ = 'riko'
+
+
+import datetime
+import os
+import shutil
+import tempfile
+import unittest
+
+import numpy as np
+import pandas as pd
+
+import models
+
+
+def make_matches(n=600, players=30, seed=3):
+    '''
+    Random matches, several on every date. Data is ordered by (Date, id),
+    but ids do not follow dates, same as after an incremental rebuild.
+
+    :param n: Number of matches.
+    :param players: Number of players.
+    :param seed: Seed of random numbers.
+    :return: Pandas dataframe.
+    '''
+
+    rnd = np.random.RandomState(seed)
+    names = ["Player %d" % i for i in range(players)]
+    pairs = [rnd.choice(players, 2, replace=False) for _ in range(n)]
+    start = datetime.date(2005, 1, 3)
+
+    return pd.DataFrame({
+        "Winner": [names[w] for w, _ in pairs],
+        "Loser": [names[l] for _, l in pairs],
+        "WSP1": rnd.uniform(0.5, 0.8, n),
+        "WSP2": rnd.uniform(0.4, 0.7, n),
+        "Best_of": rnd.choice([3, 5], n),
+        "Date": [start + datetime.timedelta(days=7 * (i // 25)) for i in range(n)],
+        "id": np.where(np.arange(n) < n // 2, np.arange(n) + n, np.arange(n))
+    })
+
+
+class TestResume(unittest.TestCase):
+    '''
+    Test cases for run with checkpoint.
+    '''
+
+    def setUp(self):
+        '''
+        Makes directory for checkpoints.
+
+        :return: void.
+        '''
+
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, "checkpoint.npz")
+
+    def tearDown(self):
+        '''
+        Removes directory for checkpoints.
+
+        :return: void.
+        '''
+
+        shutil.rmtree(self.directory)
+
+    def resume(self, data, split):
+        '''
+        Runs first split matches, saves checkpoint and runs all data from
+        it in a new model.
+
+        :param data: Pandas dataframe with matches.
+        :param split: Number of matches run before checkpoint.
+        :return: Tuple (win probabilities of full run, of both parts).
+        '''
+
+        full = models.DoubleEloModel().run(data)["win_prob"].values
+
+        model = models.DoubleEloModel()
+        first = model.run(data.iloc[:split])["win_prob"].values
+        model.save_checkpoint(self.path)
+
+        second = models.DoubleEloModel().run(data, checkpoint=self.path)["win_prob"].values
+
+        return full, np.concatenate([first, second])
+
+    def test_ids(self):
+        '''
+        Tests resume with ids that are not in date order, in the middle of
+        a day.
+
+        :return: void.
+        '''
+
+        full, parts = self.resume(make_matches(), 310)
+
+        self.assertEqual(len(parts), len(full))
+        self.assertTrue(np.allclose(parts, full, equal_nan=True))
+
+    def test_dates(self):
+        '''
+        Tests resume without ids, in the middle of a day.
+
+        :return: void.
+        '''
+
+        full, parts = self.resume(make_matches().drop(columns=["id"]), 310)
+
+        self.assertEqual(len(parts), len(full))
+        self.assertTrue(np.allclose(parts, full, equal_nan=True))
@@ -27,6 +27,23 @@ class TestElo(unittest.TestCase):
         self.assertTrue(abs(r1.rating - 2402.9090) < 0.001)
         self.assertTrue(abs(r2.rating - 1997.0909) < 0.001)
 
+    def test_match_inplace(self):
+        '''
+        Tests that match_inplace gives same ratings as match.
+
+        :return: void.
+        '''
+
+        elo = rs.Elo(2400, 32)
+        r1 = elo.create_rating()
+        r2 = elo.create_rating(2000)
+        new_r1, new_r2 = elo.match(r1, r2, 0.7)
+
+        elo.match_inplace(r1, r2, 0.7)
+
+        self.assertEqual(r1.rating, new_r1.rating)
+        self.assertEqual(r2.rating, new_r2.rating)
+
 
 if __name__ == '__main__':
     unittest.main()
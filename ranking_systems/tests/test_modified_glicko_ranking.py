@@ -120,6 +120,25 @@ class TestModifiedGlicko(unittest.TestCase):
 
         self.assertEqual(expected_result, actual_result)
 
+    def test_match_inplace(self):
+        '''
+        Tests that match_inplace gives same ratings as match.
+
+        :return: void.
+        '''
+
+        mod_glicko = rs.ModifiedGlicko()
+        rating1 = mod_glicko.create_rating(1700, 300, 100, 20)
+        rating2 = mod_glicko.create_rating(1500, 300, 100, 20)
+        new_rating1, new_rating2 = mod_glicko.match(rating1, rating2, 0.4)
+
+        mod_glicko.match_inplace(rating1, rating2, 0.4)
+
+        for new, rating in [(new_rating1, rating1), (new_rating2, rating2)]:
+            self.assertEqual(rating.rating, new.rating)
+            self.assertEqual(rating.t, new.t)
+            self.assertEqual(rating.sigma, new.sigma)
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -4,6 +4,15 @@ __author__ = 'riko'
 # Set to the root of TennisModelling location.
 ROOT_PATH = "/home/riko/Desktop/Tennis-Modelling/"
 
+# Database backend, either "mysql" or "sqlite".
+DATABASE_BACKEND = "mysql"
+
+# SQLite database file, used when DATABASE_BACKEND is "sqlite".
+SQLITE_PATH = ROOT_PATH + "data/tennis.db"
+
+# How many database connections data_tools keeps open at most.
+DB_POOL_SIZE = 4
+
 # Mysql connection settings.
 # Mysql settings must be stored as DICTIONARY in variable MYSQL_SETTINGS !!!
 host = "localhost"
@@ -15,4 +24,13 @@ MYSQL_SETTINGS = {"host": host,
                   "user": user,
                   "passwd": passwd,
                   "db": db
-                  }
\ No newline at end of file
+                  }
+
+# Directory where results of database queries are cached.
+CACHE_PATH = ROOT_PATH + "data/cache/"
+
+# Binary file with all matches, written by data_tools/build_database.py.
+STORE_PATH = ROOT_PATH + "data/matches.bin"
+
+# Lookup table of match win probabilities, written by models/match_table.py.
+TABLE_PATH = ROOT_PATH + "data/match_table.npz"
@@ -5,27 +5,22 @@ Setup.py script.
 __author__ = 'riko'
 
 
-from Cython.Build import cythonize
 import numpy
+from Cython.Build import cythonize
+from Cython.Distutils import build_ext
 from setuptools import setup, Extension, find_packages
 
 
-try:
-    use_cython = True
-    from Cython.Distutils import build_ext
-except ImportError:
-    use_cython = False
-
-ext = '.pyx' if use_cython else '.c'
-
-ext_modules = [Extension("calculations", ["models/calculations/calculations"+ext])]
-include_dirs = []
-cmdclass = {}
-if use_cython:
-      print "Doing extensions: ", ext_modules
-      ext_modules = cythonize(ext_modules, include_dirs=[numpy.get_include()])
-      include_dirs=[numpy.get_include()]
-      cmdclass.update({ 'build_ext': build_ext })
+# calculations.c is not kept in the tree, it is always generated from
+# calculations.pyx. force=True regenerates it even if an old .c (e.g. left
+# from an earlier build) looks newer than the .pyx.
+# Batch functions in calculations run in parallel with OpenMP.
+ext_modules = [Extension("calculations", ["models/calculations/calculations.pyx"],
+                         include_dirs=[numpy.get_include()],
+                         extra_compile_args=["-fopenmp"], extra_link_args=["-fopenmp"])]
+ext_modules = cythonize(ext_modules, force=True)
+include_dirs = [numpy.get_include()]
+cmdclass = {'build_ext': build_ext}
 
 print ext_modules
 
@@ -39,5 +34,5 @@ setup(name='TennisModelling',
       py_modules = ['settings'],
       cmdclass=cmdclass,
       ext_modules=ext_modules,
-      include_dirs=[include_dirs, numpy.get_include()]
+      include_dirs=include_dirs
 )
\ No newline at end of file